@@ -9,12 +9,29 @@
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtCore import Qt
+import argparse
+import multiprocessing
 import sys
 
-from src.main import MainApplication
-
 def main() -> None:
-    qapp: QApplication = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="HDWallet Desktop")
+    parser.add_argument("--service", action="store_true", help="run the headless derivation service")
+    parser.add_argument("--socket", default=None, help="socket path of the derivation service")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes of the derivation service")
+    arguments, qt_arguments = parser.parse_known_args()
+
+    # Before anything imports hdwallet, which binds its secp256k1 backend on import
+    from src.backend import select_backend
+    select_backend()
+
+    if arguments.service:
+        from src.service.server import serve
+        serve(arguments.socket, arguments.processes)
+        return
+
+    from src.main import MainApplication
+
+    qapp: QApplication = QApplication(sys.argv[:1] + qt_arguments)
 
     palette = QPalette()
     palette.setColor(QPalette.Active, QPalette.Text, QColor(255, 255, 255))
@@ -28,4 +45,6 @@ def main() -> None:
 
 
 if __name__ == '__main__':
+    # Required by the process pools in frozen (cx_Freeze) builds
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,5 @@
+
+from src.backend import install as install_backend
+
+# Worker processes import this package before hdwallet, so they run on the backend chosen at launch
+install_backend()
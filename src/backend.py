@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+"""
+Selection of the secp256k1 implementation hdwallet runs on.
+
+hdwallet binds its secp256k1 classes to ``SLIP10_SECP256K1_CONST.USE`` when it is
+imported, so the backend is chosen before that: an import hook sets ``USE`` from the
+``HDWALLET_SECP256K1`` environment variable right after ``hdwallet.const`` runs. The
+variable is inherited by worker processes, which then run on the same backend.
+
+This module must not import hdwallet, nor anything that does.
+"""
+
+from importlib.abc import MetaPathFinder
+from importlib.machinery import PathFinder
+from typing import (
+    Callable, Dict, List, Optional
+)
+
+import importlib.util
+import os
+import sys
+import time
+
+# Backends hdwallet supports, in the order they are preferred on a tie
+BACKENDS: List[str] = ["coincurve", "ecdsa"]
+# Environment variable holding the backend, set by select_backend for this and worker processes
+BACKEND_VARIABLE: str = "HDWALLET_SECP256K1"
+# Saved backend override, "auto" or missing benchmarks the available ones
+PREFERENCE_FILEPATH: str = os.path.join(os.path.expanduser("~"), ".hdwallet", "backend")
+
+# Operations per second of every benchmarked backend, filled by select_backend
+benchmarks: Dict[str, float] = {}
+# How the backend of this process was chosen
+reason: str = "hdwallet default"
+
+
+class _ConstFinder(MetaPathFinder):
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != "hdwallet.const":
+            return None
+        spec = PathFinder.find_spec(fullname, path)
+        if spec is None or spec.loader is None:
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def exec_const(module) -> None:
+            exec_module(module)
+            backend = os.environ.get(BACKEND_VARIABLE)
+            if backend in BACKENDS:
+                module.SLIP10_SECP256K1_CONST.USE = backend
+
+        spec.loader.exec_module = exec_const
+        return spec
+
+
+def install() -> None:
+    """
+    Install the import hook applying ``HDWALLET_SECP256K1`` to hdwallet, once per process.
+    """
+    if not any(isinstance(finder, _ConstFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _ConstFinder())
+
+
+def available_backends() -> List[str]:
+    """
+    Get the backends whose library is installed.
+
+    :return: The backend names.
+    """
+    return [backend for backend in BACKENDS if importlib.util.find_spec(backend) is not None]
+
+
+def _operation(backend: str) -> Callable[[bytes], bytes]:
+    # The cost of a BIP32 child: one scalar multiplication and a compressed public key
+    if backend == "coincurve":
+        from coincurve import PublicKey
+
+        return lambda secret: PublicKey.from_secret(secret).format(compressed=True)
+
+    from ecdsa import SECP256k1, SigningKey
+
+    return lambda secret: SigningKey.from_string(secret, curve=SECP256k1).get_verifying_key().to_string("compressed")
+
+
+def benchmark(backend: str, seconds: float = 0.05) -> float:
+    """
+    Measure how fast a backend derives public keys.
+
+    :param backend: The backend name.
+    :param seconds: The time to spend measuring.
+    :return: Public keys per second.
+    """
+    operation = _operation(backend)
+    operation(b"\x01" * 32)
+    count, started = 0, time.perf_counter()
+    while True:
+        operation((count + 1).to_bytes(32, "big"))
+        count += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            return count / elapsed
+
+
+def saved_preference() -> str:
+    """
+    Get the saved backend override.
+
+    :return: A backend name, or ``auto``.
+    """
+    try:
+        with open(PREFERENCE_FILEPATH, "r", encoding="utf-8") as file:
+            preference = file.read().strip()
+    except OSError:
+        return "auto"
+    return preference if preference in BACKENDS else "auto"
+
+
+def save_preference(preference: str) -> None:
+    """
+    Save a backend override, applied from the next start.
+
+    :param preference: A backend name, or ``auto`` to pick the fastest one.
+    """
+    if preference != "auto" and preference not in BACKENDS:
+        raise ValueError(f"Unknown backend {preference}, expected auto or one of {', '.join(BACKENDS)}")
+    os.makedirs(os.path.dirname(PREFERENCE_FILEPATH), exist_ok=True)
+    with open(PREFERENCE_FILEPATH, "w", encoding="utf-8") as file:
+        file.write(f"{preference}\n")
+
+
+def select_backend() -> Optional[str]:
+    """
+    Choose the backend of this process and its workers, before hdwallet is imported.
+
+    ``HDWALLET_SECP256K1`` wins when set, then the saved override, otherwise every
+    available backend is benchmarked and the fastest one is used.
+
+    :return: The chosen backend, or None when none is installed.
+    """
+    global reason
+    install()
+    available = available_backends()
+    if os.environ.get(BACKEND_VARIABLE) in available:
+        reason = f"{BACKEND_VARIABLE} environment variable"
+        return os.environ[BACKEND_VARIABLE]
+
+    preference = saved_preference()
+    if preference in available:
+        reason = "saved override"
+        backend = preference
+    elif available:
+        for name in available:
+            benchmarks[name] = benchmark(name)
+        # Stable on ties, so the preferred order breaks them
+        backend = max(available, key=lambda name: benchmarks[name])
+        reason = "fastest available" if len(available) > 1 else "only available"
+    else:
+        return None
+    os.environ[BACKEND_VARIABLE] = backend
+    return backend
+
+
+def active_backend() -> str:
+    """
+    Get the backend hdwallet runs on in this process, importing hdwallet.
+
+    :return: The backend name.
+    """
+    from hdwallet.const import SLIP10_SECP256K1_CONST
+
+    return SLIP10_SECP256K1_CONST.USE
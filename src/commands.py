@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Callable, Dict, List
+)
+
+import os
+import time
+
+from src import backend as secp256k1
+from src.utils.estimate import format_size
+from src.utils.index import (
+    AddressIndex, index_filepath
+)
+from src.utils.shard import merge_shards
+
+
+def merge(arguments: List[str]) -> str:
+    """
+    Merge the shard outputs of a dump, ``merge <file>``.
+
+    :param arguments: The output file of the whole dump.
+    :return: The result message.
+    """
+    if len(arguments) != 1:
+        return "Usage: merge <file>, merges file.shard-k-of-n outputs into file"
+    filepath = os.path.expanduser(arguments[0])
+    count, size = merge_shards(filepath)
+    return f"Merged {count} shards into {filepath} ({format_size(size)})"
+
+
+def lookup(arguments: List[str]) -> str:
+    """
+    Look up an indexed address or path, ``lookup <address|path>``.
+
+    :param arguments: The address or path.
+    :return: One ``address,path,coin,network,root`` line per entry.
+    """
+    if len(arguments) != 1:
+        return "Usage: lookup <address|path>, finds addresses and paths of dumps saved with Index"
+    elif not os.path.exists(index_filepath()):
+        return f"No index at {index_filepath()}, dump with Index checked first"
+    started = time.perf_counter()
+    with AddressIndex() as index:
+        entries = index.lookup(arguments[0])
+    elapsed = (time.perf_counter() - started) * 1000
+    if not entries:
+        return f"{arguments[0]} is not indexed ({elapsed:.1f}ms)"
+    return "\n".join(
+        [*(",".join(entry) for entry in entries), f"{len(entries)} entries in {elapsed:.1f}ms"]
+    )
+
+
+def backend(arguments: List[str]) -> str:
+    """
+    Show or override the secp256k1 backend, ``backend [use <name|auto>]``.
+
+    :param arguments: Nothing to show the backends, or ``use`` and a backend name or ``auto``.
+    :return: The backends and how fast they are, or the saved override.
+    """
+    if arguments[:1] == ["use"] and len(arguments) == 2:
+        if arguments[1] != "auto" and arguments[1] not in secp256k1.available_backends():
+            return f"ERROR: {arguments[1]} is not installed, available: {', '.join(secp256k1.available_backends())}"
+        secp256k1.save_preference(arguments[1])
+        return f"Saved {arguments[1]} as the secp256k1 backend, restart to apply it"
+    elif arguments:
+        return "Usage: backend [use <name|auto>], shows or overrides the secp256k1 backend"
+
+    lines = [
+        f"Active: {secp256k1.active_backend()} ({secp256k1.reason})",
+        f"Saved: {secp256k1.saved_preference()}"
+    ]
+    for name in secp256k1.available_backends():
+        if name not in secp256k1.benchmarks:
+            secp256k1.benchmarks[name] = secp256k1.benchmark(name)
+        lines.append(f"{name}: {secp256k1.benchmarks[name]:,.0f} public keys/second")
+    for name in secp256k1.BACKENDS:
+        if name not in secp256k1.available_backends():
+            lines.append(f"{name}: not installed")
+    return "\n".join(lines)
+
+
+# Commands handled by the desktop terminal itself instead of the hdwallet CLI
+COMMANDS: Dict[str, Callable[[List[str]], str]] = {
+    "merge": merge,
+    "lookup": lookup,
+    "backend": backend
+}
+
+
+def run_command(commands: List[str]) -> str:
+    """
+    Run a desktop terminal command.
+
+    :param commands: The command name followed by its arguments.
+    :return: The command output, errors are reported as ``ERROR: ...``.
+    """
+    try:
+        return COMMANDS[commands[0]](commands[1:])
+    except Exception as e:
+        return f"ERROR: {e}"
@@ -8,23 +8,27 @@
 
 import inspect
 import functools
+import itertools
+import threading
 import time
 import json
 import os
 import re
 from typing import *
 from collections import OrderedDict
+from contextlib import nullcontext
+from dataclasses import dataclass, replace
 
 from PySide6.QtWidgets import (
-    QPushButton, QFileDialog, QComboBox, QFrame
+    QApplication, QPushButton, QFileDialog, QComboBox, QFrame, QWidget, QLineEdit, QCheckBox, QLabel, QSpinBox, QMenu
 )
-from PySide6.QtCore import QThreadPool
+from PySide6.QtCore import QThreadPool, QTimer, Qt
+from PySide6.QtGui import QCursor
 
 from bip38 import (
     cryptocurrencies, BIP38
 )
 
-from hdwallet import HDWallet
 from hdwallet.hds import HDS
 from hdwallet.const import MODES as ELECTRUM_V2_MODES
 from hdwallet.cryptocurrencies import (
@@ -56,7 +60,6 @@ from hdwallet.seeds import (
     SEEDS
 )
 from hdwallet.derivations import (
-    IDerivation, DERIVATIONS,
     CustomDerivation, BIP44Derivation, BIP49Derivation, BIP84Derivation,
     BIP86Derivation, ElectrumDerivation, CIP1852Derivation, MoneroDerivation, HDWDerivation,
     CHANGES
@@ -73,6 +76,52 @@ from src.utils.worker import (
 from src.utils import (
     update_border_class, clear_borders_class, normalized_mnemonic_types
 )
+from src.utils.derivation import (
+    IndexExpression, derivation_levels, path_count, traverse, derivation_at
+)
+from src.utils.estimate import estimate_dump
+from src.utils.checkpoint import (
+    Checkpoint, fingerprint
+)
+from src.utils.shard import (
+    parse_shard, shard_bounds, shard_filepath
+)
+from src.utils.pool import (
+    chunked, imap_ordered, process_count
+)
+from src.utils.discovery import (
+    load_addresses, discover
+)
+from src.utils.search import (
+    decode_targets, search_paths, initialize as initialize_search
+)
+from src.utils.batch import (
+    include_values, dump_row, dump_roots, derivation_dump, dump_address, csv_row, writes_wif,
+    initialize as initialize_batch
+)
+from src.utils.watch import (
+    lazy_supported, lazy_dump
+)
+from src.utils.sinks import (
+    SINKS, sink_class
+)
+from src.utils.encrypt import (
+    bip38_processes, read_wifs, convert_wifs
+)
+from src.utils.convert import (
+    KEY_SOURCES, read_keys, convert_keys
+)
+from src.utils.index import (
+    AddressIndex, index_filepath, root_fingerprint
+)
+from src.utils.compression import (
+    COMPRESSIONS, CompressedFile, compressed_filepath
+)
+from src.widgets.qr_codes import QRCodes
+from src.widgets.confirm import Confirm
+from src.utils.cache import (
+    RootCache, RootRecipe
+)
 
 
 class Dumps:
@@ -87,7 +136,8 @@ class Dumps:
         self.errboxes = [
             self.ui.dumpsStackQGroupBox,
             self.ui.derivationQGroupBox,
-            self.ui.dumpsFormatKeysContainerQGroupBox
+            self.ui.dumpsFormatKeysContainerQGroupBox,
+            self.ui.dumpsToolsContainerQGroupBox
         ]
 
         self.ui.dumpsSaveAndGenerateQPushButton.clicked.connect(
@@ -95,6 +145,94 @@ class Dumps:
         )
         self.ui.dumpsGenerateQPushButton.clicked.connect(self._dumps)
 
+        # Number of derived rows buffered before they are written out
+        self.dump_chunk_size = 256
+        # Rows SQLite, Arrow and Parquet exports write at once, i.e. their row group size
+        self.row_group_size = 65536
+
+        # Dumps are estimated before they start, longer ones ask for confirmation
+        self.calibration_rows = 8
+        self.confirm_seconds = 60
+        self.estimate_jobs = set()
+        self.terminal_lines = self.ui.outputTerminalQPlainTextEdit.maximumBlockCount()
+        self.ui.dumpsEstimateQLabel = QLabel(self.ui.dumpsFormatKeysContainerQGroupBox)
+        self.ui.dumpsEstimateQLabel.setObjectName("dumpsEstimateQLabel")
+        self.ui.dumpsFormatKeysContainerQGroupBoxHLayout.insertWidget(
+            self.ui.dumpsFormatKeysContainerQGroupBoxHLayout.indexOf(self.ui.dumpsGenerateQPushButton),
+            self.ui.dumpsEstimateQLabel, 0, Qt.AlignBottom
+        )
+
+        # Splits the paths of a dump into contiguous blocks, one per node
+        self.ui.dumpsShardQLineEdit = QLineEdit(self.ui.dumpsOptionsQFrame)
+        self.ui.dumpsShardQLineEdit.setObjectName("dumpsShardQLineEdit")
+        self.ui.dumpsShardQLineEdit.setPlaceholderText("Shard, eg. 1 of 4")
+        self.ui.dumpsShardQLineEdit.setToolTip(
+            "Dump only the k-th of n equal parts of the paths, saved to name.shard-k-of-n, "
+            "combine the parts with the merge command"
+        )
+        self.ui.dumpsShardQLineEdit.setMaximumWidth(120)
+        self.ui.dumpsOptionsQFrameHLayout.insertWidget(
+            self.ui.dumpsOptionsQFrameHLayout.indexOf(self.ui.dumpsOptionsQFrameHSpacer),
+            self.ui.dumpsShardQLineEdit
+        )
+
+        # Saved JSON and CSV dumps can be compressed on a writer thread while deriving
+        self.ui.dumpsCompressionQComboBox = QComboBox(self.ui.dumpsOptionsQFrame)
+        self.ui.dumpsCompressionQComboBox.setObjectName("dumpsCompressionQComboBox")
+        self.ui.dumpsCompressionQComboBox.addItems(["Uncompressed", *COMPRESSIONS])
+        self.ui.dumpsCompressionQComboBox.setToolTip("Compress saved dumps, zstd only when zstandard is installed")
+        self.ui.dumpsCompressionLevelQSpinBox = QSpinBox(self.ui.dumpsOptionsQFrame)
+        self.ui.dumpsCompressionLevelQSpinBox.setObjectName("dumpsCompressionLevelQSpinBox")
+        self.ui.dumpsCompressionLevelQSpinBox.setToolTip("Compression level, higher is smaller and slower")
+        for widget in (self.ui.dumpsCompressionQComboBox, self.ui.dumpsCompressionLevelQSpinBox):
+            self.ui.dumpsOptionsQFrameHLayout.insertWidget(
+                self.ui.dumpsOptionsQFrameHLayout.indexOf(self.ui.dumpsShardQLineEdit), widget
+            )
+        self.ui.dumpsCompressionQComboBox.currentTextChanged.connect(self._dump_compression_changed)
+        self._dump_compression_changed(self.ui.dumpsCompressionQComboBox.currentText())
+
+        # Records the address and path of every dumped row, answered later by the lookup command
+        self.ui.dumpsIndexQCheckBox = QCheckBox("Index", self.ui.dumpsOptionsQFrame)
+        self.ui.dumpsIndexQCheckBox.setObjectName("dumpsIndexQCheckBox")
+        self.ui.dumpsIndexQCheckBox.setToolTip(
+            f"Add the dumped addresses and paths to {index_filepath()}, look them up with lookup <address|path>"
+        )
+        self.ui.dumpsOptionsQFrameHLayout.insertWidget(
+            self.ui.dumpsOptionsQFrameHLayout.indexOf(self.ui.dumpsShardQLineEdit), self.ui.dumpsIndexQCheckBox
+        )
+
+        # Roots built by previous dumps, so changing only the derivation or
+        # format does not rerun the seed stretching
+        self.root_cache = RootCache(ttl=300)
+        self.root_cache_timer = QTimer(self.app)
+        self.root_cache_timer.timeout.connect(self.root_cache.expire)
+        self.root_cache_timer.start(30 * 1000)
+        self.app.destroyed.connect(self.root_cache.clear)
+
+        # QR codes of the first page of addresses of the last dump
+        self.qr_page_size = 12
+        self.qr_addresses = []
+        self.ui.dumpsQRCodesQPushButton = QPushButton("QR", self.ui.dumpsOptionsQFrame)
+        self.ui.dumpsQRCodesQPushButton.setObjectName("dumpsQRCodesQPushButton")
+        self.ui.dumpsQRCodesQPushButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.ui.dumpsQRCodesQPushButton.setToolTip("Show the QR codes of the dumped addresses")
+        self.ui.dumpsQRCodesQPushButton.setEnabled(False)
+        self.ui.dumpsOptionsQFrameHLayout.insertWidget(
+            self.ui.dumpsOptionsQFrameHLayout.indexOf(self.ui.dumpsOptionsQFrameHSpacer),
+            self.ui.dumpsQRCodesQPushButton
+        )
+        self.ui.dumpsQRCodesQPushButton.clicked.connect(
+            lambda: QRCodes.show_qr_codes_modal(
+                main_window=self.app.window(), parent_frame=self.ui.hdWalletContainerQFrame,
+                addresses=self.qr_addresses
+            )
+        )
+
+        # Inputs a batch dump fills with the roots of its file
+        self.root_rules = {
+            "Entropy", "Mnemonic", "Seed", "Private Key", "Public Key", "WIF",
+            "XPrivate Key", "XPublic Key", "XPublic", "Spend Private Key"
+        }
         self.validation_rules = {
             "Entropy": {
                 "min_length": 32,
@@ -263,10 +401,141 @@ class Dumps:
             data["button"].clicked.connect(
                 functools.partial(self.derivation_tab_changed, data["widget"], data["button"]))
 
-        self._update_terminal_state(False, False)
-        self.ui.stopTerminalQPushButton.clicked.connect(
-            lambda: self._update_terminal_state(False, True)
+        # Running dump workers mapped to their cancellation events
+        self.running_dumps = {}
+        self._update_terminal_state()
+        self.ui.stopTerminalQPushButton.clicked.connect(self._stop_dumps)
+        # Stopped dumps leave a checkpoint behind, so quitting stops them and waits for it
+        QApplication.instance().aboutToQuit.connect(self._quit_dumps)
+
+        self.ui.dumpsResumeQPushButton = QPushButton("Resume", self.ui.dumpsToolsQFrame)
+        self.ui.dumpsResumeQPushButton.setObjectName("dumpsResumeQPushButton")
+        self.ui.dumpsResumeQPushButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.ui.dumpsResumeQPushButton.setToolTip("Continue a stopped dump from its checkpoint, appending to its file")
+        self.ui.dumpsToolsQFrameHLayout.insertWidget(
+            self.ui.dumpsToolsQFrameHLayout.indexOf(self.ui.dumpsToolsQFrameHSpacer),
+            self.ui.dumpsResumeQPushButton
+        )
+        self.ui.dumpsResumeQPushButton.clicked.connect(
+            lambda: self._dumps(save=True, resume=True)
+        )
+
+        # Runs the configured derivation for every root of a file, one root per line
+        self.ui.dumpsBatchQPushButton = QPushButton("Batch", self.ui.dumpsToolsQFrame)
+        self.ui.dumpsBatchQPushButton.setObjectName("dumpsBatchQPushButton")
+        self.ui.dumpsBatchQPushButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.ui.dumpsBatchQPushButton.setToolTip(
+            "Dump every root of a file, one per line in place of the selected From input, "
+            "rows are tagged with the line number and fingerprint of their root"
         )
+        self.ui.dumpsToolsQFrameHLayout.insertWidget(
+            self.ui.dumpsToolsQFrameHLayout.indexOf(self.ui.dumpsToolsQFrameHSpacer),
+            self.ui.dumpsBatchQPushButton
+        )
+        self.ui.dumpsBatchQPushButton.clicked.connect(self._dumps_batch)
+
+        # Converts every key of a file, one per line in place of the selected WIF, private or public key
+        self.ui.dumpsConvertQPushButton = QPushButton("Convert", self.ui.dumpsToolsQFrame)
+        self.ui.dumpsConvertQPushButton.setObjectName("dumpsConvertQPushButton")
+        self.ui.dumpsConvertQPushButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.ui.dumpsConvertQPushButton.setToolTip(
+            "Dump the addresses of every key of a file, one per line in place of the selected WIF, "
+            "private or public key, rows start with the line number of their key"
+        )
+        self.ui.dumpsToolsQFrameHLayout.insertWidget(
+            self.ui.dumpsToolsQFrameHLayout.indexOf(self.ui.dumpsToolsQFrameHSpacer),
+            self.ui.dumpsConvertQPushButton
+        )
+        self.ui.dumpsConvertQPushButton.clicked.connect(self._dumps_convert)
+
+        # Extra coins dumped along with the selected one, from a seed computed once
+        self.fanout_coins = set()
+        self.ui.dumpsCoinsQPushButton = QPushButton("Coins", self.ui.dumpsToolsQFrame)
+        self.ui.dumpsCoinsQPushButton.setObjectName("dumpsCoinsQPushButton")
+        self.ui.dumpsCoinsQPushButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.ui.dumpsCoinsQPushButton.setToolTip(
+            "Also dump these coins with the same root and derivation, "
+            "rows are tagged with their coin and network"
+        )
+        self.ui.dumpsCoinsQMenu = QMenu(self.ui.dumpsCoinsQPushButton)
+        self.ui.dumpsCoinsQMenu.setStyleSheet("QMenu { menu-scrollable: 1; }")
+        self.ui.dumpsCoinsQMenu.aboutToShow.connect(self._fill_coins_menu)
+        self.ui.dumpsCoinsQMenu.triggered.connect(self._coin_toggled)
+        self.ui.dumpsCoinsQPushButton.setMenu(self.ui.dumpsCoinsQMenu)
+        self.ui.dumpsToolsQFrameHLayout.insertWidget(
+            self.ui.dumpsToolsQFrameHLayout.indexOf(self.ui.dumpsToolsQFrameHSpacer),
+            self.ui.dumpsCoinsQPushButton
+        )
+        for combo in (self.ui.dumpsCryptocurrencyQComboBox, self.ui.dumpsHdQComboBox, self.ui.dumpsNetworkQComboBox):
+            combo.currentIndexChanged.connect(self._update_coins_button)
+
+        # Scans the account chains of a BIP44 style derivation against a set of used addresses
+        self.ui.dumpsGapLimitQSpinBox = QSpinBox(self.ui.dumpsToolsQFrame)
+        self.ui.dumpsGapLimitQSpinBox.setObjectName("dumpsGapLimitQSpinBox")
+        self.ui.dumpsGapLimitQSpinBox.setPrefix("Gap ")
+        self.ui.dumpsGapLimitQSpinBox.setRange(1, 100000)
+        self.ui.dumpsGapLimitQSpinBox.setValue(20)
+        self.ui.dumpsGapLimitQSpinBox.setToolTip("Consecutive unused addresses that end a chain when discovering")
+        self.ui.dumpsDiscoverQPushButton = QPushButton("Discover", self.ui.dumpsToolsQFrame)
+        self.ui.dumpsDiscoverQPushButton.setObjectName("dumpsDiscoverQPushButton")
+        self.ui.dumpsDiscoverQPushButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.ui.dumpsDiscoverQPushButton.setToolTip(
+            "Find which addresses of the accounts appear in a file of used addresses, "
+            "scanning the external and internal chains up to the gap limit"
+        )
+        for widget in (self.ui.dumpsGapLimitQSpinBox, self.ui.dumpsDiscoverQPushButton):
+            self.ui.dumpsToolsQFrameHLayout.insertWidget(
+                self.ui.dumpsToolsQFrameHLayout.indexOf(self.ui.dumpsToolsQFrameHSpacer), widget
+            )
+        self.ui.dumpsDiscoverQPushButton.clicked.connect(self._dumps_discover)
+
+        # Searches the derivation ranges for the paths of known addresses
+        self.ui.dumpsSearchQLineEdit = QLineEdit(self.ui.dumpsSearchQFrame)
+        self.ui.dumpsSearchQLineEdit.setObjectName("dumpsSearchQLineEdit")
+        self.ui.dumpsSearchQLineEdit.setPlaceholderText("Target addresses")
+        self.ui.dumpsSearchQLineEdit.setToolTip(
+            "Comma or space separated addresses, P2PKH, P2SH-P2WPKH, P2WPKH and P2TR ones are "
+            "matched by hash, others by address"
+        )
+        self.ui.dumpsSearchQPushButton = QPushButton("Search", self.ui.dumpsSearchQFrame)
+        self.ui.dumpsSearchQPushButton.setObjectName("dumpsSearchQPushButton")
+        self.ui.dumpsSearchQPushButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.ui.dumpsSearchQPushButton.setToolTip(
+            "Find the paths of the target addresses in the derivation ranges, on every core, "
+            "stopping once all of them are found"
+        )
+        self.ui.dumpsSearchQFrameHLayout.addWidget(self.ui.dumpsSearchQLineEdit)
+        self.ui.dumpsSearchQFrameHLayout.addWidget(self.ui.dumpsSearchQPushButton)
+        self.ui.dumpsSearchQPushButton.clicked.connect(self._dumps_search)
+
+        # BIP38 runs scrypt for every key, so files of keys and encrypted exports go through a process pool
+        self.bip38_chunk_size = 4
+        self.ui.dumpsBIP38QLineEdit = QLineEdit(self.ui.dumpsBIP38QFrame)
+        self.ui.dumpsBIP38QLineEdit.setObjectName("dumpsBIP38QLineEdit")
+        self.ui.dumpsBIP38QLineEdit.setPlaceholderText("BIP38 passphrase")
+        self.ui.dumpsBIP38QLineEdit.setEchoMode(QLineEdit.EchoMode.Password)
+        self.ui.dumpsBIP38QLineEdit.setToolTip(
+            "Passphrase of the BIP38 tools and encrypted exports, lines of a WIF file may carry their own"
+        )
+        self.ui.dumpsBIP38QCheckBox = QCheckBox("Encrypt WIF", self.ui.dumpsBIP38QFrame)
+        self.ui.dumpsBIP38QCheckBox.setObjectName("dumpsBIP38QCheckBox")
+        self.ui.dumpsBIP38QCheckBox.setToolTip("Encrypt the WIF of every dumped row with BIP38")
+        self.ui.dumpsBIP38QPushButton = QPushButton("BIP38", self.ui.dumpsBIP38QFrame)
+        self.ui.dumpsBIP38QPushButton.setObjectName("dumpsBIP38QPushButton")
+        self.ui.dumpsBIP38QPushButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.ui.dumpsBIP38QPushButton.setToolTip(
+            "Encrypt or decrypt a file of WIFs, one per line as wif or wif,passphrase"
+        )
+        self.ui.dumpsBIP38QMenu = QMenu(self.ui.dumpsBIP38QPushButton)
+        self.ui.dumpsBIP38QMenu.addAction("Encrypt WIF file").triggered.connect(
+            functools.partial(self._dumps_bip38, "encrypt")
+        )
+        self.ui.dumpsBIP38QMenu.addAction("Decrypt WIF file").triggered.connect(
+            functools.partial(self._dumps_bip38, "decrypt")
+        )
+        self.ui.dumpsBIP38QPushButton.setMenu(self.ui.dumpsBIP38QMenu)
+        for widget in (self.ui.dumpsBIP38QLineEdit, self.ui.dumpsBIP38QCheckBox, self.ui.dumpsBIP38QPushButton):
+            self.ui.dumpsBIP38QFrameHLayout.addWidget(widget)
 
         self.bips_sematic_combos = [
             self.ui.bipFromEntropySemanticsQComboBox,
@@ -345,6 +614,8 @@ class Dumps:
         self.ui.hdwEccQFrame.setEnabled(False)
 
         self.ui.dumpsExcludeOrIncludeQLabel.setText("Exclude")
+        # Table formats, Arrow and Parquet only when pyarrow is installed
+        self.ui.dumpsFormatQComboBox.addItems(list(SINKS))
         self.ui.dumpsFormatQComboBox.currentTextChanged.connect(self._dump_format_changed)
 
         self.ui.dumpsHdQComboBox.currentIndexChanged.connect(self._dump_hd_changed)
@@ -521,6 +792,43 @@ class Dumps:
         self.ui.bipFromXPrivateKeyStrictQCheckBox.setChecked(True)
         self.ui.bipFromXPublicKeyStrictQCheckBox.setChecked(True)
 
+        self._setup_preview()
+
+    def _setup_preview(self):
+        # First addresses of the form, derived off the GUI thread once typing pauses
+        self.preview_rows = 3
+        self.preview_generation = 0
+        self.preview_jobs = set()
+        self.preview_cancelled = threading.Event()
+        # One preview at a time, stale ones still queued are taken back before they run
+        self.preview_pool = QThreadPool(self.app)
+        self.preview_pool.setMaxThreadCount(1)
+        QApplication.instance().aboutToQuit.connect(self.preview_pool.clear)
+        self.preview_timer = QTimer(self.app)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(250)
+        self.preview_timer.timeout.connect(self._preview)
+
+        self.ui.dumpsPreviewQLabel = QLabel(self.ui.dumpsStackQGroupBox)
+        self.ui.dumpsPreviewQLabel.setObjectName("dumpsPreviewQLabel")
+        self.ui.dumpsPreviewQLabel.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.ui.dumpsPreviewQLabel.setToolTip(f"The first {self.preview_rows} addresses of the inputs above")
+        self.ui.dumpsStackQGroupBoxVLayout.addWidget(self.ui.dumpsPreviewQLabel)
+
+        for stack in (self.ui.hdQStackedWidget, self.ui.derivationsQStackedWidget):
+            stack.currentChanged.connect(self._schedule_preview)
+            for widget in stack.findChildren(QLineEdit):
+                widget.textChanged.connect(self._schedule_preview)
+            for widget in stack.findChildren(QComboBox):
+                widget.currentIndexChanged.connect(self._schedule_preview)
+            for widget in stack.findChildren(QCheckBox):
+                widget.toggled.connect(self._schedule_preview)
+        for combo in (
+            self.ui.dumpsCryptocurrencyQComboBox, self.ui.dumpsHdQComboBox,
+            self.ui.dumpsFromQComboBox, self.ui.dumpsNetworkQComboBox
+        ):
+            combo.currentIndexChanged.connect(self._schedule_preview)
+
     def __pair_ca_address_type(self, c_addr, c_list, cd_addr, idx):
         if c_list.currentText().lower().startswith("shelley"):
             c_addr.setEnabled(True)
@@ -545,6 +853,8 @@ class Dumps:
         options |= QFileDialog.DontConfirmOverwrite
         if format == 'JSON':  save_as = 'JSON Files (*.json)'
         elif format == 'CSV': save_as = 'CSV Files (*.csv)'
+        else: save_as = SINKS[format].description
+        save_as = self.__compressed_filter(format, save_as)
         home_dir = os.path.expanduser("~")
         filename, _ = QFileDialog.getSaveFileName(
             None,
@@ -556,198 +866,723 @@ class Dumps:
 
         return filename
 
-    def _dumps(self, save=False):
-        save_filepath = None
+    def _checkpoint_locator(self, format):
+        if format == 'JSON':  open_as = 'JSON Files (*.json)'
+        elif format == 'CSV': open_as = 'CSV Files (*.csv)'
+        open_as = self.__compressed_filter(format, open_as)
+        filename, _ = QFileDialog.getOpenFileName(
+            None,
+            'Resume File',
+            os.path.expanduser("~"),
+            open_as
+        )
+
+        return filename
+
+    def __compressed_filter(self, format, name_filter):
+        compression = COMPRESSIONS.get(self.ui.dumpsCompressionQComboBox.currentText())
+        if compression is None or format in SINKS:
+            return name_filter
+        return re.sub(r"\*(\.\w+)", rf"*\1{compression.extension}", name_filter)
+
+    def __fanout_candidates(self):
+        # Coins sharing the selected HD and network, BIP32 style HDs are the only multi-coin ones
+        hd = self.ui.dumpsHdQComboBox.currentText()
+        network = self.ui.dumpsNetworkQComboBox.currentText().lower()
+        if hd not in ('BIP32', 'BIP44', 'BIP49', 'BIP84', 'BIP86', 'BIP141'):
+            return []
+        return [
+            name for name in CRYPTOCURRENCIES.names()
+            if name != self.ui.dumpsCryptocurrencyQComboBox.currentText() and
+            hd in CRYPTOCURRENCIES.cryptocurrency(name).HDS.get_hds() and
+            network in CRYPTOCURRENCIES.cryptocurrency(name).NETWORKS.get_networks()
+        ]
+
+    def _fill_coins_menu(self):
+        self.ui.dumpsCoinsQMenu.clear()
+        for name in self.__fanout_candidates():
+            action = self.ui.dumpsCoinsQMenu.addAction(name)
+            action.setCheckable(True)
+            action.setChecked(name in self.fanout_coins)
+
+    def _coin_toggled(self, action):
+        if action.isChecked():
+            self.fanout_coins.add(action.text())
+        else:
+            self.fanout_coins.discard(action.text())
+        self._update_coins_button()
+
+    def _update_coins_button(self):
+        # Coins the current HD or network does not support are dropped
+        candidates = self.__fanout_candidates()
+        self.fanout_coins &= set(candidates)
+        self.ui.dumpsCoinsQPushButton.setEnabled(bool(candidates))
+        self.ui.dumpsCoinsQPushButton.setText(
+            f"Coins (+{len(self.fanout_coins)})" if self.fanout_coins else "Coins"
+        )
+
+    def _roots_locator(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            None,
+            'Open Roots',
+            os.path.expanduser("~"),
+            'Text Files (*.txt);;All Files (*)'
+        )
+
+        return filename
+
+    def _keys_locator(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            None,
+            'Open Keys',
+            os.path.expanduser("~"),
+            'Text Files (*.txt *.csv);;All Files (*)'
+        )
+
+        return filename
+
+    def _addresses_locator(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            None,
+            'Open Used Addresses',
+            os.path.expanduser("~"),
+            'Text Files (*.txt *.csv);;All Files (*)'
+        )
+
+        return filename
+
+    def _dumps_discover(self):
         clear_borders_class(self.errboxes)
-        self.error_occurred = False
 
-        def _error(e):
-            self.app.println(f"ERROR: {e}")
-            self.error_occurred = True
-            
-            if isinstance(e, DerivationError):  
-                update_border_class(self.ui.derivationQGroupBox, "hdwError")
-            elif isinstance(e, ExportFormatError):  
-                update_border_class(self.ui.dumpsFormatKeysContainerQGroupBox, "hdwError")
+        dump_job = self._dump_job()
+        if dump_job.derivation not in ("BIP44", "BIP49", "BIP84", "BIP86"):
+            self._dump_error(DerivationError("Discovery needs a BIP44, BIP49, BIP84 or BIP86 derivation"))
+            return None
+        elif dump_job.coins:
+            self._dump_error(Error("Discovery scans the selected coin only, clear the extra coins"))
+            return None
+
+        addresses_filepath = self._addresses_locator()
+        if addresses_filepath == '':
+            return None
+
+        self._start_dump(replace(
+            dump_job, mode="discover", addresses_filepath=addresses_filepath,
+            gap_limit=self.ui.dumpsGapLimitQSpinBox.value()
+        ))
+
+    def _dumps_search(self):
+        clear_borders_class(self.errboxes)
+
+        dump_job = self._dump_job()
+        targets = tuple(
+            target for target in re.split(r"[\s,]+", self.ui.dumpsSearchQLineEdit.text()) if target
+        )
+        if not targets:
+            self._dump_error(Error("Enter the target addresses to search for"))
+            return None
+        elif not self.ui.derivationQGroupBox.isEnabled():
+            self._dump_error(DerivationError("Searching needs a derivation"))
+            return None
+        elif self.ui.dumpsFromQComboBox.currentText().lower() == "watch only":
+            self._dump_error(Error("Watch only roots cannot be searched"))
+            return None
+        elif dump_job.coins:
+            self._dump_error(Error("Searching covers the selected coin only, clear the extra coins"))
+            return None
+
+        self._start_dump(replace(dump_job, mode="search", targets=targets))
+
+    def _wifs_locator(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            None,
+            'Open WIFs',
+            os.path.expanduser("~"),
+            'Text Files (*.txt *.csv);;All Files (*)'
+        )
+
+        return filename
+
+    def _dumps_bip38(self, mode, checked=False):
+        clear_borders_class(self.errboxes)
+
+        if self.ui.dumpsCoinsQPushButton.isEnabled() and self.fanout_coins:
+            self._dump_error(Error("WIF files are of the selected coin only, clear the extra coins"))
+            return None
+
+        wifs_filepath = self._wifs_locator()
+        if wifs_filepath == '':
+            return None
+        save_filepath = self._file_locator("CSV")
+        if save_filepath == '':
+            return None
+
+        self._start_dump(replace(
+            self._dump_job(save_filepath), mode="bip38", wifs_filepath=wifs_filepath, bip38_mode=mode,
+            bip38_passphrase=self.ui.dumpsBIP38QLineEdit.text()
+        ))
+
+    def _dumps_batch(self):
+        clear_borders_class(self.errboxes)
+        dformat = self.ui.dumpsFormatQComboBox.currentText()
+
+        if dformat in SINKS:
+            self._dump_error(ExportFormatError("Batch dumps are saved as JSON or CSV"))
+            return None
+        elif not self.ui.derivationQGroupBox.isEnabled():
+            self._dump_error(DerivationError("Batch dumps need a derivation"))
+            return None
+        elif self.ui.dumpsFromQComboBox.currentText().lower() == "watch only":
+            self._dump_error(Error("Watch only roots take two keys and cannot be batched"))
+            return None
+        elif self.ui.dumpsCoinsQPushButton.isEnabled() and self.fanout_coins:
+            self._dump_error(Error("Batch dumps are of the selected coin only, clear the extra coins"))
+            return None
+
+        roots_filepath = self._roots_locator()
+        if roots_filepath == '':
+            return None
+        save_filepath = self._file_locator(dformat)
+        if save_filepath == '':
+            return None
+        save_filepath = compressed_filepath(
+            save_filepath, COMPRESSIONS.get(self.ui.dumpsCompressionQComboBox.currentText())
+        )
+
+        self._start_dump(replace(self._dump_job(save_filepath), mode="batch", roots_filepath=roots_filepath))
+
+    def _dumps_convert(self):
+        clear_borders_class(self.errboxes)
+        dformat = self.ui.dumpsFormatQComboBox.currentText()
+        dump_job = self._dump_job()
+
+        if dump_job.dump_from not in KEY_SOURCES:
+            self._dump_error(Error("Converting needs a WIF, private key or public key From input"))
+            return None
+        elif dump_job.derivation is not None:
+            self._dump_error(DerivationError("Keys are converted without a derivation"))
+            return None
+        elif dformat in SINKS:
+            self._dump_error(ExportFormatError("Converted keys are saved as JSON or CSV"))
+            return None
+        elif dump_job.dump_from == "wif" and any(
+            checked for name, _, checked, _ in dump_job.inputs if name.endswith("BIP38PassphraseQCheckBox")
+        ):
+            self._dump_error(Error("Decrypt the WIF file with the BIP38 tool first, then convert it"))
+            return None
+        elif dump_job.coins:
+            self._dump_error(Error("Keys are converted for the selected coin only, clear the extra coins"))
+            return None
+
+        keys_filepath = self._keys_locator()
+        if keys_filepath == '':
+            return None
+        save_filepath = self._file_locator(dformat)
+        if save_filepath == '':
+            return None
+        save_filepath = compressed_filepath(
+            save_filepath, COMPRESSIONS.get(self.ui.dumpsCompressionQComboBox.currentText())
+        )
+
+        self._start_dump(replace(
+            dump_job, mode="convert", save_filepath=save_filepath, keys_filepath=keys_filepath
+        ))
+
+    def _dumps(self, save=False, resume=False):
+        clear_borders_class(self.errboxes)
+
+        try:
+            shard = parse_shard(self.ui.dumpsShardQLineEdit.text())
+        except ValueError as e:
+            self._dump_error(ExportFormatError(str(e)))
+            return None
+
+        save_filepath = None
+        if resume and self.ui.dumpsFormatQComboBox.currentText() in SINKS:
+            self._dump_error(ExportFormatError("Only JSON and CSV dumps can be resumed"))
+            return None
+        elif resume:
+            save_filepath = self._checkpoint_locator(self.ui.dumpsFormatQComboBox.currentText())
+            if save_filepath == '':
+                return None
+        elif save:
+            save_filepath = self._file_locator(self.ui.dumpsFormatQComboBox.currentText())
+            if save_filepath == '':
+                return None
+            if self.ui.dumpsFormatQComboBox.currentText() not in SINKS:
+                save_filepath = compressed_filepath(
+                    save_filepath, COMPRESSIONS.get(self.ui.dumpsCompressionQComboBox.currentText())
+                )
+            save_filepath = shard_filepath(save_filepath, shard)
+
+        # Everything the worker needs is captured here, on the GUI thread, so the
+        # form can be edited and more dumps started while this one runs
+        dump_job = self._dump_job(save_filepath, resume, shard)
+        if dump_job.coins:
+            dump_job = replace(dump_job, mode="fanout")
+        elif dump_job.bip38_passphrase is not None:
+            dump_job = replace(dump_job, mode="encrypted")
+
+        if dump_job.mode == "encrypted":
+            if dump_job.derivation is None:
+                self._dump_error(DerivationError("Encrypting WIFs needs a derivation"))
+            elif dump_job.format in SINKS or resume or shard is not None:
+                self._dump_error(ExportFormatError("Encrypted WIFs are dumped to JSON or CSV, without shards or resuming"))
             else:
-                update_border_class(self.ui.dumpsStackQGroupBox, "hdwError")
+                self._start_dump(dump_job)
+            return None
 
-        def _task_ended(): 
-            self.ui.dumpsGenerateQPushButton.setEnabled(True)
-            self._update_terminal_state(False, False)
+        if dump_job.mode == "fanout":
+            if dump_job.derivation is None:
+                self._dump_error(DerivationError("Dumping several coins needs a derivation"))
+                return None
+            elif dump_job.format in SINKS or resume or shard is not None:
+                self._dump_error(ExportFormatError("Several coins are dumped to JSON or CSV, without shards or resuming"))
+                return None
+
+        def _estimated(estimate):
+            self.estimate_jobs.discard(job)
+            if dump_job.mode == "fanout":
+                # Every coin dumps the same paths, spread over the batch worker processes
+                estimate = estimate.times(len(dump_job.coins), process_count())
+            self.ui.dumpsEstimateQLabel.setText(estimate.label())
+            self.ui.dumpsEstimateQLabel.setToolTip(estimate.summary())
+
+            if estimate.seconds < self.confirm_seconds:
+                self._start_dump(dump_job)
+            else:
+                Confirm.show_confirm_modal(
+                    main_window=self.app.window(),
+                    parent_frame=self.ui.hdWalletContainerQFrame,
+                    title="Long running dump",
+                    message=estimate.summary(),
+                    on_confirm=lambda: self._start_dump(dump_job)
+                )
+
+        def _error(e):
+            self.estimate_jobs.discard(job)
+            self._dump_error(e)
+
+        # Counting and calibrating builds the root, which the dump then takes from the cache
+        job = Worker(self.__estimate, job=dump_job)
+        job.signals.interval_finished.connect(_estimated)
+        job.signals.interval_error.connect(_error)
+        self.estimate_jobs.add(job)
+
+        QThreadPool.globalInstance().start(job)
+
+    def _schedule_preview(self, *args):
+        # Previews of the previous inputs are stale, the running one stops at its next address
+        self.preview_generation += 1
+        self.preview_cancelled.set()
+        for job in list(self.preview_jobs):
+            if self.preview_pool.tryTake(job):
+                self.preview_jobs.discard(job)
+        self.preview_timer.start()
 
-            if save and not self.error_occurred:
-                save_filepath = self._file_locator(self.ui.dumpsFormatQComboBox.currentText())
-                if save_filepath == '':
-                    return None 
+    def _preview(self):
+        generation = self.preview_generation
+        self.preview_cancelled = cancelled = threading.Event()
 
-        self.ui.dumpsGenerateQPushButton.setEnabled(False)
+        def _ended(job):
+            self.preview_jobs.discard(job)
+
+        def _previewed(rows):
+            if generation == self.preview_generation and rows is not None:
+                self.ui.dumpsPreviewQLabel.setText("\n".join(
+                    f"{path}  {address or '-'}" if path else address or "-" for path, address in rows
+                ))
+
+        def _error(e):
+            if generation == self.preview_generation:
+                self.ui.dumpsPreviewQLabel.setText(f"No preview: {e}")
+
+        job = Worker(self.__preview, job=self._dump_job(), cancelled=cancelled)
+        # Kept until it ends, a stale preview may still be running when the next one starts
+        job.setAutoDelete(False)
+        job.signals.interval_finished.connect(_previewed)
+        job.signals.interval_error.connect(_error)
+        job.signals.interval_finished.connect(lambda _: _ended(job))
+        job.signals.interval_error.connect(lambda _: _ended(job))
+        self.preview_jobs.add(job)
+
+        self.preview_pool.start(job)
+
+    def _dump_error(self, e):
+        self.app.println(f"ERROR: {e}")
+
+        if isinstance(e, DerivationError):
+            update_border_class(self.ui.derivationQGroupBox, "hdwError")
+        elif isinstance(e, ExportFormatError):
+            update_border_class(self.ui.dumpsFormatKeysContainerQGroupBox, "hdwError")
+        else:
+            update_border_class(self.ui.dumpsStackQGroupBox, "hdwError")
+
+    def _start_dump(self, dump_job):
+        cancelled = threading.Event()
+        qr_addresses = []
+
+        def _task_ended(): 
+            self.running_dumps.pop(job, None)
+            self._update_terminal_state()
+
+            if qr_addresses:
+                self.qr_addresses = qr_addresses
+                self.ui.dumpsQRCodesQPushButton.setEnabled(True)
 
         mysignals = WorkerSignals()
-        job = Worker(self.__dumps, signal=mysignals, save_filepath=save_filepath)
+        function = {
+            "dump": self.__dumps,
+            "encrypted": self.__dumps_encrypted,
+            "fanout": self.__dumps_fanout,
+            "batch": self.__dumps_batch,
+            "convert": self.__dumps_convert,
+            "discover": self.__dumps_discover,
+            "search": self.__dumps_search,
+            "bip38": self.__dumps_bip38
+        }[dump_job.mode]
+        if dump_job.index and dump_job.mode not in ("dump", "encrypted", "fanout", "batch"):
+            # Converted keys, discovered and found addresses and BIP38 files are not derivation dumps
+            self.app.println("Index: only derivation dumps are indexed, this dump is not")
+        job = Worker(function, signal=mysignals, job=dump_job, cancelled=cancelled, qr_addresses=qr_addresses)
         job.signals = mysignals
 
         job.signals.interval_output.connect(self.app.println)
 
-        job.signals.interval_error.connect(_error)
+        job.signals.interval_error.connect(self._dump_error)
         job.signals.interval_finished.connect(self.app.println)
         job.signals.interval_error.connect(_task_ended)
         job.signals.interval_finished.connect(_task_ended)
 
-        self._update_terminal_state(True, False)
+        self.running_dumps[job] = cancelled
+        self._update_terminal_state()
 
         QThreadPool.globalInstance().start(job)
 
-    def __dumps(self, signal, save_filepath):
-        current_hd = self.ui.dumpsHdQComboBox.currentText()
-        dump_from = self.ui.dumpsFromQComboBox.currentText().lower()
-        network = self.ui.dumpsNetworkQComboBox.currentText()
-        dformat = self.ui.dumpsFormatQComboBox.currentText()
-        exclude_include = [p.strip() for p in self.ui.dumpsExcludeOrIncludeQLineEdit.text().split(",")]
+    def _dump_job(self, save_filepath=None, resume=False, shard=None):
+        inputs = []
+        pages = [self.ui.hdQStackedWidget.currentWidget(), self.ui.derivationsQStackedWidget.currentWidget()]
+        for page in pages:
+            for widget in page.findChildren(QWidget):
+                if widget.objectName() == "":
+                    continue
+                elif isinstance(widget, QLineEdit):
+                    inputs.append((widget.objectName(), widget.text(), False, widget.isEnabled()))
+                elif isinstance(widget, QComboBox):
+                    inputs.append((widget.objectName(), widget.currentText(), False, widget.isEnabled()))
+                elif isinstance(widget, QCheckBox):
+                    inputs.append((widget.objectName(), "", widget.isChecked(), widget.isEnabled()))
+
+        return DumpJob(
+            cryptocurrency=self.ui.dumpsCryptocurrencyQComboBox.currentText(),
+            hd=self.ui.dumpsHdQComboBox.currentText(),
+            dump_from=self.ui.dumpsFromQComboBox.currentText().lower(),
+            network=self.ui.dumpsNetworkQComboBox.currentText(),
+            format=self.ui.dumpsFormatQComboBox.currentText(),
+            exclude_include=tuple(p.strip() for p in self.ui.dumpsExcludeOrIncludeQLineEdit.text().split(",")),
+            derivation=self.__selected_dervation_name() if self.ui.derivationQGroupBox.isEnabled() else None,
+            inputs=tuple(inputs),
+            save_filepath=save_filepath,
+            resume=resume,
+            shard=shard,
+            compression=(
+                self.ui.dumpsCompressionQComboBox.currentText()
+                if self.ui.dumpsCompressionQComboBox.currentText() in COMPRESSIONS and
+                self.ui.dumpsFormatQComboBox.currentText() not in SINKS else None
+            ),
+            compression_level=self.ui.dumpsCompressionLevelQSpinBox.value(),
+            coins=tuple(
+                [self.ui.dumpsCryptocurrencyQComboBox.currentText(), *sorted(self.fanout_coins)]
+                if self.ui.dumpsCoinsQPushButton.isEnabled() and self.fanout_coins else []
+            ),
+            index=self.ui.dumpsIndexQCheckBox.isChecked(),
+            bip38_passphrase=self.ui.dumpsBIP38QLineEdit.text() if self.ui.dumpsBIP38QCheckBox.isChecked() else None
+        )
 
-        saved_file = None
-        if save_filepath != None:
-            saved_file = open(save_filepath, 'w')
-            signal.interval_finished.connect(saved_file.close)
+    def __dumps_root(self, job):
+        recipe = self.__dumps_recipe(job)
+        hd = self.root_cache.get_or_create(recipe.key(), recipe.build)
 
-        crypto = self.ui.dumpsCryptocurrencyQComboBox.currentText()
+        derivation, indexes = None, {}
+        if job.derivation is not None:
+            derivation, indexes = self.__dumps_get_derivation(job, CRYPTOCURRENCIES.cryptocurrency(job.cryptocurrency))
+        return hd, derivation, indexes
+
+    def __dumps_recipe(self, job):
+        current_hd = job.hd
+        crypto = job.cryptocurrency
 
         hd_kwargs = {
             "cryptocurrency": CRYPTOCURRENCIES.cryptocurrency(crypto),
             "hd": HDS.hd(current_hd),
-            "network": network.lower()
+            "network": job.network.lower()
         }
 
         if current_hd in ('BIP32', 'BIP44', 'BIP49', 'BIP84', 'BIP86', 'BIP141'):
-            hd = self._dump_bips(dump_from, hd_kwargs)
+            hd = self._dump_bips(job, hd_kwargs)
         elif current_hd == 'Cardano':
-            hd = self._dump_cardano(dump_from, hd_kwargs)
+            hd = self._dump_cardano(job, hd_kwargs)
         elif current_hd == 'Electrum-V1':
-            hd = self._dump_ev1(dump_from, hd_kwargs)
+            hd = self._dump_ev1(job, hd_kwargs)
         elif current_hd == 'Electrum-V2':
-            hd = self._dump_ev2(dump_from, hd_kwargs)
+            hd = self._dump_ev2(job, hd_kwargs)
         elif current_hd == 'Monero':
-            hd = self._dump_monero(dump_from, hd_kwargs)
-
-        derivation = None
-        if self.ui.derivationQGroupBox.isEnabled():
-            derivation = self.__dumps_get_derivation(CRYPTOCURRENCIES.cryptocurrency(crypto))
-
-        def drive(*args) -> List[str]:
-            def drive_helper(derivations, current_derivation: List[Tuple[int, bool]] = []) -> List[str]:
-                if not derivations:
-
-                    derivation_name: str = derivation.name()
-                    if derivation_name in [
-                        "BIP44", "BIP49", "BIP84", "BIP86"
-                    ]:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=derivation_name
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            change=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif derivation_name == "CIP1852":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=derivation_name
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            role=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif derivation_name == 'Electrum':
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=derivation_name
-                        ).__call__(
-                            change=current_derivation[0][0],
-                            address=current_derivation[1][0]
-                        )
-                    elif derivation_name == "Monero":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=derivation_name
-                        ).__call__(
-                            minor=current_derivation[0][0],
-                            major=current_derivation[1][0]
-                        )
-                    elif derivation_name == "HDW":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=derivation_name
-                        ).__call__(
-                            account=current_derivation[0][0],
-                            ecc=current_derivation[1][0],
-                            address=current_derivation[2][0]
-                        )
-                    else:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=derivation_name
-                        ).__call__(
-                            path="m/" + "/".join(
-                                [str(item[0]) + "'" if item[1] else str(item[0]) for item in current_derivation]
-                            )
-                        )
-
-
-                    hd.update_derivation(
-                        derivation=_derivation
-                    )
-
+            hd = self._dump_monero(job, hd_kwargs)
+        return hd
+
+    def __preview(self, job, cancelled):
+        # Roots come from the cache, so a preview also warms it for the dump that follows
+        hd, derivation, indexes = self.__dumps_root(job)
+        if derivation is None:
+            return [("", dump_address(lazy_dump(hd) if lazy_supported(hd) else hd.dump(exclude={"root"})))]
+
+        rows = []
+        for path in itertools.islice(
+            traverse(derivation_levels(derivation.derivations(), indexes)), self.preview_rows
+        ):
+            if cancelled.is_set():
+                return None
+            dump = derivation_dump(hd, derivation.name(), path)
+            rows.append((hd.path(), dump_address(dump)))
+        return rows
+
+    def __estimate(self, job):
+        hd, derivation, indexes = self.__dumps_root(job)
+        exclude_include = list(job.exclude_include)
+        cryptocurrency = CRYPTOCURRENCIES.cryptocurrency(job.cryptocurrency)
+        pacing = {
+            dformat: self._pacing(cryptocurrency, dformat) for dformat in ("JSON", "CSV", *SINKS)
+        }
 
-                    csv_data: List[str] = []
+        if derivation is None:
+            started = time.perf_counter()
+            out = json.dumps(hd.dump(exclude=set(exclude_include)), indent=4, ensure_ascii=False)
+            return estimate_dump(
+                rows=1, dformat=job.format, derive_seconds=time.perf_counter() - started,
+                row_bytes=len(out.encode()), row_lines=out.count("\n") + 1, header_bytes=0,
+                pacing={dformat: 0 for dformat in pacing}, chunk_size=self.dump_chunk_size,
+                terminal_lines=self.terminal_lines, backend=self._backend(cryptocurrency)
+            )
 
-                    if dformat == "CSV":
-                        dump = hd.dump(exclude={"root"})
+        levels = derivation_levels(derivation.derivations(), indexes)
+        start, end = shard_bounds(path_count(levels), job.shard)
+        header = ""
+        if job.format == "JSON" and "root" not in exclude_include and (job.shard is None or job.shard[0] == 1):
+            header = json.dumps(hd.dump(exclude={"derivation", *exclude_include}), indent=4, ensure_ascii=False)
 
-                        try:
-                            for key in [keys.split(":") for keys in exclude_include]:
-                                if len(key) == 2:
-                                    csv_data.append(dump[key[0]][key[1]])
-                                else:
-                                    csv_data.append(dump[key[0]])
-                            out = ", ".join(map(str, csv_data))
+        rows = [
+            self._dump_row(hd, derivation.name(), path, job.format, exclude_include)[0]
+            for path in itertools.islice(traverse(levels, start=start), min(1, end - start))
+        ]
+        # Timed after a first row, so lazily computed root state is not counted per row
+        started = time.perf_counter()
+        for path in itertools.islice(traverse(levels, start=start), min(self.calibration_rows, end - start)):
+            rows.append(self._dump_row(hd, derivation.name(), path, job.format, exclude_include)[0])
+        elapsed = time.perf_counter() - started
+        calibrated = max(len(rows) - 1, 1)
+
+        remaining = end - start
+        if job.resume:
+            saved = Checkpoint.load(job.save_filepath)
+            remaining = end - max(start, saved.position if saved is not None else 0)
+            header = ""
+
+        return estimate_dump(
+            rows=max(remaining, 0),
+            dformat=job.format,
+            derive_seconds=elapsed / calibrated,
+            row_bytes=sum(len(row.encode()) + 1 for row in rows) / len(rows) if rows else 0,
+            row_lines=sum(row.count("\n") + 1 for row in rows) / len(rows) if rows else 1,
+            header_bytes=len(header.encode()),
+            pacing=pacing,
+            chunk_size=self.dump_chunk_size,
+            terminal_lines=self.terminal_lines,
+            backend=self._backend(cryptocurrency)
+        )
 
-                        except KeyError as e:
-                            raise ExportFormatError(f"Unknown key {e}")
+    def __dumps(self, signal, job, cancelled, qr_addresses):
+        hd, derivation, indexes = self.__dumps_root(job)
+
+        sink = sink_class(job.format) if job.save_filepath is not None else None
+        if sink is not None and job.resume:
+            raise ExportFormatError(f"{job.format} dumps cannot be resumed, dump them again")
+
+        checkpoint = None
+        if sink is None and job.save_filepath is not None and derivation is not None:
+            checkpoint = Checkpoint(
+                root=fingerprint(hd.dump(exclude={"derivation"})),
+                job=fingerprint(
+                    job.cryptocurrency, job.hd, job.network, job.format, job.exclude_include, job.derivation, job.shard,
+                    job.compression,
+                    derivation.derivations(), {position: str(expression.expression) for position, expression in indexes.items()}
+                ),
+                position=0, path=(), size=0
+            )
 
-                    else:
-                        dump = hd.dump(exclude={'root', *exclude_include})
-                        out = json.dumps(dump, indent=4, ensure_ascii=False)
+        mode = 'w'
+        if checkpoint is not None and not job.resume:
+            Checkpoint.remove(job.save_filepath)
+        elif job.resume:
+            checkpoint = self.__resume_checkpoint(job, checkpoint)
+            # Rows written after the checkpoint are derived again
+            os.truncate(job.save_filepath, checkpoint.size)
+            signal.interval_output.emit(f"Resuming {job.save_filepath} after {checkpoint.position} rows")
+            mode = 'a'
+
+        address_index, index_root = None, None
+        if job.index and derivation is not None:
+            address_index = AddressIndex()
+            # Entries of one root stay recognisable without its keys
+            index_root = root_fingerprint(hd)
+
+        if sink is not None:
+            if derivation is None:
+                return None
+            levels = derivation_levels(derivation.derivations(), indexes)
+            sink = sink(job.save_filepath, len(levels), list(job.exclude_include), self.row_group_size)
+            try:
+                return self.__dumps_write(
+                    signal, job, cancelled, qr_addresses, hd, derivation, indexes, None, None, sink,
+                    address_index, index_root
+                )
+            finally:
+                sink.close()
+                self.__close_index(signal, address_index)
+
+        if job.save_filepath is None:
+            saved_file = nullcontext()
+        elif job.compression is not None:
+            saved_file = CompressedFile(job.save_filepath, COMPRESSIONS[job.compression], job.compression_level, mode)
+        else:
+            saved_file = open(job.save_filepath, mode)
+        try:
+            with saved_file as saved_file:
+                return self.__dumps_write(
+                    signal, job, cancelled, qr_addresses, hd, derivation, indexes, saved_file, checkpoint,
+                    address_index=address_index, index_root=index_root
+                )
+        finally:
+            self.__close_index(signal, address_index)
+
+    def __close_index(self, signal, address_index):
+        if address_index is not None:
+            address_index.close()
+            signal.interval_output.emit(f"Indexed {address_index.added} new addresses in {address_index.filepath}")
+
+    def __resume_checkpoint(self, job, current):
+        saved = Checkpoint.load(job.save_filepath)
+        if saved is None:
+            raise Error(f"No checkpoint found for {job.save_filepath}")
+        elif current is None:
+            raise Error("Only derivation dumps can be resumed")
+        elif saved.root != current.root:
+            raise Error("Checkpoint was written for a different root")
+        elif saved.job != current.job:
+            raise ExportFormatError("Checkpoint was written for a different derivation or format")
+        elif not os.path.exists(job.save_filepath) or os.path.getsize(job.save_filepath) < saved.size:
+            raise Error(f"{job.save_filepath} is shorter than its checkpoint")
+        return saved
+
+    def __dumps_write(
+        self, signal, job, cancelled, qr_addresses, hd, derivation, indexes, saved_file, checkpoint, sink=None,
+        address_index=None, index_root=None
+    ):
+        dformat = job.format
+        exclude_include = list(job.exclude_include)
+        pacing = self._pacing(CRYPTOCURRENCIES.cryptocurrency(job.cryptocurrency), dformat)
+
+        def dump_row(path, position) -> str:
+            out, dump = self._dump_row(hd, derivation.name(), path, dformat, exclude_include)
+
+            address = dump_address(dump)
+            if len(qr_addresses) < self.qr_page_size and address is not None:
+                qr_addresses.append(address)
+            if address_index is not None and address is not None:
+                index_rows.append((address, hd.path(), job.cryptocurrency, job.network.lower(), index_root))
+            if sink is not None:
+                sink_rows.append((
+                    position, derivation_at(derivation.name(), path).path(), dump_address(dump),
+                    [f"{index}'" if hardened else str(index) for index, hardened in path],
+                    self._include_values(dump, exclude_include)
+                ))
+            return out
+
+        def save_checkpoint(size, position, path) -> None:
+            # Written after the rows, a crash in between only repeats them on resume
+            replace(checkpoint, position=position, path=path, size=size).save(job.save_filepath)
+
+        def drive() -> Optional[str]:
+            # Paths are generated lazily and written a chunk at a time, so memory
+            # stays flat however many rows the derivation ranges expand to
+            levels = derivation_levels(derivation.derivations(), indexes)
+            start, end = shard_bounds(path_count(levels), job.shard)
+            position = first = max(start, checkpoint.position if checkpoint is not None else 0)
+            paths = itertools.islice(traverse(levels, start=position), end - position)
+            started = time.monotonic()
+
+            def finished() -> str:
+                elapsed = max(time.monotonic() - started, 1e-9)
+                stopped = "Stopped after" if cancelled.is_set() else "Dumped"
+                target = f" to {job.save_filepath}" if job.save_filepath is not None else ""
+                return (
+                    f"{stopped} {position - first} rows{target} in {elapsed:.1f}s "
+                    f"({(position - first) / elapsed:.1f} rows/second){self._on_backend(job.cryptocurrency)}"
+                )
 
+            for chunk in chunked(paths, self.dump_chunk_size):
+                rows: List[str] = []
+                for path in chunk:
+                    if cancelled.is_set():
+                        break
+                    out = dump_row(path, position + len(rows))
+                    rows.append(f"{out}\n")
                     signal.interval_output.emit(out)
-                    
-                    if (hd_kwargs["cryptocurrency"].ECC.NAME != "SLIP10-Secp256k1" and SLIP10_SECP256K1_CONST.USE == "coincurve") or dformat == "JSON":
-                        time.sleep(0.03)
-                    
-                    if saved_file != None:
-                        saved_file.write(f"{out}\n")
-                    return [_derivation.path()]
-
-                path: List[str] = []
-                if len(derivations[0]) == 3:
-                    for value in range(derivations[0][0], derivations[0][1] + 1):
-                        if self.terminal_cancelled:
-                           break
-                        path += drive_helper(
-                            derivations[1:], current_derivation + [(value, derivations[0][2])]
-                        )
-                else:
-                    path += drive_helper(
-                        derivations[1:], current_derivation + [derivations[0]]
-                    )
-                return path
-
-            return drive_helper(args)
 
-        if dformat == "CSV":
+                    if pacing:
+                        time.sleep(pacing)
+
+                position += len(rows)
+                if address_index is not None and index_rows:
+                    address_index.add(index_rows)
+                    index_rows.clear()
+                if isinstance(saved_file, CompressedFile):
+                    saved_file.write("".join(rows))
+                    # Checkpointed by the writer thread once the chunk is compressed and written
+                    saved_file.flush(
+                        functools.partial(save_checkpoint, position=position, path=chunk[len(rows) - 1])
+                        if checkpoint is not None and rows else None
+                    )
+                elif saved_file != None:
+                    saved_file.write("".join(rows))
+                    saved_file.flush()
+                    if checkpoint is not None and rows:
+                        save_checkpoint(os.fstat(saved_file.fileno()).st_size, position, chunk[len(rows) - 1])
+                elif sink is not None:
+                    sink.write(sink_rows)
+                    sink_rows.clear()
+                if cancelled.is_set():
+                    if checkpoint is not None:
+                        return f"Stopped after {position - start} rows, resume {job.save_filepath} to continue"
+                    return finished()
+
+            if checkpoint is not None:
+                if isinstance(saved_file, CompressedFile):
+                    # Or a checkpoint still queued would be saved after this
+                    saved_file.wait()
+                Checkpoint.remove(job.save_filepath)
+            return finished()
+
+        sink_rows: List[tuple] = []
+        index_rows: List[tuple] = []
+        if dformat != "JSON":
             if derivation is None:
                 return None
-            drive(*derivation.derivations())
+            return drive()
 
         else:
             if derivation != None:                
-                if "root" not in exclude_include:
+                # Only the first shard carries the root, so merged shards match an unsharded dump
+                if "root" not in exclude_include and not job.resume and (job.shard is None or job.shard[0] == 1):
                     root = json.dumps(hd.dump(exclude={"derivation", *exclude_include}), indent=4, ensure_ascii=False)
                     
                     signal.interval_output.emit(root)
@@ -755,7 +1590,7 @@ class Dumps:
                     if saved_file != None:
                         saved_file.write(f"{root}\n")
 
-                drive(*derivation.derivations())
+                return drive()
             else:
                 result = json.dumps(hd.dump(exclude=set(exclude_include)), indent=4, ensure_ascii=False)
 
@@ -766,6 +1601,361 @@ class Dumps:
         return None
 
 
+    def _dump_row(self, hd, derivation_name, path, dformat, exclude_include):
+        try:
+            return dump_row(hd, derivation_name, path, dformat, exclude_include)
+        except KeyError as e:
+            raise ExportFormatError(f"Unknown key {e}")
+
+    def _include_values(self, dump, exclude_include):
+        try:
+            return include_values(dump, exclude_include)
+        except KeyError as e:
+            raise ExportFormatError(f"Unknown key {e}")
+
+    def __dumps_batch(self, signal, job, cancelled, qr_addresses):
+        derivation, indexes = self.__dumps_get_derivation(job, CRYPTOCURRENCIES.cryptocurrency(job.cryptocurrency))
+        levels = derivation_levels(derivation.derivations(), indexes)
+        roots = {"count": 0, "failed": 0}
+
+        def items():
+            # Roots are read and set up lazily, the pool only holds a window of their paths
+            with open(job.roots_filepath, "r", encoding="utf-8") as lines:
+                for index, line in enumerate(lines, start=1):
+                    value = line.strip()
+                    if value == "" or value.startswith("#"):
+                        continue
+                    elif cancelled.is_set():
+                        return
+                    roots["count"] += 1
+                    try:
+                        recipe = self.__dumps_recipe(replace(job, root=value))
+                    except Exception as e:
+                        roots["failed"] += 1
+                        signal.interval_output.emit(f"ERROR: root on line {index}: {e}")
+                        continue
+                    # Tags the rows without repeating the root, which may be a secret
+                    tag = fingerprint(value)
+                    for paths in chunked(traverse(levels), chunk_size):
+                        yield (index, tag), recipe, paths
+
+        chunk_size, processes = self.__pool_sizes(signal, job)
+        rows, failed, elapsed = self.__dumps_pool(
+            signal, job, cancelled, items(), derivation.name(), ("root_index", "root_fingerprint"),
+            lambda values: f"root on line {values[0]}", processes=processes, bip38_passphrase=job.bip38_passphrase
+        )
+        stopped = "Stopped after" if cancelled.is_set() else "Dumped"
+        failed += roots["failed"]
+        return (
+            f"{stopped} {rows} rows of {roots['count'] - failed} roots "
+            f"({failed} failed) to {job.save_filepath} in {elapsed:.1f}s{self._on_backend(job.cryptocurrency)}"
+        )
+
+    def __dumps_convert(self, signal, job, cancelled, qr_addresses):
+        first = next(read_keys(job.keys_filepath), None)
+        if first is None:
+            raise Error(f"No keys found in {job.keys_filepath}")
+        # Every key builds the same kind of wallet, only the key itself changes
+        recipe = self.__dumps_recipe(replace(job, root=first[1]))
+
+        if job.compression is not None:
+            saved_file = CompressedFile(job.save_filepath, COMPRESSIONS[job.compression], job.compression_level)
+        else:
+            saved_file = open(job.save_filepath, "w")
+
+        chunk_size, processes = self.__pool_sizes(signal, job)
+        started = reported = time.monotonic()
+        converted, failed = 0, 0
+        with saved_file as saved_file:
+            for chunk in chunked(imap_ordered(
+                functools.partial(
+                    convert_keys, recipe=recipe, dformat=job.format, exclude_include=job.exclude_include,
+                    bip38_passphrase=job.bip38_passphrase
+                ),
+                read_keys(job.keys_filepath),
+                processes=processes,
+                chunksize=chunk_size
+            ), self.dump_chunk_size):
+                rows = []
+                for number, row, error in chunk:
+                    if error is not None:
+                        failed += 1
+                        signal.interval_output.emit(f"ERROR: line {number}: {error}")
+                    else:
+                        rows.append(f"{row}\n")
+                saved_file.write("".join(rows))
+                converted += len(rows)
+                if time.monotonic() - reported >= 1:
+                    reported = time.monotonic()
+                    signal.interval_output.emit(f"{converted} keys, {converted / (reported - started):.1f} keys/second")
+                if cancelled.is_set():
+                    break
+
+        elapsed = max(time.monotonic() - started, 1e-9)
+        stopped = "Stopped after" if cancelled.is_set() else "Done,"
+        return (
+            f"{stopped} converted {converted} keys ({failed} failed) to {job.save_filepath} "
+            f"in {elapsed:.1f}s ({converted / elapsed:.1f} keys/second){self._on_backend(job.cryptocurrency)}"
+        )
+
+    def __dumps_fanout(self, signal, job, cancelled, qr_addresses):
+        recipe = self.__dumps_recipe(job)
+        if recipe.method in ("from_mnemonic", "from_entropy"):
+            # The seed is the same for every coin, so the stretching runs once
+            hd = self.root_cache.get_or_create(recipe.key(), recipe.build)
+            recipe = RootRecipe(
+                hd_kwargs={
+                    key: value for key, value in recipe.hd_kwargs.items() if key not in ("passphrase", "language")
+                },
+                method="from_seed",
+                args=(SEEDS.seed(recipe.args[0].name())(seed=hd.seed()),),
+                kwargs={}
+            )
+
+        def items():
+            for coin in job.coins:
+                if cancelled.is_set():
+                    return
+                cryptocurrency = CRYPTOCURRENCIES.cryptocurrency(coin)
+                # Coin type levels follow the coin, the other levels come from the form
+                derivation, indexes = self.__dumps_get_derivation(job, cryptocurrency)
+                coin_recipe = replace(recipe, hd_kwargs={**recipe.hd_kwargs, "cryptocurrency": cryptocurrency})
+                for paths in chunked(traverse(derivation_levels(derivation.derivations(), indexes)), chunk_size):
+                    yield (coin, job.network.lower()), coin_recipe, paths
+
+        derivation, _ = self.__dumps_get_derivation(job, CRYPTOCURRENCIES.cryptocurrency(job.cryptocurrency))
+        chunk_size, processes = self.__pool_sizes(signal, job)
+        rows, failed, elapsed = self.__dumps_pool(
+            signal, job, cancelled, items(), derivation.name(), ("coin", "network"),
+            lambda values: f"{values[0]} {values[1]}", processes=processes, bip38_passphrase=job.bip38_passphrase
+        )
+        stopped = "Stopped after" if cancelled.is_set() else "Dumped"
+        target = f" to {job.save_filepath}" if job.save_filepath is not None else ""
+        return (
+            f"{stopped} {rows} rows of {len(job.coins) - failed} coins ({failed} failed){target} "
+            f"in {elapsed:.1f}s{self._on_backend(*job.coins)}"
+        )
+
+    def __dumps_discover(self, signal, job, cancelled, qr_addresses):
+        hd, derivation, indexes = self.__dumps_root(job)
+        purpose, coin_type = derivation.derivations()[0][0], derivation.derivations()[1][0]
+        account = indexes[2].first() if indexes[2].first() is not None else 0
+
+        started = time.monotonic()
+        addresses = load_addresses(job.addresses_filepath)
+        signal.interval_output.emit(
+            f"Loaded {len(addresses)} addresses in {time.monotonic() - started:.1f}s"
+            if isinstance(addresses, set) else
+            f"Loaded the addresses into a Bloom filter in {time.monotonic() - started:.1f}s, hits may be false positives"
+        )
+
+        scanned = 0
+
+        def derive(account, change, index):
+            nonlocal scanned
+            scanned += 1
+            hd.update_derivation(derivation=derivation_at(
+                derivation.name(), ((purpose, True), (coin_type, True), (account, True), (change, False), (index, False))
+            ))
+            return hd.path(), hd.address()
+
+        started = time.monotonic()
+        hits, accounts = 0, set()
+        for account, change, index, path, address in discover(
+            derive, addresses, gap_limit=job.gap_limit, account=account, cancelled=cancelled.is_set
+        ):
+            hits += 1
+            accounts.add(account)
+            signal.interval_output.emit(f"{path},{address}")
+            if len(qr_addresses) < self.qr_page_size:
+                qr_addresses.append(address)
+
+        stopped = "Stopped after finding" if cancelled.is_set() else "Found"
+        return (
+            f"{stopped} {hits} used addresses in {len(accounts)} accounts, "
+            f"scanned {scanned} paths in {time.monotonic() - started:.1f}s"
+        )
+
+    def __dumps_search(self, signal, job, cancelled, qr_addresses):
+        cryptocurrency = CRYPTOCURRENCIES.cryptocurrency(job.cryptocurrency)
+        recipe = self.__dumps_recipe(job)
+        derivation, indexes = self.__dumps_get_derivation(job, cryptocurrency)
+        if job.derivation in ("BIP44", "BIP49", "BIP84", "BIP86"):
+            # The change combo selects one chain, a lost address may be on either
+            indexes[3] = (0, 1)
+        levels = derivation_levels(derivation.derivations(), indexes)
+
+        targets = decode_targets(job.targets, cryptocurrency.NETWORKS.get_network(job.network.lower()))
+        semantics = targets.semantics()
+        backend = self._backend(cryptocurrency)
+        signal.interval_output.emit(
+            f"Searching {path_count(levels)} paths for {len(targets)} targets"
+            f"{' as ' + ', '.join(semantics) if semantics else ''}"
+            f"{f', on {backend}' if backend is not None else ''}"
+        )
+        # Every semantic is one more address tried per path
+        per_path = len(semantics) + (1 if targets.addresses else 0)
+
+        started = reported = time.monotonic()
+        searched, found = 0, {}
+        for count, hits in imap_ordered(
+            functools.partial(search_paths, recipe=recipe, derivation_name=derivation.name(), targets=targets),
+            chunked(traverse(levels), self.dump_chunk_size),
+            chunksize=1,
+            initializer=initialize_search
+        ):
+            searched += count
+            for path, semantic, address in hits:
+                if address not in found:
+                    found[address] = path
+                    signal.interval_output.emit(f"{path},{semantic},{address}")
+                    if len(qr_addresses) < self.qr_page_size:
+                        qr_addresses.append(address)
+            if len(found) == len(targets) or cancelled.is_set():
+                break
+            if time.monotonic() - reported >= 1:
+                reported = time.monotonic()
+                signal.interval_output.emit(
+                    f"{searched} paths, {searched * per_path / (reported - started):.1f} addresses/second"
+                )
+
+        elapsed = max(time.monotonic() - started, 1e-9)
+        stopped = "Stopped after finding" if cancelled.is_set() else "Found"
+        return (
+            f"{stopped} {len(found)} of {len(targets)} targets, searched {searched} paths in {elapsed:.1f}s "
+            f"({searched * per_path / elapsed:.1f} addresses/second)"
+        )
+
+    def __dumps_encrypted(self, signal, job, cancelled, qr_addresses):
+        recipe = self.__dumps_recipe(job)
+        derivation, indexes = self.__dumps_get_derivation(job, CRYPTOCURRENCIES.cryptocurrency(job.cryptocurrency))
+        chunk_size, processes = self.__pool_sizes(signal, job)
+
+        def items():
+            for paths in chunked(traverse(derivation_levels(derivation.derivations(), indexes)), chunk_size):
+                yield (), recipe, paths
+
+        rows, failed, elapsed = self.__dumps_pool(
+            signal, job, cancelled, items(), derivation.name(), (), lambda values: "dump",
+            processes=processes, bip38_passphrase=job.bip38_passphrase
+        )
+        stopped = "Stopped after" if cancelled.is_set() else "Dumped"
+        target = f" to {job.save_filepath}" if job.save_filepath is not None else ""
+        return (
+            f"{stopped} {rows} rows with encrypted WIFs{target} in {elapsed:.1f}s "
+            f"({rows / elapsed:.1f} rows/second){self._on_backend(job.cryptocurrency)}"
+        )
+
+    def __dumps_bip38(self, signal, job, cancelled, qr_addresses):
+        processes = bip38_processes()
+        signal.interval_output.emit(f"{job.bip38_mode.title()}ing {job.wifs_filepath} on {processes} processes")
+
+        started = reported = time.monotonic()
+        converted, failed = 0, 0
+        with open(job.save_filepath, "w", newline="") as saved_file:
+            for chunk in imap_ordered(
+                functools.partial(
+                    convert_wifs, mode=job.bip38_mode, cryptocurrency=job.cryptocurrency, network=job.network.lower()
+                ),
+                chunked(read_wifs(job.wifs_filepath, job.bip38_passphrase), self.bip38_chunk_size),
+                processes=processes,
+                chunksize=1
+            ):
+                rows = []
+                for number, wif, result, error in chunk:
+                    if error is not None:
+                        failed += 1
+                        signal.interval_output.emit(f"ERROR: line {number}: {error}")
+                    else:
+                        rows.append(f"{csv_row([wif, result])}\n")
+                saved_file.write("".join(rows))
+                converted += len(rows)
+                if time.monotonic() - reported >= 1:
+                    reported = time.monotonic()
+                    signal.interval_output.emit(f"{converted} WIFs, {converted / (reported - started):.1f} WIFs/second")
+                if cancelled.is_set():
+                    break
+
+        elapsed = max(time.monotonic() - started, 1e-9)
+        stopped = "Stopped after" if cancelled.is_set() else "Done,"
+        return (
+            f"{stopped} {job.bip38_mode}ed {converted} WIFs ({failed} failed) to {job.save_filepath} "
+            f"in {elapsed:.1f}s ({converted / elapsed:.1f} WIFs/second)"
+        )
+
+    def __pool_sizes(self, signal, job):
+        # scrypt dominates rows with encrypted WIFs, so they go in small chunks on as many processes as memory allows
+        if job.bip38_passphrase is None or not writes_wif(job.format, job.exclude_include):
+            return self.dump_chunk_size, None
+        processes = bip38_processes()
+        signal.interval_output.emit(f"Encrypting WIFs with BIP38 on {processes} processes")
+        return self.bip38_chunk_size, processes
+
+    def __dumps_pool(
+        self, signal, job, cancelled, items, derivation_name, tags, describe, processes=None, bip38_passphrase=None
+    ):
+        if job.save_filepath is None:
+            saved_file = nullcontext()
+        elif job.compression is not None:
+            saved_file = CompressedFile(job.save_filepath, COMPRESSIONS[job.compression], job.compression_level)
+        else:
+            saved_file = open(job.save_filepath, "w")
+
+        address_index = AddressIndex() if job.index else None
+        started = reported = time.monotonic()
+        rows, failed, failed_values = 0, 0, None
+        try:
+            with saved_file as saved_file:
+                # Roots are built once per worker and kept warm while their paths are dumped
+                for values, chunk, entries, error in imap_ordered(
+                    functools.partial(
+                        dump_roots, tags=tags, derivation_name=derivation_name, dformat=job.format,
+                        exclude_include=job.exclude_include, bip38_passphrase=bip38_passphrase,
+                        index=address_index is not None
+                    ),
+                    items,
+                    processes=processes,
+                    chunksize=1,
+                    initializer=initialize_batch
+                ):
+                    if address_index is not None and entries:
+                        address_index.add(entries)
+                    if saved_file is not None and chunk:
+                        saved_file.write("".join(f"{row}\n" for row in chunk))
+                    else:
+                        for row in chunk:
+                            signal.interval_output.emit(row)
+                    rows += len(chunk)
+                    if error is not None and values != failed_values:
+                        failed_values = values
+                        failed += 1
+                        signal.interval_output.emit(f"ERROR: {describe(values)}: {error}")
+                    if saved_file is not None and time.monotonic() - reported >= 1:
+                        reported = time.monotonic()
+                        signal.interval_output.emit(f"{rows} rows, {rows / (reported - started):.1f} rows/second")
+                    if cancelled.is_set():
+                        break
+        finally:
+            self.__close_index(signal, address_index)
+        return rows, failed, max(time.monotonic() - started, 1e-9)
+
+    def _backend(self, cryptocurrency):
+        # Bound when hdwallet was imported, see src.backend
+        if cryptocurrency.ECC.NAME == "SLIP10-Secp256k1":
+            return SLIP10_SECP256K1_CONST.USE
+        return None
+
+    def _on_backend(self, *names):
+        # Ends the finished line of a dump of secp256k1 coins with the backend that derived it
+        backends = {self._backend(CRYPTOCURRENCIES.cryptocurrency(name)) for name in names} - {None}
+        return f", on {backends.pop()}" if backends else ""
+
+    def _pacing(self, cryptocurrency, dformat):
+        # Seconds to sleep after printing a row, keeps slow rows from flooding the terminal
+        if (cryptocurrency.ECC.NAME != "SLIP10-Secp256k1" and SLIP10_SECP256K1_CONST.USE == "coincurve") or dformat == "JSON":
+            return 0.03
+        return 0
+
     def __selected_dervation_name(self):
         current_widget = self.ui.derivationsQStackedWidget.currentWidget().objectName()
         for name, data in self.derivation_tab.items():
@@ -773,343 +1963,360 @@ class Dumps:
                 return name
         return None
 
-    def __dumps_get_derivation(self, crypto):
-        current_tab = self.__selected_dervation_name()
+    def __dumps_get_derivation(self, job, crypto):
+        current_tab = job.derivation
+        indexes = {}
+
+        def index_field(position, name):
+            # hdwallet only understands "a" or "a-b", so it gets the first index
+            # and the traversal walks the compiled expression instead
+            expression = IndexExpression(job.text(name))
+            indexes[position] = expression
+            first = expression.first()
+            return str(first if first is not None else 0)
 
         if current_tab == "Custom":
-            return CustomDerivation(
-                path=self.ui.customPathQLineEdit.text()
+            derivation = CustomDerivation(
+                path=job.text("customPathQLineEdit")
             )
         elif current_tab == "BIP44":
-            return BIP44Derivation(
+            derivation = BIP44Derivation(
                 coin_type=crypto.COIN_TYPE,
-                account=self.ui.bip44AccountQLineEdit.text(),
-                change=f"{self.ui.bip44ChangeQComboBox.currentText().lower()}-chain",
-                address=self.ui.bip44AddressQLineEdit.text()
+                account=index_field(2, "bip44AccountQLineEdit"),
+                change=f"{job.text('bip44ChangeQComboBox').lower()}-chain",
+                address=index_field(4, "bip44AddressQLineEdit")
             )
         elif current_tab == "BIP49":
-            return BIP49Derivation(
+            derivation = BIP49Derivation(
                 coin_type=crypto.COIN_TYPE,
-                account=self.ui.bip49AccountQLineEdit.text(),
-                change=f"{self.ui.bip49ChangeQComboBox.currentText().lower()}-chain",
-                address=self.ui.bip49AddressQLineEdit.text()
+                account=index_field(2, "bip49AccountQLineEdit"),
+                change=f"{job.text('bip49ChangeQComboBox').lower()}-chain",
+                address=index_field(4, "bip49AddressQLineEdit")
             )
         elif current_tab == "BIP84":
-            return BIP84Derivation(
+            derivation = BIP84Derivation(
                 coin_type=crypto.COIN_TYPE,
-                account=self.ui.bip84AccountQLineEdit.text(),
-                change=f"{self.ui.bip84ChangeQComboBox.currentText().lower()}-chain",
-                address=self.ui.bip84AddressQLineEdit.text()
+                account=index_field(2, "bip84AccountQLineEdit"),
+                change=f"{job.text('bip84ChangeQComboBox').lower()}-chain",
+                address=index_field(4, "bip84AddressQLineEdit")
             )
         elif current_tab == "BIP86":
-            return BIP86Derivation(
+            derivation = BIP86Derivation(
                 coin_type=crypto.COIN_TYPE,
-                account=self.ui.bip86AccountQLineEdit.text(),
-                change=f"{self.ui.bip86ChangeQComboBox.currentText().lower()}-chain",
-                address=self.ui.bip86AddressQLineEdit.text()
+                account=index_field(2, "bip86AccountQLineEdit"),
+                change=f"{job.text('bip86ChangeQComboBox').lower()}-chain",
+                address=index_field(4, "bip86AddressQLineEdit")
             )
         elif current_tab == "CIP1852":
-            role = self.ui.cip1852ChangeQComboBox.currentText().lower()
+            role = job.text("cip1852ChangeQComboBox").lower()
             postfix = "key" if role == "staking" else "chain"
-            return CIP1852Derivation(
+            derivation = CIP1852Derivation(
                 coin_type=crypto.COIN_TYPE,
-                account=self.ui.cip1852AccountQLineEdit.text(),
+                account=index_field(2, "cip1852AccountQLineEdit"),
                 role=f"{role}-{postfix}",
-                address=self.ui.cip1852AddressQLineEdit.text()
+                address=index_field(4, "cip1852AddressQLineEdit")
             )
 
         elif current_tab == "Electrum":
-            return ElectrumDerivation(
-                change=self.ui.electrumChangeQLineEdit.text(),
-                address=self.ui.electrumAddressQLineEdit.text(),
+            derivation = ElectrumDerivation(
+                change=index_field(0, "electrumChangeQLineEdit"),
+                address=index_field(1, "electrumAddressQLineEdit"),
             )
 
         elif current_tab == "Monero":
-            return MoneroDerivation(
-                minor=self.ui.moneroMinorQLineEdit.text(),
-                major=self.ui.moneroMajorQLineEdit.text()
+            derivation = MoneroDerivation(
+                minor=index_field(0, "moneroMinorQLineEdit"),
+                major=index_field(1, "moneroMajorQLineEdit")
             )
 
         elif current_tab == "HDW":
-            return HDWDerivation(
-                account=self.ui.hdwAccountQLineEdit.text(),
-                ecc=self.ui.hdwEccQLineEdit.text(),
-                address=self.ui.hdwAddressQLineEdit.text()
+            derivation = HDWDerivation(
+                account=index_field(0, "hdwAccountQLineEdit"),
+                ecc=job.text("hdwEccQLineEdit"),
+                address=index_field(2, "hdwAddressQLineEdit")
             )
+        else:
+            return None, indexes
 
-    def _dump_bips(self, dump_from, hd_kwargs):
-        if dump_from == "entropy":
-            hd_kwargs["language"] = self.ui.bipFromEntropyLanguageQComboBox.currentText().lower()
-            hd_kwargs["passphrase"] = self.ui.bipFromEntropyPassphraseQLineEdit.text()
-            hd_kwargs["public_key_type"] = self.ui.bipFromEntropyPublicKeyTypeQComboBox.currentText().lower()
-            hd_kwargs["semantic"] = self.ui.bipFromEntropySemanticsQComboBox.currentText().lower()
+        return derivation, indexes
+
+    def _dump_bips(self, job, hd_kwargs):
+        if job.dump_from == "entropy":
+            hd_kwargs["language"] = job.text("bipFromEntropyLanguageQComboBox").lower()
+            hd_kwargs["passphrase"] = job.text("bipFromEntropyPassphraseQLineEdit")
+            hd_kwargs["public_key_type"] = job.text("bipFromEntropyPublicKeyTypeQComboBox").lower()
+            hd_kwargs["semantic"] = job.text("bipFromEntropySemanticsQComboBox").lower()
             
-            entropy_class = ENTROPIES.entropy(self.ui.bipFromEntropyClientQComboBox.currentText())
+            entropy_class = ENTROPIES.entropy(job.text("bipFromEntropyClientQComboBox"))
             
-            return HDWallet(**hd_kwargs).from_entropy(
+            return self._root(hd_kwargs, "from_entropy",
                 entropy_class(
-                    entropy=self._validate_and_get("Entropy", self.ui.bipFromEntropyGenerateQLineEdit)
+                    entropy=self._validate_and_get("Entropy", job, "bipFromEntropyGenerateQLineEdit")
                 )
             )
-        elif dump_from == "mnemonic":
-            hd_kwargs["passphrase"] = self.ui.bipFromMnemonicPassphraseQLineEdit.text()
-            hd_kwargs["public_key_type"] = self.ui.bipFromMnemonicPublicKeyTypeQComboBox.currentText().lower()
-            hd_kwargs["semantic"] = self.ui.bipFromMnemonicSemanticsQComboBox.currentText().lower()
+        elif job.dump_from == "mnemonic":
+            hd_kwargs["passphrase"] = job.text("bipFromMnemonicPassphraseQLineEdit")
+            hd_kwargs["public_key_type"] = job.text("bipFromMnemonicPublicKeyTypeQComboBox").lower()
+            hd_kwargs["semantic"] = job.text("bipFromMnemonicSemanticsQComboBox").lower()
 
-            mnemonic_class = MNEMONICS.mnemonic(self.ui.bipFromMnemonicClientQComboBox.currentText())
+            mnemonic_class = MNEMONICS.mnemonic(job.text("bipFromMnemonicClientQComboBox"))
 
-            return HDWallet(**hd_kwargs).from_mnemonic(
+            return self._root(hd_kwargs, "from_mnemonic",
                 mnemonic_class(
-                    mnemonic=self._validate_and_get("Mnemonic", self.ui.bipFromMnemonicQLineEdit)
+                    mnemonic=self._validate_and_get("Mnemonic", job, "bipFromMnemonicQLineEdit")
                 )
             )
-        elif dump_from == "private key":
-            hd_kwargs["public_key_type"] = self.ui.bipFromPrivateKeyPublicKeyTypeQComboBox.currentText().lower()
-            hd_kwargs["semantic"] = self.ui.bipFromPrivateKeySemanticsQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_private_key(
-                private_key=self._validate_and_get("Private Key", self.ui.bipFromPrivateKeyQLineEdit)
+        elif job.dump_from == "private key":
+            hd_kwargs["public_key_type"] = job.text("bipFromPrivateKeyPublicKeyTypeQComboBox").lower()
+            hd_kwargs["semantic"] = job.text("bipFromPrivateKeySemanticsQComboBox").lower()
+            return self._root(hd_kwargs, "from_private_key",
+                private_key=self._validate_and_get("Private Key", job, "bipFromPrivateKeyQLineEdit")
             )
-        elif dump_from == "public key":
-            hd_kwargs["public_key_type"] = self.ui.bipFromPublicKeyPublicKeyTypeQComboBox.currentText().lower()
-            hd_kwargs["semantic"] = self.ui.bipFromPublicKeySemanticsQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_public_key(
-                public_key=self._validate_and_get("Public Key", self.ui.bipFromPublicKeyQLineEdit)
+        elif job.dump_from == "public key":
+            hd_kwargs["public_key_type"] = job.text("bipFromPublicKeyPublicKeyTypeQComboBox").lower()
+            hd_kwargs["semantic"] = job.text("bipFromPublicKeySemanticsQComboBox").lower()
+            return self._root(hd_kwargs, "from_public_key",
+                public_key=self._validate_and_get("Public Key", job, "bipFromPublicKeyQLineEdit")
             )
-        elif dump_from == "seed":
-            hd_kwargs["public_key_type"] = self.ui.bipFromSeedPublicKeyTypeQComboBox.currentText().lower()
-            hd_kwargs["semantic"] = self.ui.bipFromSeedSemanticsQComboBox.currentText().lower()
+        elif job.dump_from == "seed":
+            hd_kwargs["public_key_type"] = job.text("bipFromSeedPublicKeyTypeQComboBox").lower()
+            hd_kwargs["semantic"] = job.text("bipFromSeedSemanticsQComboBox").lower()
 
-            seed_class = SEEDS.seed(self.ui.bipFromSeedClientQComboBox.currentText())
+            seed_class = SEEDS.seed(job.text("bipFromSeedClientQComboBox"))
 
-            return HDWallet(**hd_kwargs).from_seed(
+            return self._root(hd_kwargs, "from_seed",
                 seed_class(
-                    seed=self._validate_and_get("Seed", self.ui.bipFromSeedsQLineEdit)
+                    seed=self._validate_and_get("Seed", job, "bipFromSeedsQLineEdit")
                 )
             )
-        elif dump_from == "wif":
-            hd_kwargs["public_key_type"] = self.ui.bipFromWIFPublicKeyTypeQComboBox.currentText().lower()
-            hd_kwargs["semantic"] = self.ui.bipFromWIFSemanticsQComboBox.currentText().lower()
-            wif = self._validate_and_get("WIF", self.ui.bipFromWIFQLineEdit)
+        elif job.dump_from == "wif":
+            hd_kwargs["public_key_type"] = job.text("bipFromWIFPublicKeyTypeQComboBox").lower()
+            hd_kwargs["semantic"] = job.text("bipFromWIFSemanticsQComboBox").lower()
+            wif = self._validate_and_get("WIF", job, "bipFromWIFQLineEdit")
 
-            if self.ui.bipFromWIFBIP38PassphraseQCheckBox.isChecked():
+            if job.checked("bipFromWIFBIP38PassphraseQCheckBox"):
                 crypto_name = hd_kwargs["cryptocurrency"].NAME
-                passphrase = self.ui.bipFromWIFBIP38PassphraseQLineEdit.text()
+                passphrase = job.text("bipFromWIFBIP38PassphraseQLineEdit")
 
                 bip38: BIP38 = BIP38(
                   cryptocurrency=self.bip38_cryptocurrencies[crypto_name] , network=hd_kwargs["network"]
                 )
                 wif = bip38.decrypt(encrypted_wif=wif, passphrase=passphrase)
 
-            return HDWallet(**hd_kwargs).from_wif(
+            return self._root(hd_kwargs, "from_wif",
                 wif=wif
             )
-        elif dump_from == "xprivate key":
-            hd_kwargs["public_key_type"] = self.ui.bipFromXPrivateKeyPublicKeyTypeQComboBox.currentText().lower()
-            hd_kwargs["semantic"] = self.ui.bipFromXPrivateKeySemanticsQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_xprivate_key(
-                xprivate_key=self._validate_and_get("XPrivate Key", self.ui.bipFromXPrivateKeyQLineEdit),
-                strict=self.ui.bipFromXPrivateKeyStrictQCheckBox.isChecked()
+        elif job.dump_from == "xprivate key":
+            hd_kwargs["public_key_type"] = job.text("bipFromXPrivateKeyPublicKeyTypeQComboBox").lower()
+            hd_kwargs["semantic"] = job.text("bipFromXPrivateKeySemanticsQComboBox").lower()
+            return self._root(hd_kwargs, "from_xprivate_key",
+                xprivate_key=self._validate_and_get("XPrivate Key", job, "bipFromXPrivateKeyQLineEdit"),
+                strict=job.checked("bipFromXPrivateKeyStrictQCheckBox")
             )
-        elif dump_from == "xpublic key":
-            hd_kwargs["public_key_type"] = self.ui.bipFromXPublicKeyPublicKeyTypeQComboBox.currentText().lower()
-            hd_kwargs["semantic"] = self.ui.bipFromXPublicKeySemanticsQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_xpublic_key(
-                xpublic_key=self._validate_and_get("XPublic Key", self.ui.bipFromXPublicKeyQLineEdit),
-                strict=self.ui.bipFromXPublicKeyStrictQCheckBox.isChecked()
+        elif job.dump_from == "xpublic key":
+            hd_kwargs["public_key_type"] = job.text("bipFromXPublicKeyPublicKeyTypeQComboBox").lower()
+            hd_kwargs["semantic"] = job.text("bipFromXPublicKeySemanticsQComboBox").lower()
+            return self._root(hd_kwargs, "from_xpublic_key",
+                xpublic_key=self._validate_and_get("XPublic Key", job, "bipFromXPublicKeyQLineEdit"),
+                strict=job.checked("bipFromXPublicKeyStrictQCheckBox")
             )
 
-    def _dump_cardano(self, dump_from, hd_kwargs):
-        if dump_from == "entropy":
-            hd_kwargs["language"] = self.ui.cardanoFromEntropyLanguageQComboBox.currentText().lower()
-            hd_kwargs["passphrase"] = self.ui.cardanoFromEntropyPassphraseQLineEdit.text()
-            hd_kwargs["cardano_type"] = self.ui.cardanoFromEntropyCardanoTypeQComboBox.currentText().lower()
-            hd_kwargs["address_type"] = self.ui.cardanoFromEntropyAddressTypeQComboBox.currentText().lower()
-            hd_kwargs["staking_public_key"] =  self._validate_and_get("Staking Public Key", self.ui.cardanoFromEntropyStakingQLineEdit)
-            return HDWallet(**hd_kwargs).from_entropy(
+    def _dump_cardano(self, job, hd_kwargs):
+        if job.dump_from == "entropy":
+            hd_kwargs["language"] = job.text("cardanoFromEntropyLanguageQComboBox").lower()
+            hd_kwargs["passphrase"] = job.text("cardanoFromEntropyPassphraseQLineEdit")
+            hd_kwargs["cardano_type"] = job.text("cardanoFromEntropyCardanoTypeQComboBox").lower()
+            hd_kwargs["address_type"] = job.text("cardanoFromEntropyAddressTypeQComboBox").lower()
+            hd_kwargs["staking_public_key"] =  self._validate_and_get("Staking Public Key", job, "cardanoFromEntropyStakingQLineEdit")
+            return self._root(hd_kwargs, "from_entropy",
                 BIP39Entropy(
-                    entropy=self._validate_and_get("Entropy", self.ui.cardanoFromEntropyGenerateQLineEdit)
+                    entropy=self._validate_and_get("Entropy", job, "cardanoFromEntropyGenerateQLineEdit")
                 )
             )
-        elif dump_from == "mnemonic":
-            hd_kwargs["passphrase"] = self.ui.cardanoFromMnemonicPassphraseQLineEdit.text()
-            hd_kwargs["cardano_type"] = self.ui.cardanoFromMnemonicCardanoTypeQComboBox.currentText().lower()
-            hd_kwargs["address_type"] = self.ui.cardanoFromMnemonicAddressTypeQComboBox.currentText().lower()
-            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", self.ui.cardanoFromMnemonicStakingQLineEdit)
-            return HDWallet(**hd_kwargs).from_mnemonic(
+        elif job.dump_from == "mnemonic":
+            hd_kwargs["passphrase"] = job.text("cardanoFromMnemonicPassphraseQLineEdit")
+            hd_kwargs["cardano_type"] = job.text("cardanoFromMnemonicCardanoTypeQComboBox").lower()
+            hd_kwargs["address_type"] = job.text("cardanoFromMnemonicAddressTypeQComboBox").lower()
+            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", job, "cardanoFromMnemonicStakingQLineEdit")
+            return self._root(hd_kwargs, "from_mnemonic",
                 BIP39Mnemonic(
-                    mnemonic=self._validate_and_get("Mnemonic", self.ui.cardanoFromMnemonicGenerateQLineEdit)
+                    mnemonic=self._validate_and_get("Mnemonic", job, "cardanoFromMnemonicGenerateQLineEdit")
                 )
             )
-        elif dump_from == "private key":
-            hd_kwargs["cardano_type"] = self.ui.cardanoFromPrivateKeyCardanoTypeQComboBox.currentText().lower()
-            hd_kwargs["address_type"] = self.ui.cardanoFromPrivateKeyAddressTypeQComboBox.currentText().lower()
-            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", self.ui.cardanoFromPrivateKeyStakingQLineEdit)
-            return HDWallet(**hd_kwargs).from_private_key(
-                private_key=self._validate_and_get("Private Key", self.ui.cardanoFromPrivateKeyQLineEdit)
+        elif job.dump_from == "private key":
+            hd_kwargs["cardano_type"] = job.text("cardanoFromPrivateKeyCardanoTypeQComboBox").lower()
+            hd_kwargs["address_type"] = job.text("cardanoFromPrivateKeyAddressTypeQComboBox").lower()
+            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", job, "cardanoFromPrivateKeyStakingQLineEdit")
+            return self._root(hd_kwargs, "from_private_key",
+                private_key=self._validate_and_get("Private Key", job, "cardanoFromPrivateKeyQLineEdit")
             )
-        elif dump_from == "public key":
-            hd_kwargs["cardano_type"] = self.ui.cardanoFromPublicKeyCardanoTypeQComboBox.currentText().lower()
-            hd_kwargs["address_type"] = self.ui.cardanoFromPublicKeyAddressTypeQComboBox.currentText().lower()
-            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", self.ui.cardanoFromPublicKeyStakingQLineEdit)
-            return HDWallet(**hd_kwargs).from_public_key(
-                public_key=self._validate_and_get("Public Key", self.ui.cardanoFromPublicKeyQLineEdit)
+        elif job.dump_from == "public key":
+            hd_kwargs["cardano_type"] = job.text("cardanoFromPublicKeyCardanoTypeQComboBox").lower()
+            hd_kwargs["address_type"] = job.text("cardanoFromPublicKeyAddressTypeQComboBox").lower()
+            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", job, "cardanoFromPublicKeyStakingQLineEdit")
+            return self._root(hd_kwargs, "from_public_key",
+                public_key=self._validate_and_get("Public Key", job, "cardanoFromPublicKeyQLineEdit")
             )
-        elif dump_from == "seed":
-            hd_kwargs["passphrase"] = self.ui.cardanoFromSeedPassphraseQLineEdit.text()
-            hd_kwargs["cardano_type"] = self.ui.cardanoFromSeedCardanoTypeQComboBox.currentText().lower()
-            hd_kwargs["address_type"] = self.ui.cardanoFromSeedAddressTypeQComboBox.currentText().lower()
-            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", self.ui.cardanoFromSeedStakingQLineEdit)
-            return HDWallet(**hd_kwargs).from_seed(
+        elif job.dump_from == "seed":
+            hd_kwargs["passphrase"] = job.text("cardanoFromSeedPassphraseQLineEdit")
+            hd_kwargs["cardano_type"] = job.text("cardanoFromSeedCardanoTypeQComboBox").lower()
+            hd_kwargs["address_type"] = job.text("cardanoFromSeedAddressTypeQComboBox").lower()
+            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", job, "cardanoFromSeedStakingQLineEdit")
+            return self._root(hd_kwargs, "from_seed",
                 CardanoSeed(
-                    seed=self._validate_and_get("Seed", self.ui.cardanoFromSeedQLineEdit)
+                    seed=self._validate_and_get("Seed", job, "cardanoFromSeedQLineEdit")
                 )
             )
-        elif dump_from == "xprivate key":
-            hd_kwargs["cardano_type"] = self.ui.cardanoFromXPrivateKeyCardanoTypeQComboBox.currentText().lower()
-            hd_kwargs["address_type"] = self.ui.cardanoFromXPrivateKeyAddressTypeQComboBox.currentText().lower()
-            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", self.ui.cardanoFromXPrivateKeyStakingQLineEdit)
-            return HDWallet(**hd_kwargs).from_xprivate_key(
-                xprivate_key=self._validate_and_get("XPrivate Key", self.ui.cardanoFromXPrivateKeyQLineEdit),
-                strict=self.ui.cardanoFromXPrivateKeyStrictQCheckBox.isChecked()
+        elif job.dump_from == "xprivate key":
+            hd_kwargs["cardano_type"] = job.text("cardanoFromXPrivateKeyCardanoTypeQComboBox").lower()
+            hd_kwargs["address_type"] = job.text("cardanoFromXPrivateKeyAddressTypeQComboBox").lower()
+            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", job, "cardanoFromXPrivateKeyStakingQLineEdit")
+            return self._root(hd_kwargs, "from_xprivate_key",
+                xprivate_key=self._validate_and_get("XPrivate Key", job, "cardanoFromXPrivateKeyQLineEdit"),
+                strict=job.checked("cardanoFromXPrivateKeyStrictQCheckBox")
             )
-        elif dump_from == "xpublic key":
-            hd_kwargs["cardano_type"] = self.ui.cardanoFromXPublicKeyCardanoTypeQComboBox.currentText().lower()
-            hd_kwargs["address_type"] = self.ui.cardanoFromXPublicKeyAddressTypeQComboBox.currentText().lower()
-            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", self.ui.cardanoFromXPublicKeyStakingQLineEdit)
-            return HDWallet(**hd_kwargs).from_xpublic_key(
-                xpublic_key=self._validate_and_get("XPublic", self.ui.cardanoFromXPublicKeyQLineEdit),
-                strict=self.ui.cardanoFromXPublicKeyStrictQCheckBox.isChecked()
+        elif job.dump_from == "xpublic key":
+            hd_kwargs["cardano_type"] = job.text("cardanoFromXPublicKeyCardanoTypeQComboBox").lower()
+            hd_kwargs["address_type"] = job.text("cardanoFromXPublicKeyAddressTypeQComboBox").lower()
+            hd_kwargs["staking_public_key"] = self._validate_and_get("Staking Public Key", job, "cardanoFromXPublicKeyStakingQLineEdit")
+            return self._root(hd_kwargs, "from_xpublic_key",
+                xpublic_key=self._validate_and_get("XPublic", job, "cardanoFromXPublicKeyQLineEdit"),
+                strict=job.checked("cardanoFromXPublicKeyStrictQCheckBox")
             )
 
-    def _dump_ev1(self, dump_from, hd_kwargs):
-        if dump_from == "entropy":
-            hd_kwargs["language"] = self.ui.electrumV1FromEntropyLanguageQComboBox.currentText().lower()
-            hd_kwargs["public_key_type"] = self.ui.electrumV1FromEntropyPublicKeyTypeQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_entropy(
+    def _dump_ev1(self, job, hd_kwargs):
+        if job.dump_from == "entropy":
+            hd_kwargs["language"] = job.text("electrumV1FromEntropyLanguageQComboBox").lower()
+            hd_kwargs["public_key_type"] = job.text("electrumV1FromEntropyPublicKeyTypeQComboBox").lower()
+            return self._root(hd_kwargs, "from_entropy",
                 ElectrumV1Entropy(
-                    entropy=self._validate_and_get("Entropy", self.ui.electrumV1FromEntropyQLineEdit)
+                    entropy=self._validate_and_get("Entropy", job, "electrumV1FromEntropyQLineEdit")
                 )
             )
-        elif dump_from == "mnemonic":
-            hd_kwargs["public_key_type"] = self.ui.electrumV1FromMnemonicPublicKeyTypeQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_mnemonic(
+        elif job.dump_from == "mnemonic":
+            hd_kwargs["public_key_type"] = job.text("electrumV1FromMnemonicPublicKeyTypeQComboBox").lower()
+            return self._root(hd_kwargs, "from_mnemonic",
                 ElectrumV1Mnemonic(
-                    mnemonic=self._validate_and_get("Mnemonic", self.ui.electrumV1FromMnemonicGenerateQLineEdit)
+                    mnemonic=self._validate_and_get("Mnemonic", job, "electrumV1FromMnemonicGenerateQLineEdit")
                 )
             )
 
-        elif dump_from == "private key":
-            hd_kwargs["public_key_type"] = self.ui.electrumV1FromPrivateKeyPublicKeyTypeQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_private_key(
-                private_key=self._validate_and_get("Private Key", self.ui.electrumV1FromPrivateKeyQLineEdit)
+        elif job.dump_from == "private key":
+            hd_kwargs["public_key_type"] = job.text("electrumV1FromPrivateKeyPublicKeyTypeQComboBox").lower()
+            return self._root(hd_kwargs, "from_private_key",
+                private_key=self._validate_and_get("Private Key", job, "electrumV1FromPrivateKeyQLineEdit")
             )
-        elif dump_from == "public key":
-            hd_kwargs["public_key_type"] = self.ui.electrumV1FromPublicKeyPublicKeyTypeQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_public_key(
-                public_key=self._validate_and_get("Public Key", self.ui.electrumV1FromPublicKeyQLineEdit)
+        elif job.dump_from == "public key":
+            hd_kwargs["public_key_type"] = job.text("electrumV1FromPublicKeyPublicKeyTypeQComboBox").lower()
+            return self._root(hd_kwargs, "from_public_key",
+                public_key=self._validate_and_get("Public Key", job, "electrumV1FromPublicKeyQLineEdit")
             )
-        elif dump_from == "seed":
-            hd_kwargs["public_key_type"] = self.ui.electrumV1FromSeedPublicKeyTypeQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_seed(
+        elif job.dump_from == "seed":
+            hd_kwargs["public_key_type"] = job.text("electrumV1FromSeedPublicKeyTypeQComboBox").lower()
+            return self._root(hd_kwargs, "from_seed",
                 ElectrumV1Seed(
-                    seed=self._validate_and_get("Seed", self.ui.electrumV1FromSeedQLineEdit)
+                    seed=self._validate_and_get("Seed", job, "electrumV1FromSeedQLineEdit")
                 )
             )
-        elif dump_from == "wif":
-            hd_kwargs["public_key_type"] = self.ui.electrumV1FromWIFPublicKeyTypeQComboBox.currentText().lower()
-            wif = self._validate_and_get("WIF", self.ui.electrumV1FromWIFQLineEdit)
+        elif job.dump_from == "wif":
+            hd_kwargs["public_key_type"] = job.text("electrumV1FromWIFPublicKeyTypeQComboBox").lower()
+            wif = self._validate_and_get("WIF", job, "electrumV1FromWIFQLineEdit")
 
-            if self.ui.electrumV1FromWIFBIP38PassphraseQCheckBox.isChecked():
+            if job.checked("electrumV1FromWIFBIP38PassphraseQCheckBox"):
                 crypto_name = hd_kwargs["cryptocurrency"].NAME
-                passphrase = self.ui.electrumV1FromWIFBIP38PassphraseQLineEdit.text()
+                passphrase = job.text("electrumV1FromWIFBIP38PassphraseQLineEdit")
 
                 bip38: BIP38 = BIP38(
                   cryptocurrency=self.bip38_cryptocurrencies[crypto_name] , network=hd_kwargs["network"]
                 )
                 wif = bip38.decrypt(encrypted_wif=wif, passphrase=passphrase)
 
-            return HDWallet(**hd_kwargs).from_wif(
+            return self._root(hd_kwargs, "from_wif",
                 wif=wif
             )
 
-    def _dump_ev2(self, dump_from, hd_kwargs):
-        if dump_from == "entropy":
-            hd_kwargs["mode"] = self.ui.electrumV2FromEntropyModeQComboBox.currentText().lower()
-            hd_kwargs["mnemonic_type"] = self.ui.electrumV2FromEntropyMnemonicTypeQComboBox.currentText().lower()
-            hd_kwargs["language"] = self.ui.electrumV2FromEntropyLanguageQComboBox.currentText().lower()
-            hd_kwargs["public_key_type"] = self.ui.electrumV2FromEntropyPublicKeyTypeQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_entropy(
+    def _dump_ev2(self, job, hd_kwargs):
+        if job.dump_from == "entropy":
+            hd_kwargs["mode"] = job.text("electrumV2FromEntropyModeQComboBox").lower()
+            hd_kwargs["mnemonic_type"] = job.text("electrumV2FromEntropyMnemonicTypeQComboBox").lower()
+            hd_kwargs["language"] = job.text("electrumV2FromEntropyLanguageQComboBox").lower()
+            hd_kwargs["public_key_type"] = job.text("electrumV2FromEntropyPublicKeyTypeQComboBox").lower()
+            return self._root(hd_kwargs, "from_entropy",
                 ElectrumV2Entropy(
-                    entropy=self._validate_and_get("Entropy", self.ui.electrumV2FromEntropyGenerateQLineEdit)
+                    entropy=self._validate_and_get("Entropy", job, "electrumV2FromEntropyGenerateQLineEdit")
                 )
             )
 
-        elif dump_from == "mnemonic":
-            mnemonic_type = self.ui.electrumV2FromMnemonicMnemonicTypeQComboBox.currentText().lower()
-            hd_kwargs["mode"] = self.ui.electrumV2FromMnemonicModeQComboBox.currentText().lower()
+        elif job.dump_from == "mnemonic":
+            mnemonic_type = job.text("electrumV2FromMnemonicMnemonicTypeQComboBox").lower()
+            hd_kwargs["mode"] = job.text("electrumV2FromMnemonicModeQComboBox").lower()
             hd_kwargs["mnemonic_type"] = mnemonic_type
-            hd_kwargs["public_key_type"] = self.ui.electrumV2FromMnemonicPublicKeyTypeQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_mnemonic(
+            hd_kwargs["public_key_type"] = job.text("electrumV2FromMnemonicPublicKeyTypeQComboBox").lower()
+            return self._root(hd_kwargs, "from_mnemonic",
                 ElectrumV2Mnemonic(
-                    mnemonic=self._validate_and_get("Mnemonic", self.ui.electrumV2FromMnemonicGenerateQLineEdit),
+                    mnemonic=self._validate_and_get("Mnemonic", job, "electrumV2FromMnemonicGenerateQLineEdit"),
                     mnemonic_type=mnemonic_type
                 )
             )
 
-        elif dump_from == "seed":
-            hd_kwargs["mode"] = self.ui.electrumV2FromSeedModeQComboBox.currentText().lower()
-            hd_kwargs["public_key_type"] = self.ui.electrumV2FromSeedPublicKeyTypeQComboBox.currentText().lower()
-            return HDWallet(**hd_kwargs).from_seed(
+        elif job.dump_from == "seed":
+            hd_kwargs["mode"] = job.text("electrumV2FromSeedModeQComboBox").lower()
+            hd_kwargs["public_key_type"] = job.text("electrumV2FromSeedPublicKeyTypeQComboBox").lower()
+            return self._root(hd_kwargs, "from_seed",
                 ElectrumV2Seed(
-                    seed=self._validate_and_get("Seed", self.ui.electrumV2FromSeedsQLineEdit)
+                    seed=self._validate_and_get("Seed", job, "electrumV2FromSeedsQLineEdit")
                 )
             )
 
-    def _dump_monero(self, dump_from, hd_kwargs):
-        if dump_from == "entropy":
-            hd_kwargs["language"] = self.ui.moneroFromEntropyLanguageQComboBox.currentText().lower()
-            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", self.ui.moneroFromEntropyPaymentIDQLineEdit).lower()
-            return HDWallet(**hd_kwargs).from_entropy(
+    def _dump_monero(self, job, hd_kwargs):
+        if job.dump_from == "entropy":
+            hd_kwargs["language"] = job.text("moneroFromEntropyLanguageQComboBox").lower()
+            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", job, "moneroFromEntropyPaymentIDQLineEdit").lower()
+            return self._root(hd_kwargs, "from_entropy",
                 MoneroEntropy(
-                    entropy=self._validate_and_get("Entropy", self.ui.moneroFromEntropyQLineEdit)
+                    entropy=self._validate_and_get("Entropy", job, "moneroFromEntropyQLineEdit")
                 )
             )
 
-        elif dump_from == "mnemonic":
-            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", self.ui.moneroFromMnemonicPaymentIDQLineEdit).lower()
-            return HDWallet(**hd_kwargs).from_mnemonic(
+        elif job.dump_from == "mnemonic":
+            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", job, "moneroFromMnemonicPaymentIDQLineEdit").lower()
+            return self._root(hd_kwargs, "from_mnemonic",
                 MoneroMnemonic(
-                    mnemonic=self._validate_and_get("Mnemonic", self.ui.moneroFromMnemonicQLineEdit)
+                    mnemonic=self._validate_and_get("Mnemonic", job, "moneroFromMnemonicQLineEdit")
                 )
             )
 
-        elif dump_from == "private key":
-            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", self.ui.moneroFromMnemonicPaymentIDQLineEdit).lower()
-            return HDWallet(**hd_kwargs).from_private_key(
-                private_key=self._validate_and_get("Private Key", self.ui.moneroFromPrivateKeyQLineEdit).lower()
+        elif job.dump_from == "private key":
+            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", job, "moneroFromMnemonicPaymentIDQLineEdit").lower()
+            return self._root(hd_kwargs, "from_private_key",
+                private_key=self._validate_and_get("Private Key", job, "moneroFromPrivateKeyQLineEdit").lower()
             )
 
-        elif dump_from == "seed":
-            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", self.ui.moneroFromSeedPaymentIDQLineEdit).lower()
-            return HDWallet(**hd_kwargs).from_seed(
+        elif job.dump_from == "seed":
+            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", job, "moneroFromSeedPaymentIDQLineEdit").lower()
+            return self._root(hd_kwargs, "from_seed",
                 MoneroSeed(
-                    seed=self._validate_and_get("Seed", self.ui.moneroFromSeedQLineEdit)
+                    seed=self._validate_and_get("Seed", job, "moneroFromSeedQLineEdit")
                 )
             )
 
-        elif dump_from == "spend private key":
-            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", self.ui.moneroFromSpendPrivateKeyPaymentIDQLineEdit).lower()
-            return HDWallet(**hd_kwargs).from_spend_private_key(
-                spend_private_key=self._validate_and_get("Spend Private Key", self.ui.moneroFromSpendPrivateKeyQLineEdit).lower()
+        elif job.dump_from == "spend private key":
+            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", job, "moneroFromSpendPrivateKeyPaymentIDQLineEdit").lower()
+            return self._root(hd_kwargs, "from_spend_private_key",
+                spend_private_key=self._validate_and_get("Spend Private Key", job, "moneroFromSpendPrivateKeyQLineEdit").lower()
             )
 
-        elif dump_from == "watch only":
-            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", self.ui.moneroFromWatchOnlyPaymentIDQLineEdit).lower()
-            return HDWallet(**hd_kwargs).from_watch_only(
-                view_private_key=self._validate_and_get("View Private Key", self.ui.moneroFromWatchOnlyViewPrivateKeyQLIneEdit),
-                spend_public_key=self._validate_and_get("Spend Public Key", self.ui.moneroFromWatchOnlySpendPublicKeyQLineEdit)
+        elif job.dump_from == "watch only":
+            hd_kwargs["payment_id"] = self._validate_and_get("Payment ID", job, "moneroFromWatchOnlyPaymentIDQLineEdit").lower()
+            return self._root(hd_kwargs, "from_watch_only",
+                view_private_key=self._validate_and_get("View Private Key", job, "moneroFromWatchOnlyViewPrivateKeyQLIneEdit"),
+                spend_public_key=self._validate_and_get("Spend Public Key", job, "moneroFromWatchOnlySpendPublicKeyQLineEdit")
             )
 
+    def _root(self, hd_kwargs, method, *args, **kwargs):
+        # Built by the caller, from the root cache or in a batch worker process
+        return RootRecipe(hd_kwargs=hd_kwargs, method=method, args=args, kwargs=kwargs)
+
     def _dumps_crypto_change(self):
 
         crypto = self.ui.dumpsCryptocurrencyQComboBox.currentText()
@@ -1154,8 +2361,22 @@ class Dumps:
                 combo_box.setCurrentText("BIP39")
                 container.setEnabled(False) 
 
+    def _dump_compression_changed(self, name):
+        compression = COMPRESSIONS.get(name)
+        self.ui.dumpsCompressionLevelQSpinBox.setEnabled(compression is not None)
+        if compression is not None:
+            self.ui.dumpsCompressionLevelQSpinBox.setRange(compression.levels.start, compression.levels.stop - 1)
+            self.ui.dumpsCompressionLevelQSpinBox.setValue(compression.level)
+
     def _dump_format_changed(self, export_format):
-        if export_format == "CSV":
+        # Table formats are written by their own library, Parquet compresses itself
+        self.ui.dumpsCompressionQComboBox.setEnabled(export_format not in SINKS)
+        # Table exports keep no checkpoint
+        self.ui.dumpsResumeQPushButton.setEnabled(export_format not in SINKS)
+        self.ui.dumpsCompressionLevelQSpinBox.setEnabled(
+            export_format not in SINKS and self.ui.dumpsCompressionQComboBox.currentText() in COMPRESSIONS
+        )
+        if export_format != "JSON":
             self.ui.dumpsExcludeOrIncludeQLabel.setText("Include")
             self.__default_csv_include()
         else:
@@ -1255,7 +2476,7 @@ class Dumps:
             semantic_combo.setCurrentText(default_version)
 
 
-        if self.ui.dumpsFormatQComboBox.currentText() == "CSV":
+        if self.ui.dumpsFormatQComboBox.currentText() != "JSON":
             self.__default_csv_include()
         else:
             self.ui.dumpsExcludeOrIncludeQLineEdit.setText("root")
@@ -1337,12 +2558,23 @@ class Dumps:
         else:
             lable.setText("Wallet Import Format")
 
-    def _update_terminal_state(self, stop_btn_enable, terminal_cancelled):
-        self.ui.stopTerminalQPushButton.setEnabled(stop_btn_enable)
-        self.terminal_cancelled = terminal_cancelled
+    def _stop_dumps(self):
+        for cancelled in self.running_dumps.values():
+            cancelled.set()
+        self._update_terminal_state()
 
-    def _validate_and_get(self, rule_name, line_edit):
-        out = line_edit.text();
+    def _quit_dumps(self):
+        if self.running_dumps:
+            self._stop_dumps()
+            QThreadPool.globalInstance().waitForDone(5000)
+
+    def _update_terminal_state(self):
+        self.ui.stopTerminalQPushButton.setEnabled(
+            any(not cancelled.is_set() for cancelled in self.running_dumps.values())
+        )
+
+    def _validate_and_get(self, rule_name, job, name):
+        out = job.root if job.root is not None and rule_name in self.root_rules else job.text(name)
         rule = self.validation_rules.get(rule_name, {})
 
         is_required = rule.get("required", True);
@@ -1351,7 +2583,7 @@ class Dumps:
         max_len = rule.get("max_length")
         pattern = rule.get("pattern")
 
-        if out == "" and line_edit.isEnabled() and is_required:
+        if out == "" and job.enabled(name) and is_required:
             raise Error(f"{rule_name} is required")
         elif min_len != None and min_len > len(out):
             raise Error(f"{rule_name} must be at least {min_len} characters long")
@@ -1362,5 +2594,57 @@ class Dumps:
 
         return out
 
+@dataclass(frozen=True, slots=True)
+class DumpJob:
+    """
+    Immutable snapshot of the Dumps form, taken on the GUI thread.
+
+    ``inputs`` holds ``(object name, text, checked, enabled)`` for every line edit,
+    combo box and check box of the selected HD and derivation pages. ``mode`` is set by
+    the button that started the dump, one of ``dump``, ``encrypted``, ``fanout``, ``batch``,
+    ``convert``, ``discover``, ``search`` or ``bip38``.
+    """
+    cryptocurrency: str
+    hd: str
+    dump_from: str
+    network: str
+    format: str
+    exclude_include: Tuple[str, ...]
+    derivation: Optional[str]
+    inputs: Tuple[Tuple[str, str, bool, bool], ...]
+    mode: str = "dump"
+    save_filepath: Optional[str] = None
+    resume: bool = False
+    shard: Optional[Tuple[int, int]] = None
+    compression: Optional[str] = None
+    compression_level: int = 0
+    roots_filepath: Optional[str] = None
+    root: Optional[str] = None
+    coins: Tuple[str, ...] = ()
+    addresses_filepath: Optional[str] = None
+    gap_limit: int = 20
+    targets: Tuple[str, ...] = ()
+    index: bool = False
+    bip38_passphrase: Optional[str] = None
+    wifs_filepath: Optional[str] = None
+    bip38_mode: Optional[str] = None
+    keys_filepath: Optional[str] = None
+
+    def __input(self, name: str) -> Tuple[str, str, bool, bool]:
+        for _input in self.inputs:
+            if _input[0] == name:
+                return _input
+        raise KeyError(f"Unknown input '{name}'")
+
+    def text(self, name: str) -> str:
+        return self.__input(name)[1]
+
+    def checked(self, name: str) -> bool:
+        return self.__input(name)[2]
+
+    def enabled(self, name: str) -> bool:
+        return self.__input(name)[3]
+
+
 class ExportFormatError(Exception):
     pass
\ No newline at end of file
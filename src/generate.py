@@ -6,11 +6,14 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+import os
+import time
 import string
-from random import choice
+import functools
 
-from PySide6.QtGui import QIntValidator, QRegularExpressionValidator, QColor
-from PySide6.QtCore import QRegularExpression
+from PySide6.QtWidgets import QPushButton, QFileDialog
+from PySide6.QtGui import QIntValidator, QRegularExpressionValidator, QColor, QCursor
+from PySide6.QtCore import QRegularExpression, QThreadPool, QStringListModel, Qt
 
 
 from hdwallet.cryptocurrencies import (
@@ -48,6 +51,16 @@ from hdwallet.seeds import (
 from src.utils import (
     update_border_class, clear_borders_class, normalized_mnemonic_types
 )
+from src.utils.worker import (
+    Worker, WorkerSignals
+)
+from src.utils.pool import imap_ordered
+from src.utils.seeds import (
+    seed_from_mnemonic, batch_seeds
+)
+from src.utils.passphrase import (
+    generate_passphrases, passphrase_entropy
+)
 
 class Generate:
     def __init__(self, app):
@@ -61,8 +74,15 @@ class Generate:
             self.ui.generateLengthAndPassphraseQGroupBox
         ]
 
+        # Workers of the actions currently running in the pool, and the latest
+        # request received for each of them while they were busy
+        self.running_actions = {}
+        self.pending_actions = {}
 
     def _setup_generate_stack(self):
+        # Combo box item lists, built once per client and shared between switches
+        self.combo_models = {}
+
         self.ui.generateEntropyClientQComboBox.addItems(ENTROPIES.names())
         self.ui.generateEntropyClientQComboBox.currentTextChanged.connect(self._generate_entropy_change)
         self.ui.generateEntropyClientQComboBox.setCurrentText(BIP39Entropy.name())
@@ -83,6 +103,17 @@ class Generate:
         self.ui.generateSeedCardanoTypeQComboBox.currentTextChanged.connect(self._cardano_type_changed)
         self.ui.generateSeedPassphraseGenerateQPushButton.clicked.connect(self._generate_seed)
 
+        self.ui.generateSeedBatchQPushButton = QPushButton("Batch", self.ui.generateSeedClientMnemonicContainerQFrame)
+        self.ui.generateSeedBatchQPushButton.setObjectName("generateSeedBatchQPushButton")
+        self.ui.generateSeedBatchQPushButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.ui.generateSeedBatchQPushButton.setToolTip(
+            "Derive seeds for a file of mnemonics, one per line with an optional tab separated passphrase"
+        )
+        self.ui.generateSeedClientMnemonicContainerQFrameHLayout.addWidget(
+            self.ui.generateSeedBatchQPushButton, 0, Qt.AlignmentFlag.AlignBottom
+        )
+        self.ui.generateSeedBatchQPushButton.clicked.connect(self._generate_seeds_batch)
+
         self.ui.generateLengthQLineEdit.setText("12")
         self.ui.generateLengthQLineEdit.setValidator(QRegularExpressionValidator(QRegularExpression(r'^[1-9]\d{0,2}$')))
 
@@ -102,39 +133,43 @@ class Generate:
         self.ui.generatePassphraseQPushButton.clicked.connect(self._generate_passphrase)
 
     def _generate_entropy_change(self, entropy_client):
-        self.ui.generateEntropyStrengthQComboBox.clear()
-        self.ui.generateEntropyStrengthQComboBox.addItems(
-            map(
-                str, ENTROPIES.entropy(entropy_client).strengths
-            )
+        self._set_combo_model(
+            self.ui.generateEntropyStrengthQComboBox, ("strengths", entropy_client),
+            lambda: map(str, ENTROPIES.entropy(entropy_client).strengths)
         )
         self.ui.generateEntropyStrengthQComboBox.setCurrentIndex(0)
 
+    def _set_combo_model(self, combo_box, key, items):
+        model = self.combo_models.get(key)
+        if model is None:
+            # Parented to the window, not the combo box, so switching models
+            # does not delete the cached one
+            model = self.combo_models[key] = QStringListModel(list(items()), self.app)
+        if combo_box.model() is not model:
+            combo_box.setModel(model)
+
     def _generate_entropy(self):
         clear_borders_class(self.generate_group_boxes)
         entropy_client = self.ui.generateEntropyClientQComboBox.currentText()
         strength = int(self.ui.generateEntropyStrengthQComboBox.currentText())
-        gen_entropy = ENTROPIES.entropy(entropy_client).generate(strength=strength)
 
-        output = {
-            "client": entropy_client,
-            "entropy": gen_entropy,
-            "strength": strength
-        }
+        def generate():
+            return {
+                "client": entropy_client,
+                "entropy": ENTROPIES.entropy(entropy_client).generate(strength=strength),
+                "strength": strength
+            }
 
-        self.app.println(output)
+        self._submit("entropy", generate, self.ui.generateClientAndStrengthContainerQGroupBox)
 
     def _generate_mnemonic_change(self, mnemonic_client):
-        self.ui.generateMnemonicWordsQComboBox.clear()
-        self.ui.generateMnemonicLanguageQComboBox.clear()
-
-        self.ui.generateMnemonicWordsQComboBox.addItems(
-            map(
-                str, MNEMONICS.mnemonic(mnemonic_client).words_list
-            )
+        self._set_combo_model(
+            self.ui.generateMnemonicWordsQComboBox, ("words", mnemonic_client),
+            lambda: map(str, MNEMONICS.mnemonic(mnemonic_client).words_list)
         )
-        self.ui.generateMnemonicLanguageQComboBox.addItems(
-            [i.title() for i in MNEMONICS.mnemonic(mnemonic_client).languages]
+        self._set_combo_model(
+            self.ui.generateMnemonicLanguageQComboBox, ("languages", mnemonic_client),
+            lambda: [i.title() for i in MNEMONICS.mnemonic(mnemonic_client).languages]
         )
 
         self.ui.generateMnemonicWordsQComboBox.setCurrentIndex(0)
@@ -166,38 +201,33 @@ class Generate:
         word = self.ui.generateMnemonicWordsQComboBox.currentText()
         entropy = self.ui.generateSeedMnemonicEntropyQLineEdit.text()
         lang = self.ui.generateMnemonicLanguageQComboBox.currentText().lower()
+        from_words = self.ui.generateMnemonicWordsQRadioButton.isChecked()
 
         kwargs = {
             "language": lang
         }
-        try:
-            if ElectrumV2Seed.name() == mnemonic_client:
-                kwargs["mnemonic_type"] = self.ui.generateMnemonicTypeQComboBox.currentText().lower()
+        if ElectrumV2Seed.name() == mnemonic_client:
+            kwargs["mnemonic_type"] = self.ui.generateMnemonicTypeQComboBox.currentText().lower()
 
-            if self.ui.generateMnemonicWordsQRadioButton.isChecked():
-                kwargs["words"] = int(word)
-                gen_mnemonic = MNEMONICS.mnemonic(mnemonic_client).from_words(**kwargs)
-            else:
-                if len(entropy) == 0:
-                    update_border_class(self.ui.generateMnemonicClientWordsLanguageContainerQGroupBox, "hdwError")
-                    raise Exception("Entropy is required")
-                
-                kwargs["entropy"] = entropy
-                gen_mnemonic = MNEMONICS.mnemonic(mnemonic_client).from_entropy(**kwargs)
-
-        except Exception as e:
-            output = f"ERROR: {e}"
+        if not from_words and len(entropy) == 0:
             update_border_class(self.ui.generateMnemonicClientWordsLanguageContainerQGroupBox, "hdwError")
+            self.app.println("ERROR: Entropy is required")
+            return None
 
-        else:
-            output = {
+        def generate():
+            if from_words:
+                gen_mnemonic = MNEMONICS.mnemonic(mnemonic_client).from_words(words=int(word), **kwargs)
+            else:
+                gen_mnemonic = MNEMONICS.mnemonic(mnemonic_client).from_entropy(entropy=entropy, **kwargs)
+
+            return {
                 "client": mnemonic_client,
                 "mnemonic": gen_mnemonic,
                 "language": lang,
                 "words": len(gen_mnemonic.split(" "))
             }
 
-        self.app.println(output)
+        self._submit("mnemonic", generate, self.ui.generateMnemonicClientWordsLanguageContainerQGroupBox)
 
     def _generate_seed_change(self, seed_client):
         self.ui.generateSeedCardanoTypeQComboBox.setCurrentIndex(-1)
@@ -234,31 +264,75 @@ class Generate:
         cardano_type = self.ui.generateSeedCardanoTypeQComboBox.currentText().lower()
         mnemonic = self.ui.generateSeedMnemonicQLineEdit.text()
         passphrase = self.ui.generateSeedPassphraseGenerateQLineEdit.text()
-        output = None
-
-        try:
-            if len(mnemonic) == 0:
-                update_border_class(self.ui.seedGroupBoxContainerQGroupBox, "hdwError")
-                raise Exception("Mnemonic is required")
-            elif CardanoSeed.name() == seed_client:
-                seed = CardanoSeed.from_mnemonic(mnemonic=mnemonic, cardano_type=cardano_type, passphrase=passphrase)
-            elif ElectrumV2Seed.name() == seed_client:
-                seed = ElectrumV2Seed.from_mnemonic(mnemonic=mnemonic, mnemonic_type=mnemonic_type,
-                                                    passphrase=passphrase)
-            elif BIP39Seed.name() == seed_client:
-                seed = SEEDS.seed(seed_client).from_mnemonic(mnemonic=mnemonic, passphrase=passphrase)
-            else:
-                seed = SEEDS.seed(seed_client).from_mnemonic(mnemonic=mnemonic)
-        except Exception as e:
-            output = f"ERROR: {e}"
+
+        if len(mnemonic) == 0:
             update_border_class(self.ui.seedGroupBoxContainerQGroupBox, "hdwError")
-        else:
-            output = {
+            self.app.println("ERROR: Mnemonic is required")
+            return None
+
+        def generate():
+            return {
                 "client": seed_client,
-                "seed": seed
+                "seed": seed_from_mnemonic(
+                    seed_client=seed_client, mnemonic=mnemonic, passphrase=passphrase,
+                    mnemonic_type=mnemonic_type, cardano_type=cardano_type
+                )
             }
 
-        self.app.println(output)
+        self._submit("seed", generate, self.ui.seedGroupBoxContainerQGroupBox)
+
+    def _generate_seeds_batch(self):
+        clear_borders_class(self.generate_group_boxes)
+        seed_client = self.ui.generateSeedClientQComboBox.currentText()
+        mnemonic_type = self.ui.generateSeedMnemonicTypeQComboBox.currentText().lower()
+        cardano_type = self.ui.generateSeedCardanoTypeQComboBox.currentText().lower()
+
+        input_path, _ = QFileDialog.getOpenFileName(
+            None, "Open Mnemonics", os.path.expanduser("~"), "Text Files (*.txt);;All Files (*)"
+        )
+        if input_path == "":
+            return None
+        output_path, _ = QFileDialog.getSaveFileName(
+            None, "Save Seeds", f"{os.path.splitext(input_path)[0]}-seeds.txt", "Text Files (*.txt)"
+        )
+        if output_path == "":
+            return None
+
+        progress = WorkerSignals()
+        progress.interval_output.connect(self.app.println)
+
+        def generate():
+            # PBKDF2 is CPU bound, fan the lines out over one process per core and
+            # write the seeds back in input order as they complete
+            seeds, started, reported = 0, time.monotonic(), time.monotonic()
+            with open(input_path, "r", encoding="utf-8") as mnemonics, \
+                    open(output_path, "w", encoding="utf-8") as output:
+                for seed in imap_ordered(
+                    functools.partial(
+                        batch_seeds, seed_client=seed_client, mnemonic_type=mnemonic_type, cardano_type=cardano_type
+                    ),
+                    mnemonics,
+                    chunksize=32
+                ):
+                    output.write(f"{seed}\n")
+                    seeds += 1
+                    if time.monotonic() - reported >= 1:
+                        reported = time.monotonic()
+                        progress.interval_output.emit(
+                            f"{seeds} seeds, {seeds / (reported - started):.1f} seeds/second"
+                        )
+
+            elapsed = max(time.monotonic() - started, 1e-9)
+            return {
+                "client": seed_client,
+                "input": input_path,
+                "output": output_path,
+                "seeds": seeds,
+                "seconds": round(elapsed, 3),
+                "seeds_per_second": round(seeds / elapsed, 1)
+            }
+
+        self._submit("batch", generate, self.ui.seedGroupBoxContainerQGroupBox)
 
     def _generate_passphrase(self):
         clear_borders_class(self.generate_group_boxes)
@@ -287,12 +361,36 @@ class Generate:
         characters += string.digits if digit else ''
         characters += string.punctuation if special else ''
 
-        output = None
-        pp = "".join(choice(characters) for _ in range(length))
+        def generate():
+            return {
+                "passphrase": generate_passphrases(characters, length)[0],
+                "length": length,
+                "entropy": round(passphrase_entropy(characters, length), 2)
+            }
 
-        output = {
-            "passphrase": pp,
-            "length": length
-        }
+        self._submit("passphrase", generate, self.ui.generateLengthAndPassphraseQGroupBox)
+
+    def _submit(self, action, function, errbox):
+        # Clicks that arrive while the same action is still running are
+        # coalesced, only the most recent one is run once the worker is done
+        if action in self.running_actions:
+            self.pending_actions[action] = (function, errbox)
+            return None
+
+        job = Worker(function)
+        self.running_actions[action] = job
+        job.signals.interval_finished.connect(self.app.println)
+        job.signals.interval_error.connect(functools.partial(self._action_error, errbox))
+        job.signals.interval_finished.connect(lambda _: self._action_ended(action))
+        job.signals.interval_error.connect(lambda _: self._action_ended(action))
+
+        QThreadPool.globalInstance().start(job)
+
+    def _action_error(self, errbox, error):
+        self.app.println(f"ERROR: {error}")
+        update_border_class(errbox, "hdwError")
 
-        self.app.println(output)
+    def _action_ended(self, action):
+        self.running_actions.pop(action, None)
+        if action in self.pending_actions:
+            self._submit(action, *self.pending_actions.pop(action))
@@ -7,10 +7,10 @@
 # file COPYING or https://opensource.org/license/mit
 
 from PySide6.QtCore import (
-    QThreadPool, QRegularExpression, Slot, Qt, QSize, QUrl
+    QThreadPool, QRegularExpression, Qt, QSize, QUrl
 )
 from PySide6.QtWidgets import (
-    QSizePolicy, QWidget, QPushButton, QLineEdit, QPushButton
+    QSizePolicy, QWidget, QPushButton, QPushButton
 )
 from PySide6.QtGui import (
     QRegularExpressionValidator, QCursor, QDesktopServices
@@ -19,7 +19,6 @@ from click.testing import CliRunner
 from hdwallet.cli.__main__ import cli_main
 
 import os
-import re
 import shlex
 import functools
 
@@ -29,7 +28,9 @@ from src.widgets.donation import Donation
 from src.utils.worker import Worker
 from src.generate import Generate
 from src.dumps import Dumps
+from src.commands import COMMANDS, run_command
 from src.utils import clear_borders_class
+from src.utils.derivation import INDEXES_PATTERN
 
 class MainApplication:
     """
@@ -55,6 +56,7 @@ class MainApplication:
             self.ui.dumpsStackQGroupBox,
             self.ui.derivationQGroupBox,
             self.ui.dumpsFormatKeysContainerQGroupBox,
+            self.ui.dumpsToolsContainerQGroupBox,
             self.ui.generateClientAndStrengthContainerQGroupBox,
             self.ui.generateMnemonicClientWordsLanguageContainerQGroupBox,
             self.ui.seedGroupBoxContainerQGroupBox,
@@ -159,28 +161,18 @@ class MainApplication:
 
     def __validate_inputs(self, line_edits: list) -> None:
         """
-        Validate and filter input fields for line edits.
+        Restrict derivation index fields to index expressions, e.g. ``5``, ``0-99``,
+        ``0-100000:10``, ``0,5,9-20``, ``0-99,!50`` or ``sample(0-2^31,1000)``.
 
         :param line_edits: A list of QLineEdit widgets to validate.
         """
-        def validate_and_filter(input_string: str) -> Optional[str]:
-            pattern = r'^\d-\d(?!-)$'
-            return input_string if re.match(pattern, input_string) else None
-
-        @Slot()
-        def text_changed_callback(line_edit: QLineEdit) -> None:
-            def callback() -> None:
-                input_text = line_edit.text()
-                filtered_text = validate_and_filter(input_text)
-                if filtered_text is None:
-                    line_edit.setValidator(QRegularExpressionValidator(QRegularExpression("[0-9]+-[0-9]+(?!-)")))
-                else:
-                    line_edit.setValidator(None)
-
-            callback()
-
         for line_edit in line_edits:
-            line_edit.textChanged.connect(text_changed_callback(line_edit))
+            line_edit.setValidator(
+                QRegularExpressionValidator(QRegularExpression(INDEXES_PATTERN), line_edit)
+            )
+            line_edit.setToolTip(
+                "Index, range or list, e.g. 5, 0-99, 0-100000:10, 0,5,9-20, 0-99,!50 or sample(0-2^31,1000)"
+            )
 
     def process_command(self) -> None:
         """
@@ -192,6 +184,9 @@ class MainApplication:
         def process() -> str:
             commands = shlex.split(cmd)
 
+            if commands and commands[0] in COMMANDS:
+                return run_command(commands)
+
             if any(word in commands for word in ("ds", "dumps")):
                 return "WARNING: The 'dumps' command is not supported in the Desktop CLI. Please use the standalone CLI to perform this operation."
 
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import asyncio
+import os
+import socket
+import tempfile
+
+
+def available() -> bool:
+    """
+    Check whether the platform supports Unix domain sockets.
+
+    :return: True when the service can run.
+    """
+    return hasattr(socket, "AF_UNIX") and hasattr(asyncio, "start_unix_server")
+
+
+def default_socket_path() -> str:
+    """
+    Get the default socket path, in the user's runtime directory when there is one.
+
+    :return: The socket path.
+    """
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(directory, f"hdwallet-desktop-{os.getuid()}.sock")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Any, Dict, Iterable, List, Optional, Tuple, Union
+)
+
+import itertools
+import json
+import socket
+
+from src.service import default_socket_path
+
+
+class ServiceError(Exception):
+    """
+    Error response of the derivation service.
+    """
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code: int = code
+
+
+class Client:
+    """
+    Client of the derivation service, keeping one persistent connection.
+
+    Calls can be pipelined: :meth:`submit` sends a request without waiting and
+    :meth:`result` waits for the response of a submitted request.
+
+    :param path: The socket path, defaults to the one the service uses.
+    :param timeout: Seconds to wait for a response.
+    """
+
+    def __init__(self, path: Optional[str] = None, timeout: Optional[float] = None) -> None:
+        self.socket: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.settimeout(timeout)
+        self.socket.connect(path or default_socket_path())
+        self.reader = self.socket.makefile("rb")
+        self.ids = itertools.count(1)
+        self.responses: Dict[int, Dict[str, Any]] = {}
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connection.
+        """
+        self.reader.close()
+        self.socket.close()
+
+    def submit(self, method: str, **params: Any) -> int:
+        """
+        Send a request without waiting for its response.
+
+        :param method: The method name.
+        :param params: The method parameters.
+        :return: The request id, to pass to :meth:`result`.
+        """
+        request_id = next(self.ids)
+        request = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+        self.socket.sendall(json.dumps(request, ensure_ascii=False).encode() + b"\n")
+        return request_id
+
+    def result(self, request_id: int) -> Any:
+        """
+        Wait for the response of a submitted request.
+
+        Responses may arrive out of order, those of other requests are kept until asked for.
+
+        :param request_id: The request id returned by :meth:`submit`.
+        :return: The result of the request.
+        """
+        while request_id not in self.responses:
+            line = self.reader.readline()
+            if not line:
+                raise ConnectionError("The derivation service closed the connection")
+            response = json.loads(line)
+            self.responses[response["id"]] = response
+        response = self.responses.pop(request_id)
+        if "error" in response:
+            raise ServiceError(response["error"]["code"], response["error"]["message"])
+        return response["result"]
+
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        Send a request and wait for its result.
+
+        :param method: The method name.
+        :param params: The method parameters.
+        :return: The result of the request.
+        """
+        return self.result(self.submit(method, **params))
+
+    def ping(self) -> str:
+        return self.call("ping")
+
+    def stats(self) -> Dict[str, Any]:
+        return self.call("stats")
+
+    def derive(
+        self, root: Dict[str, Any], paths: List[Union[str, Dict[str, Any]]], fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Derive a batch of paths of one root.
+
+        :param root: The root spec, e.g. ``{"cryptocurrency": "Bitcoin", "hd": "BIP44",
+            "from": "mnemonic", "value": "abandon ... about"}``.
+        :param paths: Paths like ``m/44'/0'/0'/0/5`` or named derivations like
+            ``{"name": "Monero", "minor": 0, "major": 1}``.
+        :param fields: The fields to return per path, e.g. ``["at:path", "address"]``,
+            or None for the whole dump.
+        :return: One result per path, ``{"error": message}`` for a path that failed, an invalid
+            root or a path that does not fit the HD of the root fails the request with ``INVALID_PARAMS``.
+        """
+        return self.call("derive", root=root, paths=paths, fields=fields)
+
+    def derive_many(
+        self, batches: Iterable[Tuple[Dict[str, Any], List[Any]]], fields: Optional[List[str]] = None, depth: int = 16
+    ) -> Iterable[List[Dict[str, Any]]]:
+        """
+        Derive several batches, keeping up to ``depth`` requests in flight.
+
+        :param batches: ``(root, paths)`` pairs.
+        :param fields: The fields to return per path, or None for the whole dump.
+        :param depth: The number of pipelined requests.
+        :return: An iterator over the results of every batch, in order.
+        """
+        pending: List[int] = []
+        for root, paths in batches:
+            pending.append(self.submit("derive", root=root, paths=paths, fields=fields))
+            if len(pending) >= depth:
+                yield self.result(pending.pop(0))
+        for request_id in pending:
+            yield self.result(request_id)
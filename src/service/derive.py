@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Any, Dict, List, Optional, Union
+)
+
+from hdwallet import HDWallet
+from hdwallet.hds import HDS
+from hdwallet.cryptocurrencies import CRYPTOCURRENCIES
+from hdwallet.entropies import ENTROPIES
+from hdwallet.mnemonics import MNEMONICS
+from hdwallet.seeds import SEEDS
+from hdwallet.derivations import (
+    IDerivation, DERIVATIONS, CustomDerivation
+)
+
+from src.utils.cache import RootCache
+from src.utils.derivation import derivation_at
+
+# Root sources wrapped in their client class before being passed to HDWallet
+CLIENT_SOURCES: Dict[str, Any] = {
+    "entropy": ENTROPIES.entropy,
+    "mnemonic": MNEMONICS.mnemonic,
+    "seed": SEEDS.seed
+}
+KEY_SOURCES: List[str] = [
+    "private_key", "public_key", "wif", "xprivate_key", "xpublic_key",
+    "spend_private_key", "watch_only"
+]
+
+# Roots of the worker process, kept warm between requests
+roots: Optional[RootCache] = None
+
+
+class RootError(ValueError):
+    """
+    A root spec that can not be built, e.g. missing a field or holding an invalid mnemonic.
+    """
+
+
+class PathError(ValueError):
+    """
+    A requested path that does not fit the derivation of the root, it fails the whole request.
+    """
+
+
+def initialize(ttl: int = 300) -> None:
+    """
+    Set up a service worker process.
+
+    :param ttl: Seconds a root stays cached after its last use.
+    """
+    global roots
+    roots = RootCache(ttl=ttl)
+
+
+def build_root(root: Dict[str, Any]) -> HDWallet:
+    """
+    Build a root HDWallet from a service root spec.
+
+    The spec holds ``cryptocurrency``, ``hd`` (default ``BIP32``), ``network`` (default ``mainnet``),
+    ``from`` (one of ``entropy``, ``mnemonic``, ``seed`` or a key source such as ``xprivate_key``)
+    and ``value``. ``client`` names the entropy, mnemonic or seed class (default ``BIP39``),
+    ``options`` holds extra HDWallet arguments such as ``passphrase`` or ``semantic`` and
+    ``arguments`` extra arguments of the ``from_*`` method, e.g. ``strict``.
+
+    :param root: The root spec.
+    :return: The root HDWallet.
+    :raises RootError: When the spec misses a field, names an unknown source or holds an invalid value.
+    """
+    try:
+        hd: HDWallet = HDWallet(
+            cryptocurrency=CRYPTOCURRENCIES.cryptocurrency(root["cryptocurrency"]),
+            hd=HDS.hd(root.get("hd", "BIP32")),
+            network=root.get("network", "mainnet"),
+            **root.get("options", {})
+        )
+        source, value = root["from"], root["value"]
+        arguments = root.get("arguments", {})
+
+        if source in CLIENT_SOURCES:
+            client = CLIENT_SOURCES[source](root.get("client", "BIP39"))
+            return getattr(hd, f"from_{source}")(client(**{source: value}), **arguments)
+        elif source == "watch_only":
+            return hd.from_watch_only(**value, **arguments)
+        elif source in KEY_SOURCES:
+            return getattr(hd, f"from_{source}")(**{source: value}, **arguments)
+    except KeyError as e:
+        raise RootError(f"Invalid root, missing {e}") from e
+    except Exception as e:
+        raise RootError(f"Invalid root: {str(e) or type(e).__name__}") from e
+    raise RootError(f"Unknown root source '{source}', expected one of {[*CLIENT_SOURCES, *KEY_SOURCES]}")
+
+
+def build_derivation(path: Union[str, Dict[str, Any]], hd_name: str = "BIP32") -> IDerivation:
+    """
+    Build the derivation of a requested path.
+
+    :param path: A path like ``m/44'/0'/0'/0/5``, or a named derivation like
+        ``{"name": "Monero", "minor": 0, "major": 1}``.
+    :param hd_name: The HD of the root, BIP44 style HDs only accept their own derivation.
+    :return: The derivation.
+    """
+    try:
+        if not isinstance(path, str):
+            arguments = dict(path)
+            return DERIVATIONS.derivation(arguments.pop("name"))(**arguments)
+        derivation = CustomDerivation(path=path)
+        if hd_name in ("BIP44", "BIP49", "BIP84", "BIP86"):
+            levels = tuple(derivation.derivations())
+            if len(levels) != 5:
+                raise PathError(f"{path} is not a {hd_name} path, expected m/purpose'/coin_type'/account'/change/address")
+            derivation = derivation_at(hd_name, levels)
+            if derivation.path() != path:
+                raise PathError(f"{path} is not a {hd_name} path")
+        return derivation
+    except PathError:
+        raise
+    except Exception as e:
+        raise PathError(f"Invalid path {path}: {str(e) or type(e).__name__}") from e
+
+
+def select(dump: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    Pick fields out of a derivation dump, using the ``key`` and ``key:subkey`` CSV syntax.
+
+    :param dump: The derivation dump.
+    :param fields: The fields to keep, or None for all of them.
+    :return: The selected fields.
+    """
+    if fields is None:
+        return dump
+    selected: Dict[str, Any] = {}
+    for field in fields:
+        key = field.split(":")
+        selected[field] = dump[key[0]][key[1]] if len(key) == 2 else dump[key[0]]
+    return selected
+
+
+def derive_paths(
+    root: Dict[str, Any], paths: List[Union[str, Dict[str, Any]]], fields: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Derive a batch of paths of one root, run in a service worker process.
+
+    A path that fails to derive yields ``{"error": message}`` in place of its dump, a root
+    that can not be built raises :class:`RootError` and a path that does not fit the
+    derivation of the root :class:`PathError`.
+
+    :param root: The root spec, see :func:`build_root`.
+    :param paths: The paths, see :func:`build_derivation`.
+    :param fields: The fields to return per path, or None for the whole dump.
+    :return: One result per path, in order.
+    """
+    if roots is None:
+        initialize()
+    hd = roots.get_or_create(RootCache.key(root), lambda: build_root(root))
+
+    results: List[Dict[str, Any]] = []
+    for path in paths:
+        derivation = build_derivation(path, root.get("hd", "BIP32"))
+        try:
+            hd.update_derivation(derivation=derivation)
+            results.append(select(hd.dump(exclude={"root"}), fields))
+        except Exception as e:
+            results.append({"error": str(e) or type(e).__name__})
+    return results
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+"""
+Measure the throughput of a running derivation service.
+
+    python launch.py --service &
+    python -m src.service.loadtest --connections 4 --requests 100 --batch 200 --depth 8
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import argparse
+import statistics
+import time
+
+from src.service.client import Client
+
+ROOT = {
+    "cryptocurrency": "Bitcoin",
+    "hd": "BIP44",
+    "network": "mainnet",
+    "from": "mnemonic",
+    "value": "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+}
+
+
+def run_connection(path: str, requests: int, batch: int, depth: int, offset: int) -> List[float]:
+    latencies: List[float] = []
+    with Client(path) as client:
+        started = {}
+        pending = []
+        for request in range(requests):
+            paths = [f"m/44'/0'/{offset}'/0/{request * batch + index}" for index in range(batch)]
+            request_id = client.submit("derive", root=ROOT, paths=paths, fields=["address"])
+            started[request_id] = time.perf_counter()
+            pending.append(request_id)
+            if len(pending) >= depth:
+                request_id = pending.pop(0)
+                client.result(request_id)
+                latencies.append(time.perf_counter() - started.pop(request_id))
+        for request_id in pending:
+            client.result(request_id)
+            latencies.append(time.perf_counter() - started.pop(request_id))
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the hdwallet-desktop derivation service")
+    parser.add_argument("--socket", default=None, help="socket path, defaults to the service default")
+    parser.add_argument("--connections", type=int, default=4, help="concurrent persistent connections")
+    parser.add_argument("--requests", type=int, default=50, help="derive requests per connection")
+    parser.add_argument("--batch", type=int, default=100, help="paths per derive request")
+    parser.add_argument("--depth", type=int, default=8, help="pipelined requests per connection")
+    arguments = parser.parse_args()
+
+    with Client(arguments.socket) as client:
+        # Builds the root once per worker before timing
+        client.derive(ROOT, [f"m/44'/0'/0'/0/{index}" for index in range(client.stats()["processes"] * 64)])
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=arguments.connections) as executor:
+        results = list(executor.map(
+            lambda connection: run_connection(
+                arguments.socket, arguments.requests, arguments.batch, arguments.depth, connection
+            ),
+            range(arguments.connections)
+        ))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for result in results for latency in result)
+    paths = arguments.connections * arguments.requests * arguments.batch
+    print(f"{paths:,} paths in {elapsed:.2f}s, {paths / elapsed:,.0f} paths/s, {len(latencies) / elapsed:,.1f} requests/s")
+    print(
+        f"latency p50 {statistics.median(latencies) * 1000:.1f} ms, "
+        f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f} ms, "
+        f"max {latencies[-1] * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
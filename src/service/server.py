@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any, Dict, List, Optional
+)
+
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import stat
+import time
+
+from src.service import (
+    available, default_socket_path
+)
+from src.service.derive import (
+    PathError, RootError, initialize, derive_paths
+)
+from src.utils.pool import (
+    process_count, chunked
+)
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR: int = -32700
+INVALID_REQUEST: int = -32600
+METHOD_NOT_FOUND: int = -32601
+INVALID_PARAMS: int = -32602
+INTERNAL_ERROR: int = -32603
+
+# Longest accepted request line
+MAX_REQUEST_SIZE: int = 64 * 1024 * 1024
+
+
+class Service:
+    """
+    Headless derivation service over a Unix domain socket.
+
+    Speaks newline delimited JSON-RPC 2.0 over persistent connections. Requests of a
+    connection are handled concurrently and answered as they complete, so clients may
+    pipeline them and match the responses by id. ``derive`` batches are split into
+    chunks served by warm worker processes, each keeping its roots cached.
+
+    :param path: The socket path.
+    :param processes: The number of worker processes, defaults to the number of CPU cores.
+    :param chunksize: The number of paths sent to a worker process at once.
+    :param ttl: Seconds a root stays cached in a worker after its last use.
+    :param pipeline: The maximum number of requests of one connection handled at once.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        processes: Optional[int] = None,
+        chunksize: int = 64,
+        ttl: int = 300,
+        pipeline: int = 64
+    ) -> None:
+        self.path: str = path
+        self.processes: int = processes or process_count()
+        self.chunksize: int = chunksize
+        self.ttl: int = ttl
+        self.pipeline: int = pipeline
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.started: float = time.time()
+        self.requests: int = 0
+        self.derived: int = 0
+        self.connections: int = 0
+        self.methods: Dict[str, Any] = {
+            "ping": self.ping,
+            "stats": self.stats,
+            "derive": self.derive
+        }
+
+    async def ping(self) -> str:
+        return "pong"
+
+    async def stats(self) -> Dict[str, Any]:
+        return {
+            "uptime": round(time.time() - self.started, 3),
+            "processes": self.processes,
+            "connections": self.connections,
+            "requests": self.requests,
+            "derived": self.derived
+        }
+
+    async def derive(
+        self, root: Dict[str, Any], paths: List[Any], fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(self.executor, derive_paths, root, chunk, fields)
+            for chunk in chunked(paths, self.chunksize)
+        ])
+        self.derived += len(paths)
+        return [result for chunk in results for result in chunk]
+
+    async def handle(self, line: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Handle one JSON-RPC request line.
+
+        :param line: The request.
+        :return: The response, or None for a notification.
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": PARSE_ERROR, "message": str(e)}}
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": INVALID_REQUEST, "message": "Invalid request"}}
+
+        self.requests += 1
+        method = self.methods.get(request["method"])
+        params = request.get("params", {})
+        result, error = None, None
+        if method is None:
+            error = {"code": METHOD_NOT_FOUND, "message": f"Unknown method '{request['method']}'"}
+        elif not isinstance(params, (list, dict)):
+            error = {"code": INVALID_PARAMS, "message": "Params must be an array or an object"}
+        else:
+            try:
+                result = await (method(*params) if isinstance(params, list) else method(**params))
+            except (TypeError, RootError, PathError) as e:
+                error = {"code": INVALID_PARAMS, "message": str(e)}
+            except Exception as e:
+                error = {"code": INTERNAL_ERROR, "message": str(e) or type(e).__name__}
+
+        if "id" not in request:
+            return None
+        elif error is not None:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": error}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    async def connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        slots = asyncio.Semaphore(self.pipeline)
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(line: bytes) -> None:
+            try:
+                response = await self.handle(line)
+                if response is not None:
+                    async with write_lock:
+                        writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                        await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                slots.release()
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                # Stops reading further requests while too many are in flight
+                await slots.acquire()
+                task = asyncio.create_task(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def serve(self) -> None:
+        """
+        Serve until interrupted.
+        """
+        if os.path.exists(self.path):
+            if not stat.S_ISSOCK(os.stat(self.path).st_mode):
+                raise SystemExit(f"{self.path} exists and is not a socket")
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                if probe.connect_ex(self.path) == 0:
+                    raise SystemExit(f"A service is already listening on {self.path}")
+            # Left behind by a service that did not shut down cleanly
+            os.remove(self.path)
+
+        # Spawn instead of fork, the workers only need the derivation code
+        context = multiprocessing.get_context("spawn")
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.processes, mp_context=context, initializer=initialize, initargs=(self.ttl,)
+        )
+        loop = asyncio.get_running_loop()
+        # Start every worker up front, so the first requests do not pay for it
+        await asyncio.gather(*[
+            loop.run_in_executor(self.executor, initialize, self.ttl) for _ in range(self.processes)
+        ])
+
+        # Roots and keys go over the socket, only the owner may connect
+        umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self.connection, path=self.path, limit=MAX_REQUEST_SIZE)
+        finally:
+            os.umask(umask)
+
+        stop = asyncio.Event()
+        for name in ("SIGINT", "SIGTERM"):
+            if hasattr(signal, name):
+                loop.add_signal_handler(getattr(signal, name), stop.set)
+
+        print(f"Serving on {self.path} with {self.processes} worker processes", flush=True)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            self.executor.shutdown(cancel_futures=True)
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def serve(path: Optional[str] = None, processes: Optional[int] = None) -> None:
+    """
+    Run the derivation service until interrupted.
+
+    :param path: The socket path, see :func:`default_socket_path`.
+    :param processes: The number of worker processes, defaults to the number of CPU cores.
+    """
+    if not available():
+        raise SystemExit("The derivation service needs Unix domain sockets, which this platform lacks")
+    asyncio.run(Service(path or default_socket_path(), processes=processes).serve())
@@ -7139,6 +7139,59 @@ class Ui_MainWindow(object):
 
         self.dumpsPageQStackedWidgetVLayout.addWidget(self.dumpsFormatKeysContainerQGroupBox)
 
+        self.dumpsToolsContainerQGroupBox = QGroupBox(self.dumpsPageQStackedWidget)
+        self.dumpsToolsContainerQGroupBox.setObjectName(u"dumpsToolsContainerQGroupBox")
+        self.dumpsToolsContainerQGroupBoxVLayout = QVBoxLayout(self.dumpsToolsContainerQGroupBox)
+        self.dumpsToolsContainerQGroupBoxVLayout.setSpacing(10)
+        self.dumpsToolsContainerQGroupBoxVLayout.setObjectName(u"dumpsToolsContainerQGroupBoxVLayout")
+        self.dumpsToolsContainerQGroupBoxVLayout.setContentsMargins(10, 10, 10, 10)
+        self.dumpsOptionsQFrame = QFrame(self.dumpsToolsContainerQGroupBox)
+        self.dumpsOptionsQFrame.setObjectName(u"dumpsOptionsQFrame")
+        self.dumpsOptionsQFrameHLayout = QHBoxLayout(self.dumpsOptionsQFrame)
+        self.dumpsOptionsQFrameHLayout.setSpacing(10)
+        self.dumpsOptionsQFrameHLayout.setObjectName(u"dumpsOptionsQFrameHLayout")
+        self.dumpsOptionsQFrameHLayout.setContentsMargins(0, 0, 0, 0)
+        self.dumpsOptionsQFrameHSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.dumpsOptionsQFrameHLayout.addItem(self.dumpsOptionsQFrameHSpacer)
+
+
+        self.dumpsToolsContainerQGroupBoxVLayout.addWidget(self.dumpsOptionsQFrame)
+
+        self.dumpsToolsQFrame = QFrame(self.dumpsToolsContainerQGroupBox)
+        self.dumpsToolsQFrame.setObjectName(u"dumpsToolsQFrame")
+        self.dumpsToolsQFrameHLayout = QHBoxLayout(self.dumpsToolsQFrame)
+        self.dumpsToolsQFrameHLayout.setSpacing(10)
+        self.dumpsToolsQFrameHLayout.setObjectName(u"dumpsToolsQFrameHLayout")
+        self.dumpsToolsQFrameHLayout.setContentsMargins(0, 0, 0, 0)
+        self.dumpsToolsQFrameHSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.dumpsToolsQFrameHLayout.addItem(self.dumpsToolsQFrameHSpacer)
+
+
+        self.dumpsToolsContainerQGroupBoxVLayout.addWidget(self.dumpsToolsQFrame)
+
+        self.dumpsSearchQFrame = QFrame(self.dumpsToolsContainerQGroupBox)
+        self.dumpsSearchQFrame.setObjectName(u"dumpsSearchQFrame")
+        self.dumpsSearchQFrameHLayout = QHBoxLayout(self.dumpsSearchQFrame)
+        self.dumpsSearchQFrameHLayout.setSpacing(10)
+        self.dumpsSearchQFrameHLayout.setObjectName(u"dumpsSearchQFrameHLayout")
+        self.dumpsSearchQFrameHLayout.setContentsMargins(0, 0, 0, 0)
+
+        self.dumpsToolsContainerQGroupBoxVLayout.addWidget(self.dumpsSearchQFrame)
+
+        self.dumpsBIP38QFrame = QFrame(self.dumpsToolsContainerQGroupBox)
+        self.dumpsBIP38QFrame.setObjectName(u"dumpsBIP38QFrame")
+        self.dumpsBIP38QFrameHLayout = QHBoxLayout(self.dumpsBIP38QFrame)
+        self.dumpsBIP38QFrameHLayout.setSpacing(10)
+        self.dumpsBIP38QFrameHLayout.setObjectName(u"dumpsBIP38QFrameHLayout")
+        self.dumpsBIP38QFrameHLayout.setContentsMargins(0, 0, 0, 0)
+
+        self.dumpsToolsContainerQGroupBoxVLayout.addWidget(self.dumpsBIP38QFrame)
+
+
+        self.dumpsPageQStackedWidgetVLayout.addWidget(self.dumpsToolsContainerQGroupBox)
+
         self.dumpsPageQStackedWidgetVSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
 
         self.dumpsPageQStackedWidgetVLayout.addItem(self.dumpsPageQStackedWidgetVSpacer)
@@ -7,6 +7,10 @@
 # file COPYING or https://opensource.org/license/mit
 
 from functools import lru_cache
+from collections import OrderedDict
+from typing import (
+    Optional, Tuple
+)
 from PIL.ImageQt import ImageQt, Image
 
 import os
@@ -18,11 +22,13 @@ from PySide6.QtWidgets import (
     QWidget, QLayout, QLabel
 )
 from PySide6.QtSvgWidgets import QSvgWidget
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap, QPainter
+from PySide6.QtCore import Qt, QSize, QThreadPool
+from PySide6.QtGui import QPixmap, QPainter, QImage
 
 from hdwallet.mnemonics import ElectrumV2Mnemonic
 
+from src.utils.worker import Worker
+
 
 def clear_layout(layout: QLayout, delete: bool = True) -> None:
     """
@@ -93,36 +99,127 @@ def put_svg(layout: QLayout, path: str, width: int, height: int) -> QSvgWidget:
     return svg
 
 
-def put_qr_code(qr_label: QLabel, text: str) -> None:
+class QRCodeCache:
+    """
+    Least recently used cache of rendered QR code pixmaps.
+
+    Keys are ``(text, box_size, fill_color, back_color)`` tuples. The cache is only
+    accessed from the GUI thread, where pixmaps have to be created.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
         """
-        Generate and display a QR code.
+        Initialize the cache.
 
-        :param qr_label: The QLabel to display the QR code.
-        :param text: The text data to encode in the QR code.
+        :param maxsize: The maximum number of pixmaps kept.
         """
-        qr_label.setText(None)
+        self.maxsize: int = maxsize
+        self.pixmaps: OrderedDict = OrderedDict()
 
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4
-        )
-        qr.add_data(text)
-        qr.make(fit=True)
+    def get(self, key: Tuple) -> Optional[QPixmap]:
+        """
+        Get a cached pixmap and mark it as recently used.
 
-        img = qr.make_image(
-            fill_color="white",
-            back_color="#191e24"
-        )
+        :param key: The cache key.
+        :return: The pixmap or None when not cached.
+        """
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+        return pixmap
 
-        qimage = ImageQt(img)
+    def put(self, key: Tuple, pixmap: QPixmap) -> None:
+        """
+        Cache a pixmap, evicting the least recently used one when full.
+
+        :param key: The cache key.
+        :param pixmap: The rendered pixmap.
+        """
+        self.pixmaps[key] = pixmap
+        self.pixmaps.move_to_end(key)
+        while len(self.pixmaps) > self.maxsize:
+            self.pixmaps.popitem(last=False)
 
-        pixmap = QPixmap.fromImage(qimage)
 
-        qr_label.setPixmap(pixmap)
+qr_code_cache: QRCodeCache = QRCodeCache()
+
+# Render workers are kept referenced until their result has been delivered,
+# otherwise their signals object may be collected with the event still queued
+qr_code_jobs: set = set()
+
+
+def render_qr_code(text: str, box_size: int = 10, fill_color: str = "white", back_color: str = "#191e24") -> QImage:
+    """
+    Render a QR code into a QImage, safe to call from a worker thread.
+
+    :param text: The text data to encode in the QR code.
+    :param box_size: The size in pixels of each QR code box.
+    :param fill_color: The module color.
+    :param back_color: The background color.
+    :return: The rendered image.
+    """
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=box_size,
+        border=4
+    )
+    qr.add_data(text)
+    qr.make(fit=True)
+
+    img = qr.make_image(
+        fill_color=fill_color,
+        back_color=back_color
+    )
+    # Detach from the PIL buffer owned by ImageQt
+    return QImage(ImageQt(img)).copy()
+
+
+def put_qr_code(
+    qr_label: QLabel, text: str, box_size: int = 10, fill_color: str = "white", back_color: str = "#191e24"
+) -> None:
+        """
+        Generate and display a QR code.
+
+        Rendered codes are cached, a cache miss is rendered in a background worker and
+        shown once ready unless the label was given another text in the meantime.
+
+        :param qr_label: The QLabel to display the QR code.
+        :param text: The text data to encode in the QR code.
+        :param box_size: The size in pixels of each QR code box.
+        :param fill_color: The module color.
+        :param back_color: The background color.
+        """
+        key = (text, box_size, fill_color, back_color)
+        qr_label.setText(None)
         qr_label.setAlignment(Qt.AlignCenter)
         qr_label.setScaledContents(True)
+        qr_label.setProperty("qrCodeKey", repr(key))
+
+        pixmap = qr_code_cache.get(key)
+        if pixmap is not None:
+            qr_label.setPixmap(pixmap)
+            return None
+
+        qr_label.clear()
+
+        job = Worker(render_qr_code, None, text, box_size, fill_color, back_color)
+
+        def rendered(qimage: QImage) -> None:
+            qr_code_jobs.discard(job)
+            pixmap = QPixmap.fromImage(qimage)
+            qr_code_cache.put(key, pixmap)
+            try:
+                if qr_label.property("qrCodeKey") == repr(key):
+                    qr_label.setPixmap(pixmap)
+            except RuntimeError:
+                # The label was deleted before the QR code was ready
+                pass
+
+        job.signals.interval_finished.connect(rendered)
+        job.signals.interval_error.connect(lambda _: qr_code_jobs.discard(job))
+        qr_code_jobs.add(job)
+        QThreadPool.globalInstance().start(job)
 
 
 def update_style(widget: QWidget) -> None:
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Any, List, Mapping, Optional, Sequence, Tuple
+)
+
+import csv
+import io
+import json
+
+from hdwallet import HDWallet
+
+from src.utils.cache import (
+    RootCache, RootRecipe
+)
+from src.utils.derivation import (
+    Indexes, derivation_at
+)
+from src.utils.encrypt import bip38
+from src.utils.index import root_fingerprint
+from src.utils.watch import (
+    watch_only, lazy_dump, to_dict
+)
+
+# Roots of a batch worker process, kept warm while their paths are dumped
+roots: Optional[RootCache] = None
+
+
+def include_values(dump: Mapping[str, Any], include: Sequence[str]) -> List[Any]:
+    """
+    Pick the included fields out of a derivation dump, using the ``key`` and ``key:subkey`` syntax.
+
+    :param dump: The derivation dump.
+    :param include: The included fields, e.g. ``at:path`` or ``address``.
+    :return: The field values, in order.
+    """
+    values: List[Any] = []
+    for key in [keys.split(":") for keys in include]:
+        if len(key) == 2:
+            values.append(dump[key[0]][key[1]])
+        else:
+            values.append(dump[key[0]])
+    return values
+
+
+def csv_row(values: Sequence[Any]) -> str:
+    """
+    Format one CSV row, without its line terminator.
+
+    :param values: The field values.
+    :return: The row, quoted where a value holds commas, quotes or newlines.
+    """
+    line = io.StringIO()
+    csv.writer(line, lineterminator="").writerow(values)
+    return line.getvalue()
+
+
+def dump_address(dump: Mapping) -> Optional[str]:
+    """
+    Get the primary address of a derivation dump.
+
+    :param dump: The derivation dump.
+    :return: The address, or None when the dump has none.
+    """
+    for key in ("address", "sub_address"):
+        if isinstance(dump.get(key), str):
+            return dump[key]
+    addresses = dump.get("addresses")
+    if isinstance(addresses, Mapping) and addresses:
+        return next(iter(addresses.values()))
+    return None
+
+
+def writes_wif(dformat: str, exclude_include: Sequence[str]) -> bool:
+    """
+    Check whether dump rows hold the ``wif`` field.
+
+    :param dformat: The output format, see :func:`dump_row`.
+    :param exclude_include: The excluded or included fields.
+    :return: True when CSV rows include it or JSON rows do not exclude it.
+    """
+    if dformat != "JSON":
+        return "wif" in exclude_include
+    return "wif" not in exclude_include
+
+
+def derivation_dump(
+    hd: HDWallet, derivation_name: str, path: Indexes, exclude: Optional[Sequence[str]] = None
+) -> Mapping[str, Any]:
+    """
+    Derive one path and dump it, without the root.
+
+    Watch-only wallets take the public fast path, see :func:`lazy_dump`, which only
+    computes the fields that are read.
+
+    :param hd: The root HDWallet, derived in place.
+    :param derivation_name: The derivation, see :func:`derivation_at`.
+    :param path: The indexes of the path.
+    :param exclude: The excluded fields, a dictionary is returned when given, otherwise
+        the dump may compute its fields as they are read.
+    :return: The derivation dump.
+    """
+    derivation = derivation_at(derivation_name, path)
+    hd.update_derivation(derivation=derivation)
+    if watch_only(hd):
+        dump = lazy_dump(hd, derivation)
+        return to_dict(dump, set(exclude)) if exclude is not None else dump
+    return hd.dump(exclude={"root", *(exclude or ())})
+
+
+def dump_row(
+    hd: HDWallet, derivation_name: str, path: Indexes, dformat: str, exclude_include: Sequence[str]
+) -> Tuple[str, Mapping[str, Any]]:
+    """
+    Derive one path and format its dump row.
+
+    :param hd: The root HDWallet, derived in place.
+    :param derivation_name: The derivation, see :func:`derivation_at`.
+    :param path: The indexes of the path.
+    :param dformat: ``JSON`` to exclude fields from an indented JSON dump, any other format
+        includes fields in a CSV row.
+    :param exclude_include: The excluded or included fields.
+    :return: The row and the derivation dump.
+    """
+    if dformat != "JSON":
+        dump = derivation_dump(hd, derivation_name, path)
+        return csv_row(include_values(dump, exclude_include)), dump
+
+    dump = derivation_dump(hd, derivation_name, path, exclude_include)
+    return json.dumps(dump, indent=4, ensure_ascii=False), dump
+
+
+def initialize(ttl: int = 300) -> None:
+    """
+    Set up a batch worker process.
+
+    :param ttl: Seconds a root stays cached after it was built.
+    """
+    global roots
+    roots = RootCache(ttl=ttl)
+
+
+def dump_roots(
+    items: List[Tuple[Tuple[Any, ...], RootRecipe, List[Indexes]]],
+    tags: Sequence[str],
+    derivation_name: str,
+    dformat: str,
+    exclude_include: Sequence[str],
+    bip38_passphrase: Optional[str] = None,
+    index: bool = False
+) -> List[Tuple[Tuple[Any, ...], List[str], List[Tuple[str, str, str, str, str]], Optional[str]]]:
+    """
+    Dump paths of several roots, run in a batch worker process.
+
+    Every row is tagged with the tag values of its item, as the leading CSV fields or as
+    the leading JSON keys named by ``tags``. A root that fails to build or derive yields
+    an error in place of its rows.
+
+    :param items: ``(tag values, recipe, paths)`` items.
+    :param tags: The tag names, e.g. ``("root_index", "root_fingerprint")`` or ``("coin", "network")``.
+    :param derivation_name: The derivation, see :func:`derivation_at`.
+    :param dformat: The output format, see :func:`dump_row`.
+    :param exclude_include: The excluded or included fields.
+    :param bip38_passphrase: Encrypts the ``wif`` field of every row with BIP38 when given.
+    :param index: Also return the address index entries of the rows, see :class:`AddressIndex`.
+    :return: ``(tag values, rows, index entries, error)`` per item, in order.
+    """
+    if roots is None:
+        initialize()
+
+    results: List[Tuple[Tuple[Any, ...], List[str], List[Tuple[str, str, str, str, str]], Optional[str]]] = []
+    for values, recipe, paths in items:
+        rows: List[str] = []
+        entries: List[Tuple[str, str, str, str, str]] = []
+        try:
+            hd = roots.get_or_create(recipe.key(), recipe.build)
+            if index:
+                coin, network = recipe.hd_kwargs["cryptocurrency"].NAME, recipe.hd_kwargs["network"]
+                root = root_fingerprint(hd)
+            codec = None
+            # scrypt only runs for rows that actually hold the WIF
+            if bip38_passphrase is not None and writes_wif(dformat, exclude_include):
+                codec = bip38(recipe.hd_kwargs["cryptocurrency"].NAME, recipe.hd_kwargs["network"])
+            for path in paths:
+                if dformat != "JSON":
+                    dump = derivation_dump(hd, derivation_name, path)
+                else:
+                    dump = derivation_dump(hd, derivation_name, path, exclude_include)
+                address = dump_address(dump) if index else None
+                if codec is not None and dump.get("wif"):
+                    # scrypt dominates the row, which is why these dumps run in a pool
+                    dump = {**dump, "wif": codec.encrypt(wif=dump["wif"], passphrase=bip38_passphrase)}
+                if dformat != "JSON":
+                    rows.append(csv_row([*values, *include_values(dump, exclude_include)]))
+                else:
+                    rows.append(json.dumps({**dict(zip(tags, values)), **dump}, indent=4, ensure_ascii=False))
+                if address is not None:
+                    entries.append((address, hd.path(), coin, network, root))
+        except KeyError as e:
+            results.append((values, rows, entries, f"Unknown key {e}"))
+            continue
+        except Exception as e:
+            results.append((values, rows, entries, str(e) or type(e).__name__))
+            continue
+        results.append((values, rows, entries, None))
+    return results
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any, Callable, Dict, Optional, Tuple
+)
+
+import copy
+import hashlib
+import threading
+import time
+
+from hdwallet import HDWallet
+from hdwallet.derivations import IDerivation
+
+
+def wipe(hd: HDWallet) -> None:
+    """
+    Drop every reference an HDWallet holds to its keys, seed and mnemonic.
+
+    Python cannot overwrite immutable strings and bytes in place, so this is a
+    best-effort wipe: the wallet is emptied and the secrets are left to the
+    garbage collector instead of staying reachable from the cache.
+
+    :param hd: The HDWallet to wipe.
+    """
+    for obj in (getattr(hd, "_hd", None), hd):
+        if obj is not None and hasattr(obj, "__dict__"):
+            vars(obj).clear()
+
+
+def copy_root(hd: HDWallet) -> HDWallet:
+    """
+    Copy a root HDWallet so it can be derived independently of the original.
+
+    Key objects are immutable and shared, only the mutable derivation state is copied,
+    which is much cheaper than rebuilding the root (and HDWallets cannot be deep copied).
+
+    :param hd: The root HDWallet.
+    :return: An independent copy.
+    """
+    clone: HDWallet = copy.copy(hd)
+    clone._hd = copy.copy(hd._hd)
+    for name, value in vars(clone._hd).items():
+        if isinstance(value, (IDerivation, list, dict)):
+            setattr(clone._hd, name, copy.deepcopy(value))
+    if isinstance(getattr(hd, "_derivation", None), IDerivation):
+        clone._derivation = copy.deepcopy(hd._derivation)
+    return clone
+
+
+@dataclass(frozen=True, slots=True)
+class RootRecipe:
+    """
+    Everything a root HDWallet is built from, i.e. ``HDWallet(**hd_kwargs).method(*args, **kwargs)``.
+
+    Picklable, so batch worker processes can build and cache the roots themselves.
+    """
+    hd_kwargs: Dict[str, Any]
+    method: str
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+
+    def key(self) -> str:
+        """
+        Get the cache key of the root.
+
+        :return: The cache key, see :meth:`RootCache.key`.
+        """
+        return RootCache.key(self.hd_kwargs, self.method, self.args, self.kwargs)
+
+    def build(self) -> HDWallet:
+        """
+        Build the root.
+
+        :return: The root HDWallet.
+        """
+        return getattr(HDWallet(**self.hd_kwargs), self.method)(*self.args, **self.kwargs)
+
+
+class RootCache:
+    """
+    Time limited, in-memory cache of constructed root HDWallets.
+
+    Building a root reruns seed stretching (PBKDF2, Electrum-V1 stretching, Cardano
+    master key generation), so roots are kept for ``ttl`` seconds keyed by a hash of
+    everything they were built from. Callers always receive a copy, and expired or
+    evicted roots are wiped.
+    """
+
+    def __init__(self, ttl: float = 300, maxsize: int = 16) -> None:
+        """
+        Initialize the cache.
+
+        :param ttl: Seconds a root stays cached after it was built.
+        :param maxsize: The maximum number of cached roots.
+        """
+        self.ttl: float = ttl
+        self.maxsize: int = maxsize
+        self.roots: OrderedDict = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def normalize(value: Any) -> Any:
+        """
+        Convert root inputs into a stable, hashable representation.
+
+        :param value: The value, e.g. HDWallet keyword arguments or mnemonic objects.
+        :return: The normalized value.
+        """
+        if isinstance(value, dict):
+            return tuple(sorted((str(k), RootCache.normalize(v)) for k, v in value.items()))
+        elif isinstance(value, (list, tuple, set)):
+            return tuple(RootCache.normalize(v) for v in value)
+        elif isinstance(value, type):
+            return f"{value.__module__}.{value.__qualname__}"
+        elif isinstance(value, (str, bytes, int, float, bool)) or value is None:
+            return value
+        elif hasattr(value, "__dict__"):
+            return type(value).__qualname__, RootCache.normalize(vars(value))
+        return repr(value)
+
+    @staticmethod
+    def key(*inputs: Any) -> str:
+        """
+        Hash the inputs of a root into a cache key.
+
+        :param inputs: Everything the root is built from.
+        :return: The SHA-256 hex digest of the normalized inputs.
+        """
+        return hashlib.sha256(repr(RootCache.normalize(inputs)).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[HDWallet]:
+        """
+        Get a copy of a cached root.
+
+        :param key: The cache key.
+        :return: A copy of the root, or None when it is not cached or has expired.
+        """
+        self.expire()
+        with self.lock:
+            entry = self.roots.get(key)
+            if entry is None:
+                return None
+            self.roots.move_to_end(key)
+            return copy_root(entry[1])
+
+    def put(self, key: str, hd: HDWallet) -> None:
+        """
+        Cache a root, evicting the least recently used roots when full.
+
+        :param key: The cache key.
+        :param hd: The root HDWallet, it must not be derived afterwards.
+        """
+        with self.lock:
+            if key in self.roots:
+                wipe(self.roots.pop(key)[1])
+            self.roots[key] = (time.monotonic() + self.ttl, hd)
+            while len(self.roots) > self.maxsize:
+                wipe(self.roots.popitem(last=False)[1][1])
+
+    def get_or_create(self, key: str, factory: Callable[[], HDWallet]) -> HDWallet:
+        """
+        Get a copy of a cached root, building and caching it on a miss.
+
+        :param key: The cache key.
+        :param factory: Builds the root.
+        :return: A root HDWallet the caller may derive.
+        """
+        hd = self.get(key)
+        if hd is None:
+            hd = factory()
+            self.put(key, hd)
+            hd = copy_root(hd)
+        return hd
+
+    def expire(self) -> None:
+        """
+        Wipe and drop the roots whose time to live has passed.
+        """
+        now = time.monotonic()
+        with self.lock:
+            for key in [key for key, (expires, _) in self.roots.items() if expires <= now]:
+                wipe(self.roots.pop(key)[1])
+
+    def clear(self) -> None:
+        """
+        Wipe and drop every cached root.
+        """
+        with self.lock:
+            while self.roots:
+                wipe(self.roots.popitem()[1][1])
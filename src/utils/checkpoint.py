@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from dataclasses import (
+    dataclass, asdict
+)
+from typing import (
+    Any, Optional, Tuple
+)
+
+import hashlib
+import json
+import os
+
+
+def checkpoint_path(filepath: str) -> str:
+    """
+    Get the path of the checkpoint stored next to an export file.
+
+    :param filepath: The export file path.
+    :return: The checkpoint file path.
+    """
+    return f"{filepath}.checkpoint"
+
+
+def fingerprint(*values: Any) -> str:
+    """
+    Get a short, one way fingerprint of some values.
+
+    Used to recognise the root and job of a checkpoint without storing any key material.
+
+    :param values: JSON serializable values.
+    :return: The first 16 hex digits of their SHA-256 hash.
+    """
+    data = json.dumps(values, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    """
+    Progress of a dump written to an export file.
+
+    ``position`` is the number of rows written, ``path`` the ``(index, hardened)`` pairs of the
+    last of them and ``size`` the export file size right after it, anything past it was written
+    after the checkpoint and is discarded when resuming.
+    """
+    root: str
+    job: str
+    position: int
+    path: Tuple[Tuple[int, bool], ...]
+    size: int
+
+    def save(self, filepath: str) -> None:
+        """
+        Store the checkpoint next to an export file, replacing the previous one atomically.
+
+        :param filepath: The export file path.
+        """
+        temporary = f"{checkpoint_path(filepath)}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(asdict(self), file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, checkpoint_path(filepath))
+
+    @staticmethod
+    def load(filepath: str) -> Optional["Checkpoint"]:
+        """
+        Load the checkpoint stored next to an export file.
+
+        :param filepath: The export file path.
+        :return: The checkpoint, or None when the file has none.
+        """
+        try:
+            with open(checkpoint_path(filepath)) as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return None
+        return Checkpoint(
+            root=data["root"],
+            job=data["job"],
+            position=data["position"],
+            path=tuple((index, hardened) for index, hardened in data["path"]),
+            size=data["size"]
+        )
+
+    @staticmethod
+    def remove(filepath: str) -> None:
+        """
+        Remove the checkpoint stored next to an export file, if any.
+
+        :param filepath: The export file path.
+        """
+        try:
+            os.remove(checkpoint_path(filepath))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from dataclasses import dataclass
+from typing import (
+    Any, Callable, Dict, Optional
+)
+
+import os
+import queue
+import threading
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # Optional, zstd exports are offered only when installed
+    zstandard = None
+
+
+@dataclass(frozen=True, slots=True)
+class Compression:
+    """
+    Compressed export format.
+
+    ``levels`` is the inclusive range of compression levels, ``level`` the default one.
+    """
+    name: str
+    extension: str
+    levels: range
+    level: int
+
+    def compressor(self, level: int) -> Any:
+        """
+        Start a new gzip member or zstd frame.
+
+        :param level: The compression level.
+        :return: An object with ``compress(data)`` and ``flush()``.
+        """
+        if self.name == "gzip":
+            # wbits 31 writes a gzip header and trailer around the deflate stream
+            return zlib.compressobj(level, zlib.DEFLATED, 31)
+        return zstandard.ZstdCompressor(level=level).compressobj()
+
+
+COMPRESSIONS: Dict[str, Compression] = {
+    "gzip": Compression(name="gzip", extension=".gz", levels=range(1, 10), level=6)
+}
+if zstandard is not None:
+    COMPRESSIONS["zstd"] = Compression(name="zstd", extension=".zst", levels=range(1, 23), level=3)
+
+
+class CompressedFile:
+    """
+    Text file compressed by a writer thread, so compression overlaps producing the text.
+
+    Every :meth:`flush` ends the current gzip member or zstd frame. Both formats decompress
+    concatenated members as one stream, so a file truncated right after a flush can be
+    appended to again, and shards can be merged by concatenation.
+
+    :param filepath: The output file.
+    :param compression: The compression format.
+    :param level: The compression level.
+    :param mode: ``w`` to replace the file, ``a`` to append to it.
+    :param pending: The maximum number of queued writes before :meth:`write` blocks.
+    """
+
+    def __init__(self, filepath: str, compression: Compression, level: int, mode: str = "w", pending: int = 64) -> None:
+        if level not in compression.levels:
+            raise ValueError(
+                f"Invalid {compression.name} level {level}, expected {compression.levels.start}-{compression.levels.stop - 1}"
+            )
+        self.compression: Compression = compression
+        self.level: int = level
+        self.file = open(filepath, f"{mode}b")
+        self.queue: queue.Queue = queue.Queue(maxsize=pending)
+        self.error: Optional[BaseException] = None
+        self.thread = threading.Thread(target=self.__run, name=f"{compression.name} writer", daemon=True)
+        self.thread.start()
+
+    def __enter__(self) -> "CompressedFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __run(self) -> None:
+        compressor = None
+        while True:
+            item = self.queue.get()
+            try:
+                # Keeps draining after an error, so writers never block on a failed file
+                if self.error is not None:
+                    pass
+                elif item is None or callable(item):
+                    if compressor is not None:
+                        self.file.write(compressor.flush())
+                        self.file.flush()
+                        compressor = None
+                    if item is not None:
+                        item(os.fstat(self.file.fileno()).st_size)
+                else:
+                    if compressor is None:
+                        compressor = self.compression.compressor(self.level)
+                    self.file.write(compressor.compress(item))
+            except Exception as e:
+                self.error = e
+            finally:
+                self.queue.task_done()
+            if item is None:
+                return
+
+    def __raise(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    def write(self, text: str) -> int:
+        """
+        Queue text for compression.
+
+        :param text: The text.
+        :return: The number of characters queued.
+        """
+        self.__raise()
+        self.queue.put(text.encode())
+        return len(text)
+
+    def flush(self, on_written: Optional[Callable[[int], None]] = None) -> None:
+        """
+        End the current member or frame, without waiting for it to be written.
+
+        :param on_written: Called on the writer thread with the size of the file once
+            everything queued so far is written, e.g. to checkpoint it.
+        """
+        self.__raise()
+        self.queue.put(on_written if on_written is not None else (lambda size: None))
+
+    def wait(self) -> None:
+        """
+        Wait until everything queued so far is written.
+        """
+        self.queue.join()
+        self.__raise()
+
+    def close(self) -> None:
+        """
+        Write everything queued and close the file.
+        """
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        self.file.close()
+        self.__raise()
+
+
+def compressed_filepath(filepath: str, compression: Optional[Compression]) -> str:
+    """
+    Add the extension of a compression to a file path, unless it already has it.
+
+    :param filepath: The file path.
+    :param compression: The compression, or None for an uncompressed file.
+    :return: The file path.
+    """
+    if compression is None or filepath.endswith(compression.extension):
+        return filepath
+    return f"{filepath}{compression.extension}"
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from dataclasses import replace
+from typing import (
+    Any, Iterator, List, Mapping, Optional, Sequence, Tuple
+)
+
+import csv
+import json
+
+from src.utils.batch import (
+    include_values, csv_row, writes_wif
+)
+from src.utils.cache import RootRecipe
+from src.utils.encrypt import bip38
+from src.utils.watch import (
+    lazy_supported, lazy_dump, to_dict
+)
+
+# From inputs a file of keys can be converted from, one key per root
+KEY_SOURCES: Tuple[str, ...] = ("wif", "private key", "public key")
+
+
+def read_keys(filepath: str) -> Iterator[Tuple[int, str]]:
+    """
+    Read a file of keys, one per line.
+
+    :param filepath: The file, the key is the first CSV field of a line, empty lines and
+        lines starting with ``#`` are skipped.
+    :return: An iterator over ``(line number, key)``.
+    """
+    with open(filepath, "r", encoding="utf-8", newline="") as lines:
+        for number, row in enumerate(csv.reader(lines), start=1):
+            if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                continue
+            yield number, row[0].strip()
+
+
+def key_dump(recipe: RootRecipe, key: str, exclude: Optional[Sequence[str]] = None) -> Mapping[str, Any]:
+    """
+    Build the wallet of one key and dump it, without the root.
+
+    :param recipe: The wallet of any key of the file, its only keyword argument is the key.
+    :param key: The key.
+    :param exclude: The excluded fields, a dictionary is returned when given, otherwise
+        the dump may compute its fields as they are read.
+    :return: The dump.
+    """
+    hd = replace(recipe, kwargs={next(iter(recipe.kwargs)): key}).build()
+    if lazy_supported(hd):
+        dump = lazy_dump(hd)
+        return to_dict(dump, set(exclude)) if exclude is not None else dump
+    return hd.dump(exclude={"root", *(exclude or ())})
+
+
+def convert_keys(
+    items: List[Tuple[int, str]],
+    recipe: RootRecipe,
+    dformat: str,
+    exclude_include: Sequence[str],
+    bip38_passphrase: Optional[str] = None
+) -> List[Tuple[int, Optional[str], Optional[str]]]:
+    """
+    Convert keys into dump rows, run in a worker process.
+
+    CSV rows start with the line number of their key and JSON rows with a ``line`` key,
+    so converted rows can be matched with the lines of the file.
+
+    :param items: ``(line number, key)`` items, see :func:`read_keys`.
+    :param recipe: The wallet of any key of the file, see :func:`key_dump`.
+    :param dformat: ``JSON`` to exclude fields from an indented JSON dump, any other format
+        includes fields in a CSV row.
+    :param exclude_include: The excluded or included fields.
+    :param bip38_passphrase: Encrypts the ``wif`` field of every row with BIP38 when given.
+    :return: ``(line number, row, error)`` per key, in order.
+    """
+    codec = None
+    if bip38_passphrase is not None and writes_wif(dformat, exclude_include):
+        codec = bip38(recipe.hd_kwargs["cryptocurrency"].NAME, recipe.hd_kwargs["network"])
+
+    results: List[Tuple[int, Optional[str], Optional[str]]] = []
+    for number, key in items:
+        try:
+            dump = key_dump(recipe, key, exclude_include if dformat == "JSON" else None)
+            if codec is not None and dump.get("wif"):
+                dump = {**dump, "wif": codec.encrypt(wif=dump["wif"], passphrase=bip38_passphrase)}
+            if dformat != "JSON":
+                row = csv_row([number, *include_values(dump, exclude_include)])
+            else:
+                row = json.dumps({"line": number, **dump}, indent=4, ensure_ascii=False)
+        except KeyError as e:
+            results.append((number, None, f"Unknown key {e}"))
+            continue
+        except Exception as e:
+            results.append((number, None, str(e) or type(e).__name__))
+            continue
+        results.append((number, row, None))
+    return results
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+)
+
+import heapq
+import itertools
+import math
+import random
+import re
+
+from hdwallet.derivations import (
+    IDerivation, DERIVATIONS
+)
+from hdwallet.exceptions import DerivationError
+
+Level = Tuple[Iterable[int], bool]
+Indexes = Tuple[Tuple[int, bool], ...]
+
+# Highest index of a derivation level, hardening is a separate flag
+MAX_INDEX: int = 2 ** 31 - 1
+
+_NUMBER: str = r"\d+(?:\^\d+)?"
+_TERM: str = (
+    rf"!?(?:sample\({_NUMBER}-{_NUMBER},\s*\d+(?:,\s*\d+)?\)|{_NUMBER}(?:-{_NUMBER}(?::\d+)?)?)"
+)
+# Pattern of a whole index expression, also used by the input validators
+INDEXES_PATTERN: str = rf"{_TERM}(?:\s*,\s*{_TERM})*"
+
+
+class IndexExpression:
+    """
+    Lazy, re-iterable set of derivation indexes compiled from an expression.
+
+    An expression is a comma separated list of terms, each one of:
+
+    * ``5``, a single index.
+    * ``0-99``, an inclusive range, optionally stepped as ``0-100000:10``.
+    * ``sample(0-2^31,1000)``, that many distinct random indexes of a range, in ascending order.
+      The sample is seeded by the term, so the same expression always selects the same indexes,
+      a third argument changes the seed, e.g. ``sample(0-2^31,1000,7)``.
+
+    Numbers may be written as powers like ``2^31``, bounds past :data:`MAX_INDEX` are clipped
+    to it. Terms prefixed with ``!`` are excluded, e.g. ``0-99,!50-59``. Indexes are walked in
+    ascending order and once each, however the terms are ordered or overlap, and counted
+    without being walked.
+
+    :param expression: The index expression.
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression: str = expression.strip()
+        self.includes: List[Sequence[int]] = []
+        self.excludes: List[Sequence[int]] = []
+
+        if not re.fullmatch(INDEXES_PATTERN, self.expression):
+            raise DerivationError(
+                "Invalid index expression", expected="e.g. 5, 0-99, 0-100000:10, 0,5,9-20 or sample(0-2^31,1000)",
+                got=self.expression
+            )
+        for term in re.findall(_TERM, self.expression):
+            if term.startswith("!"):
+                self.excludes.append(self.__compile(term[1:]))
+            else:
+                self.includes.append(self.__compile(term))
+
+    @staticmethod
+    def __number(value: str) -> int:
+        if "^" in value:
+            base, exponent = value.split("^")
+            return min(int(base) ** int(exponent), MAX_INDEX + 1)
+        return int(value)
+
+    def __compile(self, term: str) -> Sequence[int]:
+        sample = term.startswith("sample(")
+        if sample:
+            term, count, *seed = term[len("sample("):-1].split(",")
+            count = int(count)
+        bounds, _, step = term.partition(":")
+        start, _, end = bounds.partition("-")
+        start = self.__number(start)
+        end = self.__number(end) if end else start
+        step = int(step) if step else 1
+
+        if start > end:
+            raise DerivationError(
+                f"Bad index, from {start} index should be less than to {end} index"
+            )
+        elif step == 0:
+            raise DerivationError("Bad index step, should be greater than zero", got=term)
+
+        indexes = range(min(start, MAX_INDEX), min(end, MAX_INDEX) + 1, step)
+        if sample:
+            if count > len(indexes):
+                raise DerivationError(
+                    f"Cannot sample {count} indexes out of a range of {len(indexes)}"
+                )
+            # Seeded, so resumed and sharded dumps of the same expression walk the same indexes
+            generator = random.Random(f"{term},{count},{seed[0].strip() if seed else ''}")
+            return sorted(generator.sample(indexes, count))
+        return indexes
+
+    def __iter__(self) -> Iterator[int]:
+        excludes = [
+            exclude if isinstance(exclude, range) else frozenset(exclude) for exclude in self.excludes
+        ]
+        previous = None
+        # Every term is ascending, so merging them walks the union in order
+        for index in heapq.merge(*self.includes):
+            if index != previous and not any(index in exclude for exclude in excludes):
+                yield index
+            previous = index
+
+    def __len__(self) -> int:
+        ranges = [include for include in self.includes if isinstance(include, range) and include]
+        excluded = [exclude for exclude in self.excludes if isinstance(exclude, range) and exclude]
+        samples = set().union(*(include for include in self.includes if not isinstance(include, range)))
+        excluded_samples = set().union(*(exclude for exclude in self.excludes if not isinstance(exclude, range)))
+
+        def in_ranges(index: int, terms: List[range]) -> bool:
+            return any(index in term for term in terms)
+
+        count = _count_ranges(ranges, excluded)
+        # Indexes of sampled excludes that the range terms counted
+        count -= sum(
+            1 for index in excluded_samples if in_ranges(index, ranges) and not in_ranges(index, excluded)
+        )
+        # Sampled indexes the range terms did not count already
+        count += sum(
+            1 for index in samples
+            if not in_ranges(index, ranges) and not in_ranges(index, excluded) and index not in excluded_samples
+        )
+        return count
+
+    def first(self) -> Optional[int]:
+        """
+        Get the first index of the expression.
+
+        :return: The first index, or None when the expression selects nothing.
+        """
+        return next(iter(self), None)
+
+
+def _within(term: range, start: int, stop: int) -> range:
+    # The indexes of an ascending range between start and stop
+    first = term.start if term.start >= start else term.start - (term.start - start) // term.step * term.step
+    return range(first, min(stop, term.stop), term.step)
+
+
+def _count_ranges(includes: List[range], excludes: List[range]) -> int:
+    # Counts the indexes of any include and no exclude, between consecutive range bounds
+    # the same ranges apply, so each segment is counted over one period of their steps
+    bounds = sorted({bound for term in (*includes, *excludes) for bound in (term.start, term[-1] + 1)})
+    count = 0
+    for start, stop in zip(bounds, bounds[1:]):
+        active = [term for term in includes if term.start < stop and term[-1] >= start]
+        if not active:
+            continue
+        blocked = [term for term in excludes if term.start < stop and term[-1] >= start]
+        terms = active + blocked
+        if all(term.step == 1 for term in terms):
+            count += 0 if blocked else stop - start
+            continue
+
+        def selected(index: int) -> bool:
+            return any(index in term for term in active) and not any(index in term for term in blocked)
+
+        period = math.lcm(*(term.step for term in terms))
+        members = sum((stop - start) // term.step + 1 for term in active)
+        if period < min(stop - start, members):
+            periods, remainder = divmod(stop - start, period)
+            count += periods * sum(1 for index in range(start, start + period) if selected(index))
+            count += sum(1 for index in range(stop - remainder, stop) if selected(index))
+        else:
+            # Sparse steps, walking the members is cheaper than a period
+            candidates = heapq.merge(*(_within(term, start, stop) for term in active))
+            previous = None
+            for index in candidates:
+                if index != previous and not any(index in term for term in blocked):
+                    count += 1
+                previous = index
+    return count
+
+
+def derivation_levels(
+    derivations: Sequence[tuple], indexes: Optional[Dict[int, Iterable[int]]] = None
+) -> List[Level]:
+    """
+    Convert the output of ``IDerivation.derivations()`` into traversable levels.
+
+    Fixed levels ``(index, hardened)`` become a single index, ranges ``(start, end, hardened)``
+    become a lazy ``range``. Every level must be re-iterable, it is walked once per value of
+    the levels above it.
+
+    :param derivations: The derivation levels as returned by ``derivations()``.
+    :param indexes: Optional indexes replacing those of a level, by level position,
+        e.g. compiled :class:`IndexExpression` objects.
+    :return: A list of ``(indexes, hardened)`` pairs.
+    """
+    levels: List[Level] = []
+    for position, level in enumerate(derivations):
+        if indexes and position in indexes:
+            levels.append((indexes[position], level[-1]))
+        elif len(level) == 3:
+            levels.append((range(level[0], level[1] + 1), level[2]))
+        else:
+            levels.append(((level[0],), level[1]))
+    return levels
+
+
+def path_count(levels: Sequence[Level]) -> int:
+    """
+    Count the paths :func:`traverse` yields without walking them.
+
+    :param levels: The levels to count, see :func:`derivation_levels`.
+    :return: The exact number of paths.
+    """
+    count = 1
+    for indexes, _ in levels:
+        count *= len(indexes)
+    return count
+
+
+def _seek(indexes: Iterable[int], offset: int) -> Iterator[int]:
+    if isinstance(indexes, (range, list, tuple)):
+        return iter(indexes[offset:])
+    return itertools.islice(iter(indexes), offset, None)
+
+
+def traverse(levels: Sequence[Level], start: int = 0) -> Iterator[Indexes]:
+    """
+    Lazily walk every combination of indexes, the last level changing fastest.
+
+    Works like an odometer over the levels instead of ``itertools.product``, which would
+    materialize every level in memory before yielding the first combination.
+
+    :param levels: The levels to walk, see :func:`derivation_levels`.
+    :param start: The position of the first combination to yield, earlier ones are skipped
+        without being generated.
+    :return: An iterator over tuples of ``(index, hardened)`` pairs, one per level.
+    """
+    if not levels:
+        if start == 0:
+            yield ()
+        return
+
+    # Split the start position into one offset per level, like the digits of a number
+    offsets: List[int] = []
+    for indexes, _ in reversed(levels):
+        start, offset = divmod(start, len(indexes)) if len(indexes) else (start, 0)
+        offsets.insert(0, offset)
+    if start:
+        return
+
+    iterators = [_seek(indexes, offset) for (indexes, _), offset in zip(levels, offsets)]
+    current: List[int] = []
+    for iterator in iterators:
+        index = next(iterator, None)
+        if index is None:
+            return
+        current.append(index)
+    hardened = [level[1] for level in levels]
+
+    while True:
+        yield tuple(zip(current, hardened))
+
+        position = len(levels) - 1
+        while position >= 0:
+            index = next(iterators[position], None)
+            if index is not None:
+                current[position] = index
+                break
+            iterators[position] = iter(levels[position][0])
+            current[position] = next(iterators[position])
+            position -= 1
+        if position < 0:
+            return
+
+
+def derivation_at(name: str, indexes: Indexes) -> IDerivation:
+    """
+    Build the derivation of a single path produced by :func:`traverse`.
+
+    :param name: The derivation name, e.g. ``BIP44`` or ``Custom``.
+    :param indexes: The ``(index, hardened)`` pair of every level.
+    :return: The derivation instance for that path.
+    """
+    derivation = DERIVATIONS.derivation(name=name)
+    if name in ("BIP44", "BIP49", "BIP84", "BIP86"):
+        return derivation(
+            coin_type=indexes[1][0], account=indexes[2][0], change=indexes[3][0], address=indexes[4][0]
+        )
+    elif name == "CIP1852":
+        return derivation(
+            coin_type=indexes[1][0], account=indexes[2][0], role=indexes[3][0], address=indexes[4][0]
+        )
+    elif name == "Electrum":
+        return derivation(change=indexes[0][0], address=indexes[1][0])
+    elif name == "Monero":
+        return derivation(minor=indexes[0][0], major=indexes[1][0])
+    elif name == "HDW":
+        return derivation(account=indexes[0][0], ecc=indexes[1][0], address=indexes[2][0])
+    return derivation(
+        path="m/" + "/".join(
+            f"{index}'" if hardened else str(index) for index, hardened in indexes
+        )
+    )
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Callable, Container, Iterator, Optional, Tuple
+)
+
+import hashlib
+import math
+import os
+
+
+def normalize_address(address: str) -> str:
+    """
+    Normalize an address for comparison, hex addresses are compared case-insensitively.
+
+    :param address: The address.
+    :return: The normalized address.
+    """
+    address = address.strip()
+    return address.lower() if address[:2] in ("0x", "0X") else address
+
+
+class BloomFilter:
+    """
+    Bloom filter over strings, for address sets too big to hold in a hash set.
+
+    Lookups may return false positives at about ``error_rate``, never false negatives.
+
+    :param capacity: The expected number of items.
+    :param error_rate: The accepted false positive rate.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 1e-6) -> None:
+        capacity = max(capacity, 1)
+        self.size: int = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes: int = max(1, round(self.size / capacity * math.log(2)))
+        self.error_rate: float = error_rate
+        self.bits: bytearray = bytearray((self.size + 7) // 8)
+
+    def __positions(self, item: str) -> Iterator[int]:
+        # Double hashing, the k positions are derived from one 128 bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return ((first + index * second) % self.size for index in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for position in self.__positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.__positions(item))
+
+
+def load_addresses(filepath: str, bloom_above: int = 64 * 1024 * 1024, error_rate: float = 1e-6) -> Container[str]:
+    """
+    Load a set of addresses, one per line.
+
+    Files up to ``bloom_above`` bytes are loaded into a hash set, bigger ones into a
+    :class:`BloomFilter`, which takes a fraction of the memory but may report false positives.
+
+    :param filepath: The address file, empty lines and lines starting with ``#`` are skipped.
+    :param bloom_above: The file size above which a Bloom filter is used.
+    :param error_rate: The false positive rate of the Bloom filter.
+    :return: The address set, supporting ``in`` with normalized addresses.
+    """
+    def addresses() -> Iterator[str]:
+        with open(filepath, "r", encoding="utf-8") as lines:
+            for line in lines:
+                # Exports often carry more columns, the address comes first
+                address = line.split(",", 1)[0].strip()
+                if address and not address.startswith("#"):
+                    yield normalize_address(address)
+
+    if os.path.getsize(filepath) <= bloom_above:
+        return set(addresses())
+    bloom = BloomFilter(sum(1 for _ in addresses()), error_rate)
+    for address in addresses():
+        bloom.add(address)
+    return bloom
+
+
+def discover(
+    derive: Callable[[int, int, int], Tuple[str, str]],
+    addresses: Container[str],
+    gap_limit: int = 20,
+    account: int = 0,
+    changes: Tuple[int, ...] = (0, 1),
+    cancelled: Optional[Callable[[], bool]] = None
+) -> Iterator[Tuple[int, int, int, str, str]]:
+    """
+    Find the used addresses of a wallet, following the BIP44 gap limit.
+
+    Every chain of an account is scanned until ``gap_limit`` consecutive addresses are
+    missing from the set. The next account is scanned while the previous one had hits.
+
+    :param derive: Gets the path and address of ``(account, change, index)``.
+    :param addresses: The used addresses, see :func:`load_addresses`.
+    :param gap_limit: The number of consecutive misses that end a chain.
+    :param account: The first account to scan.
+    :param changes: The chains of every account, external and internal by default.
+    :param cancelled: Returns True to stop scanning.
+    :return: An iterator over ``(account, change, index, path, address)`` hits.
+    """
+    while True:
+        used = False
+        for change in changes:
+            index, misses = 0, 0
+            while misses < gap_limit:
+                if cancelled is not None and cancelled():
+                    return
+                path, address = derive(account, change, index)
+                if normalize_address(address) in addresses:
+                    used, misses = True, 0
+                    yield account, change, index, path, address
+                else:
+                    misses += 1
+                index += 1
+        if not used:
+            return
+        account += 1
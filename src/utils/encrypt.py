@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Dict, Iterator, List, Optional, Tuple, Type
+)
+
+import csv
+import inspect
+import os
+
+from bip38 import (
+    cryptocurrencies, BIP38
+)
+
+from src.utils.pool import process_count
+
+# Memory of one BIP38 scrypt run, 128 * r * N bytes with N = 16384 and r = 8
+SCRYPT_MEMORY: int = 128 * 8 * 16384
+# Memory of an idle worker process, which imports the app utilities and hdwallet
+WORKER_MEMORY: int = 96 * 1024 * 1024
+
+# BIP38 cryptocurrencies by name, as hdwallet names them
+BIP38_CRYPTOCURRENCIES: Dict[str, Type[cryptocurrencies.ICryptocurrency]] = {
+    name: cls for name, cls in inspect.getmembers(cryptocurrencies, inspect.isclass)
+    if issubclass(cls, cryptocurrencies.ICryptocurrency)
+}
+
+
+def available_memory() -> Optional[int]:
+    """
+    Get the memory available to new processes.
+
+    :return: The available bytes, or None when the platform does not tell.
+    """
+    try:
+        with open("/proc/meminfo", "r", encoding="utf-8") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def bip38_processes(memory: Optional[int] = None) -> int:
+    """
+    Get the number of BIP38 worker processes, one per core unless memory runs out first.
+
+    :param memory: The available memory, detected when None.
+    :return: The number of processes, at least one.
+    """
+    memory = memory if memory is not None else available_memory()
+    if memory is None:
+        return process_count()
+    # Half the available memory, the rest of the system keeps running meanwhile
+    return max(1, min(process_count(), memory // 2 // (WORKER_MEMORY + SCRYPT_MEMORY)))
+
+
+def bip38(cryptocurrency: str, network: str) -> BIP38:
+    """
+    Get the BIP38 codec of a cryptocurrency.
+
+    :param cryptocurrency: The hdwallet cryptocurrency name, e.g. ``Bitcoin``.
+    :param network: The network name, e.g. ``mainnet``.
+    :return: The codec.
+    """
+    if cryptocurrency not in BIP38_CRYPTOCURRENCIES:
+        raise ValueError(f"BIP38 is not supported for {cryptocurrency}")
+    return BIP38(cryptocurrency=BIP38_CRYPTOCURRENCIES[cryptocurrency], network=network)
+
+
+def read_wifs(filepath: str, passphrase: str) -> Iterator[Tuple[int, str, str]]:
+    """
+    Read a file of WIFs, one per line, optionally followed by its own passphrase.
+
+    :param filepath: The file, as ``wif`` or ``wif,passphrase`` CSV lines, empty lines and
+        lines starting with ``#`` are skipped.
+    :param passphrase: The passphrase of lines without one.
+    :return: An iterator over ``(line number, wif, passphrase)``.
+    """
+    with open(filepath, "r", encoding="utf-8", newline="") as lines:
+        for number, row in enumerate(csv.reader(lines), start=1):
+            if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                continue
+            yield number, row[0].strip(), row[1] if len(row) > 1 and row[1] != "" else passphrase
+
+
+def convert_wifs(
+    items: List[List[Tuple[int, str, str]]], mode: str, cryptocurrency: str, network: str
+) -> List[List[Tuple[int, str, Optional[str], Optional[str]]]]:
+    """
+    Encrypt or decrypt chunks of WIFs, run in a worker process.
+
+    :param items: Chunks of ``(line number, wif, passphrase)``, see :func:`read_wifs`.
+    :param mode: ``encrypt`` or ``decrypt``.
+    :param cryptocurrency: The hdwallet cryptocurrency name.
+    :param network: The network name.
+    :return: ``(line number, wif, result, error)`` per line, chunk by chunk, in order.
+    """
+    codec = bip38(cryptocurrency, network)
+    results: List[List[Tuple[int, str, Optional[str], Optional[str]]]] = []
+    for chunk in items:
+        converted: List[Tuple[int, str, Optional[str], Optional[str]]] = []
+        for number, wif, passphrase in chunk:
+            try:
+                if mode == "encrypt":
+                    result = codec.encrypt(wif=wif, passphrase=passphrase)
+                else:
+                    result = codec.decrypt(encrypted_wif=wif, passphrase=passphrase)
+            except Exception as e:
+                converted.append((number, wif, None, str(e) or type(e).__name__))
+                continue
+            converted.append((number, wif, result, None))
+        results.append(converted)
+    return results
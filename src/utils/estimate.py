@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from dataclasses import dataclass, replace
+from typing import (
+    Dict, List, Optional, Tuple
+)
+
+
+def format_size(size: float) -> str:
+    """
+    Format a number of bytes for display.
+
+    :param size: The number of bytes.
+    :return: The size with a binary unit, e.g. ``12.4 MB``.
+    """
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration for display.
+
+    :param seconds: The duration in seconds.
+    :return: The duration, e.g. ``2h 5m``, ``3m 20s`` or ``0.4s``.
+    """
+    if seconds < 10:
+        return f"{seconds:.1f}s"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days}d {hours}h"
+    elif hours:
+        return f"{hours}h {minutes}m"
+    elif minutes:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+@dataclass(frozen=True, slots=True)
+class DumpEstimate:
+    """
+    Projected cost of a dump, extrapolated from a few calibration rows.
+
+    ``formats`` holds the projected duration of every output format, ``paced`` the part of
+    ``seconds`` spent pacing the terminal output.
+    """
+    rows: int
+    format: str
+    seconds: float
+    size: int
+    memory: int
+    paced: float
+    formats: Tuple[Tuple[str, float], ...]
+    backend: Optional[str] = None
+
+    def times(self, count: int, processes: int = 1) -> "DumpEstimate":
+        """
+        Scale the estimate to several dumps of the same size, e.g. one per coin.
+
+        :param count: The number of dumps.
+        :param processes: The number of processes the dumps are spread over.
+        :return: The estimate of all the dumps.
+        """
+        speedup = max(1, min(count, processes))
+        return replace(
+            self,
+            rows=self.rows * count,
+            seconds=self.seconds * count / speedup,
+            size=self.size * count,
+            paced=self.paced * count / speedup,
+            formats=tuple((name, seconds * count / speedup) for name, seconds in self.formats)
+        )
+
+    def label(self) -> str:
+        """
+        Get the short form of the estimate shown next to the dump buttons.
+
+        :return: The duration, output size and memory of the dump.
+        """
+        return f"~{format_duration(self.seconds)} · {format_size(self.size)} · {format_size(self.memory)} RAM"
+
+    def summary(self) -> str:
+        """
+        Get the full estimate, including which output is the fastest.
+
+        :return: A multi-line description of the estimate.
+        """
+        lines: List[str] = [
+            f"Rows: {self.rows:,}",
+            f"Duration: ~{format_duration(self.seconds)} ({self.format})",
+            f"Output size: ~{format_size(self.size)}",
+            f"Peak memory: ~{format_size(self.memory)}"
+        ]
+        for name, seconds in self.formats:
+            if name != self.format and seconds < self.seconds * 0.9:
+                lines.append(f"{name} output would take ~{format_duration(seconds)}")
+        if self.backend is not None:
+            lines.append(f"secp256k1 backend: {self.backend}")
+        if self.paced > self.seconds * 0.5:
+            lines.append(
+                f"Terminal output pacing accounts for ~{format_duration(self.paced)}, "
+                f"saving to a file is paced the same way as it also prints every row"
+            )
+        return "\n".join(lines)
+
+
+def estimate_dump(
+    rows: int,
+    dformat: str,
+    derive_seconds: float,
+    row_bytes: float,
+    row_lines: float,
+    header_bytes: int,
+    pacing: Dict[str, float],
+    chunk_size: int,
+    terminal_lines: int,
+    backend: Optional[str] = None
+) -> DumpEstimate:
+    """
+    Extrapolate the cost of a dump from calibration measurements.
+
+    :param rows: The exact number of rows the dump produces.
+    :param dformat: The selected output format.
+    :param derive_seconds: Measured seconds to derive and serialize one row.
+    :param row_bytes: Measured average size of one output row.
+    :param row_lines: Measured average number of lines of one output row.
+    :param header_bytes: Size of the output written before the rows, e.g. the JSON root.
+    :param pacing: Seconds the terminal output sleeps per row, by format.
+    :param chunk_size: The number of rows buffered before they are written.
+    :param terminal_lines: The number of lines the terminal keeps.
+    :param backend: The secp256k1 backend, for coins on that curve.
+    :return: The projected cost of the dump.
+    """
+    size = int(header_bytes + rows * row_bytes)
+    # Rows of the current chunk plus what the terminal keeps on screen
+    terminal = min(rows * row_lines, terminal_lines) * (row_bytes / max(row_lines, 1))
+    memory = int(min(rows, chunk_size) * row_bytes + terminal)
+
+    formats = tuple(
+        (name, rows * (derive_seconds + seconds)) for name, seconds in pacing.items()
+    )
+    return DumpEstimate(
+        rows=rows,
+        format=dformat,
+        seconds=rows * (derive_seconds + pacing[dformat]),
+        size=size,
+        memory=memory,
+        paced=rows * pacing[dformat],
+        formats=formats,
+        backend=backend
+    )
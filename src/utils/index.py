@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Iterable, List, Optional, Tuple
+)
+
+import os
+import re
+import sqlite3
+
+from hdwallet import HDWallet
+
+from src.utils.checkpoint import fingerprint
+from src.utils.discovery import normalize_address
+
+# Where dumps are indexed unless HDWALLET_INDEX names another file
+INDEX_FILEPATH: str = os.path.join(os.path.expanduser("~"), ".hdwallet", "index.sqlite")
+
+# Derivation paths, anything else looked up is taken for an address
+_PATH = re.compile(r"^m(/\d+'?)*$")
+# Root fields a wallet built from the seed of a mnemonic lacks, the seed already determines its keys
+_MNEMONIC_FIELDS = frozenset({"entropy", "strength", "mnemonic", "passphrase", "language"})
+
+
+def index_filepath() -> str:
+    """
+    Get the file of the address index.
+
+    :return: The ``HDWALLET_INDEX`` environment variable, or :data:`INDEX_FILEPATH`.
+    """
+    return os.path.expanduser(os.environ.get("HDWALLET_INDEX", INDEX_FILEPATH))
+
+
+def root_fingerprint(hd: HDWallet) -> str:
+    """
+    Get the fingerprint entries of a root are indexed under.
+
+    A root built from a mnemonic and one built from its seed share the fingerprint, so
+    multi-coin dumps, which derive every coin from the seed, index the same root.
+
+    :param hd: The root HDWallet.
+    :return: The fingerprint, see :func:`fingerprint`.
+    """
+    return fingerprint(hd.dump(exclude={"derivation", *_MNEMONIC_FIELDS}))
+
+
+class AddressIndex:
+    """
+    Persistent address to path index of dumped wallets, in both directions.
+
+    Every entry holds an address, its path, coin and network and the fingerprint of the
+    root it was derived from, so looking up a dumped address or path takes one indexed
+    query instead of deriving the wallet again. Entries are unique, indexing a dump twice
+    keeps one copy of each.
+
+    Connections are not shared between threads, open one index per thread.
+
+    :param filepath: The index file, created with its directory when missing.
+    """
+
+    def __init__(self, filepath: Optional[str] = None) -> None:
+        self.filepath: str = filepath if filepath is not None else index_filepath()
+        self.added: int = 0
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(self.filepath, timeout=30)
+        # Lookups keep working while a dump writes to the index
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS addresses ("
+            "normalized TEXT NOT NULL, address TEXT NOT NULL, path TEXT NOT NULL, "
+            "coin TEXT NOT NULL, network TEXT NOT NULL, root TEXT NOT NULL, "
+            "PRIMARY KEY (root, coin, network, path, address)"
+            ") WITHOUT ROWID"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS addresses_normalized ON addresses (normalized)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS addresses_path ON addresses (path)")
+        self.connection.commit()
+
+    def __enter__(self) -> "AddressIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, entries: Iterable[Tuple[str, str, str, str, str]]) -> None:
+        """
+        Add entries and commit them.
+
+        :param entries: ``(address, path, coin, network, root fingerprint)`` entries.
+        """
+        cursor = self.connection.executemany(
+            "INSERT OR IGNORE INTO addresses VALUES (?, ?, ?, ?, ?, ?)",
+            ((normalize_address(address), address, path, coin, network, root)
+             for address, path, coin, network, root in entries)
+        )
+        self.added += cursor.rowcount
+        self.connection.commit()
+
+    def lookup(self, query: str, limit: int = 100) -> List[Tuple[str, str, str, str, str]]:
+        """
+        Look up an address or a path.
+
+        :param query: An address, or a path like ``m/44'/0'/0'/0/5``.
+        :param limit: The maximum number of entries returned.
+        :return: ``(address, path, coin, network, root fingerprint)`` entries.
+        """
+        query = query.strip()
+        if _PATH.match(query):
+            column, value = "path", query
+        else:
+            column, value = "normalized", normalize_address(query)
+        return self.connection.execute(
+            f"SELECT address, path, coin, network, root FROM addresses WHERE {column} = ? "
+            "ORDER BY root, coin, network, path LIMIT ?",
+            (value, limit)
+        ).fetchall()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM addresses").fetchone()[0]
+
+    def close(self) -> None:
+        self.connection.close()
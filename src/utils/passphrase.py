@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import List
+
+import math
+import secrets
+
+
+def passphrase_entropy(characters: str, length: int) -> float:
+    """
+    Calculate the entropy of a passphrase drawn uniformly from a character set.
+
+    :param characters: The character set.
+    :param length: The passphrase length.
+    :return: The entropy in bits.
+    :rtype: float
+    """
+    return length * math.log2(len(characters))
+
+
+def generate_passphrases(characters: str, length: int, count: int = 1) -> List[str]:
+    """
+    Generate passphrases from a cryptographically secure random source.
+
+    Random bytes are drawn in bulk and mapped onto the character set with a single
+    ``bytes.translate`` call, which also deletes the bytes that would bias the
+    result (rejection sampling), so no Python code runs per character.
+
+    :param characters: The character set, unique ASCII characters.
+    :param length: The length of each passphrase.
+    :param count: The number of passphrases to generate.
+    :return: The generated passphrases.
+    :rtype: List[str]
+    """
+    if not characters or len(set(characters)) != len(characters) or not characters.isascii():
+        raise ValueError("Characters must be a non-empty set of unique ASCII characters")
+
+    size = len(characters)
+    # Accept only bytes below the largest multiple of the set size so each
+    # character is equally likely, e.g. 62 characters keep bytes 0..247
+    limit = 256 - (256 % size)
+    table = bytes(ord(characters[byte % size]) for byte in range(256))
+    rejected = bytes(range(limit, 256))
+
+    required = length * count
+    buffer = bytearray()
+    while len(buffer) < required:
+        missing = required - len(buffer)
+        buffer += secrets.token_bytes(missing * 256 // limit + 16).translate(table, rejected)
+
+    text = buffer[:required].decode("ascii")
+    return [text[index:index + length] for index in range(0, required, length)]
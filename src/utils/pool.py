@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from typing import (
+    Iterable, Iterator, Callable, Optional, List, Any
+)
+
+import itertools
+import multiprocessing
+import os
+
+
+def process_count() -> int:
+    """
+    Get the number of worker processes to use for CPU bound jobs.
+
+    :return: The number of usable CPU cores, at least one.
+    :rtype: int
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    """
+    Split an iterable into lists of at most ``size`` items.
+
+    :param iterable: The iterable to split.
+    :param size: The maximum number of items per chunk.
+    :return: An iterator over the chunks.
+    """
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def imap_ordered(
+    function: Callable[[List], List],
+    iterable: Iterable,
+    processes: Optional[int] = None,
+    chunksize: int = 64,
+    initializer: Optional[Callable] = None,
+    initargs: tuple = ()
+) -> Iterator[Any]:
+    """
+    Apply a function to chunks of an iterable in a process pool, yielding the results in input order.
+
+    The function receives a list of items and must return a list of results of the same length.
+    Only a bounded window of chunks is in flight at any time, so arbitrarily long inputs can be
+    streamed without reading them into memory first.
+
+    :param function: A picklable, module level function mapping a chunk of items to a list of results.
+    :param iterable: The items to process.
+    :param processes: The number of worker processes, defaults to the number of CPU cores.
+    :param chunksize: The number of items sent to a worker process at once.
+    :param initializer: Optional callable run once in every worker process.
+    :param initargs: Arguments passed to the initializer.
+    :return: An iterator over the results.
+    """
+    processes = processes or process_count()
+    # Spawn instead of fork, forking a process that runs Qt threads is unsafe
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=context, initializer=initializer, initargs=initargs
+    ) as executor:
+        pending = deque()
+        for chunk in chunked(iterable, chunksize):
+            pending.append(executor.submit(function, chunk))
+            if len(pending) >= processes * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
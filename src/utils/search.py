@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from dataclasses import dataclass
+from typing import (
+    Any, Dict, List, Optional, Sequence, Tuple
+)
+
+from hdwallet import HDWallet
+from hdwallet.addresses.p2tr import P2TRAddress
+from hdwallet.crypto import hash160
+from hdwallet.ecc import SLIP10Secp256k1PublicKey
+from hdwallet.libs.base58 import check_decode
+from hdwallet.libs.segwit_bech32 import segwit_decode
+from hdwallet.utils import get_bytes
+
+from src.utils.cache import (
+    RootCache, RootRecipe
+)
+from src.utils.derivation import (
+    Indexes, derivation_at
+)
+from src.utils.discovery import normalize_address
+
+# Script semantics searched by hash, in the order they are tried
+SEMANTICS: Tuple[str, ...] = ("P2PKH", "P2SH-P2WPKH", "P2WPKH", "P2TR")
+
+# Roots of a search worker process, kept warm between chunks
+roots: Optional[RootCache] = None
+
+
+@dataclass(frozen=True, slots=True)
+class Targets:
+    """
+    Addresses to search for, keyed by what a derived key is compared with.
+
+    ``hashes`` maps ``(semantic, hash)`` to the address, where the hash is the public key
+    hash, script hash or taproot output key the address encodes. Addresses of other coins
+    go to ``addresses``, keyed by their normalized form.
+    """
+    hashes: Dict[Tuple[str, bytes], str]
+    addresses: Dict[str, str]
+
+    def semantics(self) -> Tuple[str, ...]:
+        """
+        Get the semantics worth deriving, those of at least one target.
+
+        :return: The semantics, in search order.
+        """
+        searched = {semantic for semantic, _ in self.hashes}
+        return tuple(semantic for semantic in SEMANTICS if semantic in searched)
+
+    def __len__(self) -> int:
+        return len(self.hashes) + len(self.addresses)
+
+
+def prefix_bytes(prefix: Optional[int]) -> Optional[bytes]:
+    if prefix is None:
+        return None
+    return prefix.to_bytes(max(1, (prefix.bit_length() + 7) // 8), "big")
+
+
+def decode_targets(addresses: Sequence[str], network: Any) -> Targets:
+    """
+    Decode target addresses into the hashes they commit to.
+
+    :param addresses: The target addresses.
+    :param network: The network class of the cryptocurrency, e.g. ``Bitcoin.NETWORKS.MAINNET``.
+    :return: The targets.
+    """
+    hashes: Dict[Tuple[str, bytes], str] = {}
+    others: Dict[str, str] = {}
+    hrp = getattr(network, "HRP", None)
+    public_key_prefix = prefix_bytes(getattr(network, "PUBLIC_KEY_ADDRESS_PREFIX", None))
+    script_prefix = prefix_bytes(getattr(network, "SCRIPT_ADDRESS_PREFIX", None))
+
+    for address in addresses:
+        if hrp and address.lower().startswith(f"{hrp}1"):
+            version, program = segwit_decode(hrp, address.lower())
+            if version == 0 and program is not None and len(program) == 20:
+                hashes[("P2WPKH", bytes(program))] = address
+                continue
+            elif version == 1 and program is not None and len(program) == 32:
+                hashes[("P2TR", bytes(program))] = address
+                continue
+        try:
+            data = check_decode(address)
+        except Exception:
+            data = None
+        if data is not None and len(data) > 20:
+            if data[:-20] == public_key_prefix:
+                hashes[("P2PKH", data[-20:])] = address
+                continue
+            elif data[:-20] == script_prefix:
+                hashes[("P2SH-P2WPKH", data[-20:])] = address
+                continue
+        others[normalize_address(address)] = address
+    return Targets(hashes=hashes, addresses=others)
+
+
+def match(hd: HDWallet, targets: Targets, semantics: Sequence[str]) -> List[Tuple[str, str]]:
+    """
+    Check the current derivation of a wallet against the targets.
+
+    Only the public key is computed, each semantic then costs one or two hashes and a
+    set lookup, no address is encoded.
+
+    :param hd: The derived HDWallet.
+    :param targets: The targets.
+    :param semantics: The semantics to try.
+    :return: ``(semantic, address)`` of every matching target.
+    """
+    matches: List[Tuple[str, str]] = []
+    if semantics:
+        compressed = get_bytes(hd.compressed())
+        key_hash = hash160(compressed)
+        for semantic in semantics:
+            if semantic == "P2PKH":
+                # Follows the public key type the root was built with
+                found = targets.hashes.get((semantic, hash160(get_bytes(hd.public_key()))))
+            elif semantic == "P2SH-P2WPKH":
+                found = targets.hashes.get((semantic, hash160(b"\x00\x14" + key_hash)))
+            elif semantic == "P2WPKH":
+                found = targets.hashes.get((semantic, key_hash))
+            else:
+                found = targets.hashes.get((
+                    semantic, P2TRAddress.tweak_public_key(SLIP10Secp256k1PublicKey.from_bytes(compressed))
+                ))
+            if found is not None:
+                matches.append((semantic, found))
+    if targets.addresses:
+        found = targets.addresses.get(normalize_address(hd.address()))
+        if found is not None:
+            matches.append(("address", found))
+    return matches
+
+
+def initialize(ttl: int = 300) -> None:
+    """
+    Set up a search worker process.
+
+    :param ttl: Seconds a root stays cached after it was built.
+    """
+    global roots
+    roots = RootCache(ttl=ttl)
+
+
+def search_paths(
+    items: List[List[Indexes]], recipe: RootRecipe, derivation_name: str, targets: Targets
+) -> List[Tuple[int, List[Tuple[str, str, str]]]]:
+    """
+    Search chunks of paths for the targets, run in a search worker process.
+
+    :param items: Chunks of paths.
+    :param recipe: The root.
+    :param derivation_name: The derivation, see :func:`derivation_at`.
+    :param targets: The targets.
+    :return: ``(searched paths, [(path, semantic, address), ...])`` per chunk, in order.
+    """
+    if roots is None:
+        initialize()
+    hd = roots.get_or_create(recipe.key(), recipe.build)
+    semantics = targets.semantics()
+
+    results: List[Tuple[int, List[Tuple[str, str, str]]]] = []
+    for paths in items:
+        found: List[Tuple[str, str, str]] = []
+        for path in paths:
+            hd.update_derivation(derivation=derivation_at(derivation_name, path))
+            for semantic, address in match(hd, targets, semantics):
+                found.append((hd.path(), semantic, address))
+        results.append((len(paths), found))
+    return results
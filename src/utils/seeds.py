@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    List, Tuple
+)
+
+from hdwallet.seeds import (
+    BIP39Seed, CardanoSeed, ElectrumV2Seed, SEEDS
+)
+
+
+def seed_from_mnemonic(
+    seed_client: str, mnemonic: str, passphrase: str = "", mnemonic_type: str = "", cardano_type: str = ""
+) -> str:
+    """
+    Derive a seed from a mnemonic with the given seed client.
+
+    :param seed_client: The seed client name, e.g. 'BIP39'.
+    :param mnemonic: The mnemonic phrase.
+    :param passphrase: Optional passphrase, ignored by clients that do not support it.
+    :param mnemonic_type: The Electrum-V2 mnemonic type.
+    :param cardano_type: The Cardano type.
+    :return: The seed as a hex string.
+    """
+    if CardanoSeed.name() == seed_client:
+        return CardanoSeed.from_mnemonic(mnemonic=mnemonic, cardano_type=cardano_type, passphrase=passphrase)
+    elif ElectrumV2Seed.name() == seed_client:
+        return ElectrumV2Seed.from_mnemonic(mnemonic=mnemonic, mnemonic_type=mnemonic_type, passphrase=passphrase)
+    elif BIP39Seed.name() == seed_client:
+        return BIP39Seed.from_mnemonic(mnemonic=mnemonic, passphrase=passphrase)
+    return SEEDS.seed(seed_client).from_mnemonic(mnemonic=mnemonic)
+
+
+def parse_seed_line(line: str) -> Tuple[str, str]:
+    """
+    Split a batch input line into its mnemonic and optional passphrase.
+
+    Lines are either ``mnemonic`` or ``mnemonic<TAB>passphrase``.
+
+    :param line: The input line.
+    :return: A tuple of mnemonic and passphrase.
+    """
+    mnemonic, _, passphrase = line.rstrip("\r\n").partition("\t")
+    return " ".join(mnemonic.split()), passphrase
+
+
+def batch_seeds(lines: List[str], seed_client: str, mnemonic_type: str = "", cardano_type: str = "") -> List[str]:
+    """
+    Derive the seeds for a chunk of batch input lines, run inside the process pool.
+
+    A line that fails to derive yields an ``ERROR:`` entry so the output stays aligned with the input.
+
+    :param lines: The input lines.
+    :param seed_client: The seed client name.
+    :param mnemonic_type: The Electrum-V2 mnemonic type.
+    :param cardano_type: The Cardano type.
+    :return: One seed, or error message, per input line.
+    """
+    seeds: List[str] = []
+    for line in lines:
+        mnemonic, passphrase = parse_seed_line(line)
+        if mnemonic == "":
+            seeds.append("")
+            continue
+        try:
+            seeds.append(seed_from_mnemonic(
+                seed_client=seed_client, mnemonic=mnemonic, passphrase=passphrase,
+                mnemonic_type=mnemonic_type, cardano_type=cardano_type
+            ))
+        except Exception as e:
+            seeds.append(f"ERROR: {e}")
+    return seeds
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    List, Optional, Tuple
+)
+
+import glob
+import os
+import re
+import shutil
+
+from src.utils.checkpoint import checkpoint_path
+
+
+def parse_shard(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a shard written as ``k of n`` or ``k/n``.
+
+    :param text: The shard text, empty for an unsharded dump.
+    :return: The one based shard number and the shard count, or None when empty.
+    """
+    text = text.strip()
+    if text == "":
+        return None
+    match = re.fullmatch(r"(\d+)\s*(?:of|/)\s*(\d+)", text)
+    if match is None:
+        raise ValueError(f"Invalid shard '{text}', expected e.g. 2 of 4")
+    shard, count = int(match.group(1)), int(match.group(2))
+    if not 1 <= shard <= count:
+        raise ValueError(f"Invalid shard '{text}', shard must be between 1 and {count}")
+    return shard, count
+
+
+def shard_bounds(total: int, shard: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+    """
+    Get the positions a shard covers out of all paths of a dump.
+
+    Shards are contiguous blocks in traversal order, so concatenating them in shard order
+    gives the same rows, in the same order, as an unsharded dump.
+
+    :param total: The number of paths of the whole dump.
+    :param shard: The shard number and count, or None for the whole dump.
+    :return: The first position and the position after the last one.
+    """
+    if shard is None:
+        return 0, total
+    number, count = shard
+    return (number - 1) * total // count, number * total // count
+
+
+def shard_filepath(filepath: str, shard: Optional[Tuple[int, int]]) -> str:
+    """
+    Get the output file of a shard, e.g. ``dump.shard-2-of-4.csv`` for ``dump.csv``.
+
+    :param filepath: The output file of the whole dump.
+    :param shard: The shard number and count, or None for the whole dump.
+    :return: The output file of the shard.
+    """
+    if shard is None:
+        return filepath
+    root, extension = os.path.splitext(filepath)
+    return f"{root}.shard-{shard[0]}-of-{shard[1]}{extension}"
+
+
+def merge_shards(filepath: str) -> Tuple[int, int]:
+    """
+    Merge the shard outputs of a dump into one file, ordered by path.
+
+    Every shard ``1..n`` must be present and finished, i.e. without a pending checkpoint.
+
+    :param filepath: The output file of the whole dump, its shards are looked up next to it.
+    :return: The number of merged shards and the size of the merged file.
+    """
+    root, extension = os.path.splitext(filepath)
+    if extension.lower() in (".sqlite", ".arrow", ".parquet"):
+        raise ValueError(f"{extension[1:]} shards are not merged by concatenation, query them together instead")
+    pattern = re.compile(rf"{re.escape(root)}\.shard-(\d+)-of-(\d+){re.escape(extension)}")
+    shards: List[Tuple[int, int, str]] = []
+    for path in glob.glob(f"{glob.escape(root)}.shard-*-of-*{glob.escape(extension)}"):
+        match = pattern.fullmatch(path)
+        if match is not None:
+            shards.append((int(match.group(1)), int(match.group(2)), path))
+
+    counts = {count for _, count, _ in shards}
+    if not shards:
+        raise ValueError(f"No shards found for {filepath}")
+    elif len(counts) != 1:
+        raise ValueError(f"Shards of {filepath} were written with different shard counts {sorted(counts)}")
+    count = counts.pop()
+    missing = set(range(1, count + 1)) - {number for number, _, _ in shards}
+    if missing:
+        raise ValueError(f"Missing shards {sorted(missing)} of {count}")
+    for _, _, path in shards:
+        if os.path.exists(checkpoint_path(path)):
+            raise ValueError(f"{path} is not finished, resume it before merging")
+
+    with open(filepath, "wb") as merged:
+        for _, _, path in sorted(shards):
+            with open(path, "rb") as shard:
+                shutil.copyfileobj(shard, merged)
+        return count, merged.tell()
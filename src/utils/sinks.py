@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from abc import (
+    ABC, abstractmethod
+)
+from typing import (
+    Any, Dict, List, Optional, Tuple, Type
+)
+
+import os
+import sqlite3
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Optional, Arrow and Parquet exports are offered only when installed
+    pyarrow = None
+
+
+class Sink(ABC):
+    """
+    Table export a dump streams its rows into, in row groups.
+
+    Every row holds its position, path and address, one column per path component
+    (``path_0``, ``path_1``, ...) and the included dump fields, in that order. An included
+    field named like one of the leading columns, e.g. ``address``, is only stored once.
+
+    :param filepath: The output file, replaced when it exists.
+    :param components: The number of path components.
+    :param fields: The included dump fields, e.g. ``at:path`` or ``address``.
+    :param row_group_size: The number of rows written at once.
+    """
+    extension: str = ""
+    description: str = ""
+
+    def __init__(self, filepath: str, components: int, fields: List[str], row_group_size: int = 65536) -> None:
+        self.filepath: str = filepath
+        self.components: List[str] = [f"path_{index}" for index in range(components)]
+        leading: List[str] = ["position", "path", "address", *self.components]
+        self.selected: List[int] = [index for index, field in enumerate(fields) if field not in leading]
+        self.fields: List[str] = [fields[index] for index in self.selected]
+        self.columns: List[str] = [*leading, *self.fields]
+        self.row_group_size: int = row_group_size
+        self.rows: List[List[Any]] = []
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+    def write(self, rows: List[Tuple[int, str, Optional[str], List[str], List[Any]]]) -> None:
+        """
+        Buffer rows, writing a row group whenever enough are buffered.
+
+        :param rows: ``(position, path, address, components, values)`` rows, ``values``
+            holding the included dump fields.
+        """
+        self.rows.extend(
+            [position, path, address, *components, *[values[index] for index in self.selected]]
+            for position, path, address, components, values in rows
+        )
+        while len(self.rows) >= self.row_group_size:
+            self.write_group(self.rows[:self.row_group_size])
+            del self.rows[:self.row_group_size]
+
+    def close(self) -> None:
+        """
+        Write the remaining rows and finish the file.
+        """
+        if self.rows:
+            self.write_group(self.rows)
+            self.rows = []
+
+    @abstractmethod
+    def write_group(self, rows: List[List[Any]]) -> None:
+        """
+        Write one row group.
+
+        :param rows: The rows, one value per column.
+        """
+
+
+class SQLiteSink(Sink):
+    """
+    SQLite database with a ``dumps`` table, indexed on address and path.
+    """
+    extension: str = "sqlite"
+    description: str = "SQLite Databases (*.sqlite)"
+
+    def __init__(self, filepath: str, components: int, fields: List[str], row_group_size: int = 65536) -> None:
+        super().__init__(filepath, components, fields, row_group_size)
+        self.connection = sqlite3.connect(filepath)
+        # A half written export is discarded anyway, so skip the rollback journal
+        self.connection.execute("PRAGMA journal_mode = OFF")
+        self.connection.execute("PRAGMA synchronous = OFF")
+        columns = ", ".join(
+            ['"position" INTEGER PRIMARY KEY', *[f'"{column}" TEXT' for column in self.columns[1:]]]
+        )
+        self.connection.execute(f"CREATE TABLE dumps ({columns})")
+        self.insert: str = f"INSERT INTO dumps VALUES ({', '.join('?' * len(self.columns))})"
+
+    def write_group(self, rows: List[List[Any]]) -> None:
+        self.connection.executemany(self.insert, rows)
+        self.connection.commit()
+
+    def close(self) -> None:
+        super().close()
+        # Built once at the end, much faster than maintaining them while inserting
+        self.connection.execute('CREATE INDEX dumps_address ON dumps ("address")')
+        self.connection.execute('CREATE INDEX dumps_path ON dumps ("path")')
+        self.connection.commit()
+        self.connection.close()
+
+
+class ArrowSink(Sink):
+    """
+    Arrow IPC file, one record batch per row group, path components dictionary encoded.
+    """
+    extension: str = "arrow"
+    description: str = "Arrow IPC Files (*.arrow)"
+
+    def __init__(self, filepath: str, components: int, fields: List[str], row_group_size: int = 65536) -> None:
+        super().__init__(filepath, components, fields, row_group_size)
+        self.schema = pyarrow.schema([
+            ("position", pyarrow.uint64()),
+            ("path", pyarrow.string()),
+            ("address", pyarrow.string()),
+            *[(column, pyarrow.dictionary(pyarrow.int32(), pyarrow.string())) for column in self.components],
+            *[(column, pyarrow.string()) for column in self.fields]
+        ])
+        # Grow only, so every batch just appends a dictionary delta
+        self.dictionaries: Dict[str, Dict[str, int]] = {column: {} for column in self.components}
+        self.writer = self.open_writer()
+
+    def open_writer(self):
+        return pyarrow.ipc.new_file(
+            self.filepath, self.schema, options=pyarrow.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+        )
+
+    def encode(self, column: str, values: List[str]):
+        dictionary = self.dictionaries[column]
+        indices = [dictionary.setdefault(value, len(dictionary)) for value in values]
+        return pyarrow.DictionaryArray.from_arrays(
+            pyarrow.array(indices, pyarrow.int32()), pyarrow.array(list(dictionary), pyarrow.string())
+        )
+
+    def batch(self, rows: List[List[Any]]):
+        columns = list(zip(*rows))
+        arrays = []
+        for index, column in enumerate(self.columns):
+            values = [None if value is None else value if index == 0 else str(value) for value in columns[index]]
+            if column in self.dictionaries:
+                arrays.append(self.encode(column, values))
+            else:
+                arrays.append(pyarrow.array(values, self.schema.field(column).type))
+        return pyarrow.record_batch(arrays, schema=self.schema)
+
+    def write_group(self, rows: List[List[Any]]) -> None:
+        self.writer.write_batch(self.batch(rows))
+
+    def close(self) -> None:
+        super().close()
+        self.writer.close()
+
+
+class ParquetSink(ArrowSink):
+    """
+    Parquet file, one row group per row group, path components dictionary encoded.
+    """
+    extension: str = "parquet"
+    description: str = "Parquet Files (*.parquet)"
+
+    def open_writer(self):
+        return pyarrow.parquet.ParquetWriter(
+            self.filepath, self.schema, use_dictionary=self.components, compression="zstd"
+        )
+
+    def write_group(self, rows: List[List[Any]]) -> None:
+        self.writer.write_table(
+            pyarrow.Table.from_batches([self.batch(rows)]), row_group_size=self.row_group_size
+        )
+
+
+# Table export formats by name, besides the JSON and CSV text formats
+SINKS: Dict[str, Type[Sink]] = {"SQLite": SQLiteSink}
+if pyarrow is not None:
+    SINKS.update({"Arrow": ArrowSink, "Parquet": ParquetSink})
+
+
+def sink_class(dformat: str) -> Optional[Type[Sink]]:
+    """
+    Get the sink writing a format.
+
+    :param dformat: The export format.
+    :return: The sink class, or None for the JSON and CSV text formats.
+    """
+    return SINKS.get(dformat)
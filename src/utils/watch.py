@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Any, Callable, Dict, Iterator, Mapping, Optional, Set
+)
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import CRYPTOCURRENCIES
+from hdwallet.derivations import IDerivation
+
+# HDs whose derivation dumps are built here, Cardano and BIP141 encode addresses differently
+WATCH_ONLY_HDS: Set[str] = {"BIP32", "BIP44", "BIP49", "BIP84", "BIP86"}
+# Coins whose dumps group their addresses by something other than the address encoding
+SPECIAL_ADDRESSES: Set[str] = {"Avalanche", "Binance", "Bitcoin-Cash", "Bitcoin-Cash-SLP", "eCash", "Tezos"}
+# The single address BIP44 style HDs dump for coins with several address encodings
+HD_ADDRESSES: Dict[str, str] = {
+    "BIP44": "P2PKH", "BIP49": "P2WPKH-In-P2SH", "BIP84": "P2WPKH", "BIP86": "P2TR"
+}
+# Nested sections of a derivation dump
+SECTIONS: Set[str] = {"at", "addresses"}
+
+
+class LazyDump(Mapping):
+    """
+    Derivation dump whose fields are computed when first read.
+
+    :param getters: The field getters, in dump order.
+    """
+
+    def __init__(self, getters: Dict[str, Callable[[], Any]]) -> None:
+        self.getters: Dict[str, Callable[[], Any]] = getters
+        self.computed: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.computed:
+            self.computed[key] = self.getters[key]()
+        return self.computed[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.getters)
+
+    def __len__(self) -> int:
+        return len(self.getters)
+
+
+def lazy_supported(hd: HDWallet) -> bool:
+    """
+    Check whether a wallet can be dumped through :func:`lazy_dump`.
+
+    :param hd: The HDWallet.
+    :return: True for a BIP32 style wallet of a coin with plain address encodings.
+    """
+    return hd.hd() in WATCH_ONLY_HDS and hd.cryptocurrency() not in SPECIAL_ADDRESSES
+
+
+def watch_only(hd: HDWallet) -> bool:
+    """
+    Check whether a wallet is watch-only and can be dumped through :func:`lazy_dump`.
+
+    :param hd: The HDWallet.
+    :return: True for a BIP32 style wallet built from a public or extended public key.
+    """
+    return lazy_supported(hd) and hd.private_key() is None
+
+
+def lazy_dump(hd: HDWallet, derivation: Optional[IDerivation] = None) -> LazyDump:
+    """
+    Get the derivation dump of a wallet, with the fields ``hd.dump`` would hold.
+
+    ``hd.dump`` computes every field, address encoding and private key field before it
+    drops the excluded ones. Here fields are computed when read, so a CSV row of a few
+    fields only costs those, and the private key fields of a watch-only wallet are None
+    without being looked at. Fields are read from ``hd`` itself, so read them before
+    deriving it again.
+
+    :param hd: The HDWallet, see :func:`lazy_supported`.
+    :param derivation: The derivation ``hd`` was updated with, None for a key without one.
+    :return: The derivation dump.
+    """
+    getters: Dict[str, Callable[[], Any]] = {}
+    if derivation is None:
+        pass
+    elif derivation.name() in ("BIP44", "BIP49", "BIP84", "BIP86"):
+        at = {
+            "path": derivation.path, "indexes": derivation.indexes, "depth": hd.depth,
+            "purpose": derivation.purpose, "coin_type": derivation.coin_type, "account": derivation.account,
+            "change": derivation.change, "address": derivation.address
+        }
+    else:
+        at = {"path": derivation.path, "indexes": derivation.indexes, "depth": hd.depth, "index": hd.index}
+    if derivation is not None:
+        getters["at"] = lambda: LazyDump(at)
+
+    private = hd.private_key() is not None
+    getters.update({
+        "xprivate_key": hd.xprivate_key if private else lambda: None,
+        "xpublic_key": hd.xpublic_key,
+        "private_key": hd.private_key if private else lambda: None,
+        "wif": hd.wif if private else lambda: None,
+        "chain_code": hd.chain_code,
+        "public_key": hd.public_key,
+        "uncompressed": hd.uncompressed,
+        "compressed": hd.compressed,
+        "hash": hd.hash,
+        "fingerprint": hd.fingerprint,
+        "parent_fingerprint": hd.parent_fingerprint
+    })
+    addresses = CRYPTOCURRENCIES.cryptocurrency(hd.cryptocurrency()).ADDRESSES
+    if addresses.length() <= 1:
+        getters["address"] = hd.address
+    elif hd.hd() in HD_ADDRESSES:
+        getters["address"] = lambda: hd.address(address=HD_ADDRESSES[hd.hd()])
+    else:
+        getters["addresses"] = lambda: LazyDump({
+            name.lower().replace("-", "_"): (lambda name=name: hd.address(address=name))
+            for name in addresses.get_addresses()
+        })
+    return LazyDump(getters)
+
+
+def to_dict(dump: Mapping, exclude: Set[str]) -> Dict[str, Any]:
+    """
+    Compute a lazy dump into a dictionary, excluding fields the way ``hd.dump`` does.
+
+    :param dump: The dump.
+    :param exclude: The excluded fields, ``at`` drops the whole path section, the
+        fields of other sections are excluded one by one.
+    :return: The dictionary.
+    """
+    exclude = {key.replace("-", "_") for key in exclude}
+    values: Dict[str, Any] = {}
+    for key in dump:
+        if key in SECTIONS:
+            if key == "at" and key in exclude:
+                continue
+            values[key] = {field: value for field, value in dump[key].items() if field not in exclude}
+        elif key not in exclude:
+            values[key] = dump[key]
+    return values
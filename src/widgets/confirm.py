@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import Callable
+
+from PySide6.QtWidgets import (
+    QWidget, QFrame, QLabel, QPushButton, QHBoxLayout
+)
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QCursor
+
+from src.widgets.modal import Modal
+
+
+class Confirm(Modal):
+    """
+    Modal asking to confirm an action before it runs
+    """
+    @staticmethod
+    def show_confirm_modal(
+        main_window: QWidget, parent_frame: QWidget, title: str, message: str, on_confirm: Callable[[], None]
+    ) -> None:
+        """
+        Display a confirmation within the main window.
+
+        :param main_window: The main application window.
+        :param parent_frame: Modal parent frame
+        :param title: The title of the confirmation.
+        :param message: The message explaining what is confirmed.
+        :param on_confirm: Called when the action is confirmed, closing the modal cancels it.
+        """
+        frame: Confirm = Confirm(parent=main_window, parent_frame=parent_frame)
+        frame.height = 260
+
+        title_label = QLabel(title)
+        title_label.setObjectName("confirmTitleQLabel")
+        message_label = QLabel(message)
+        message_label.setWordWrap(True)
+        message_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+
+        buttons = QFrame()
+        buttons_layout = QHBoxLayout(buttons)
+        buttons_layout.setContentsMargins(0, 0, 0, 0)
+        buttons_layout.addStretch()
+
+        frame.cancel_button = QPushButton("Cancel")
+        frame.cancel_button.setCursor(QCursor(Qt.PointingHandCursor))
+        frame.cancel_button.clicked.connect(frame.close)
+        buttons_layout.addWidget(frame.cancel_button)
+
+        def confirmed() -> None:
+            frame.close()
+            on_confirm()
+
+        frame.confirm_button = QPushButton("Continue")
+        frame.confirm_button.setCursor(QCursor(Qt.PointingHandCursor))
+        frame.confirm_button.clicked.connect(confirmed)
+        buttons_layout.addWidget(frame.confirm_button)
+
+        frame.layout().addWidget(title_label)
+        frame.layout().addWidget(message_label, 1)
+        frame.layout().addWidget(buttons)
+        frame.re_adjust()
+        frame.show()
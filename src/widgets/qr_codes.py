@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import List
+
+from PySide6.QtWidgets import (
+    QWidget, QFrame, QLabel, QPushButton, QScrollArea,
+    QVBoxLayout, QHBoxLayout, QGridLayout
+)
+from PySide6.QtCore import (
+    Qt, QSize
+)
+from PySide6.QtGui import (
+    QIcon, QCursor
+)
+
+from src.widgets.modal import Modal
+from src.utils import put_qr_code, resolve_path
+
+
+class QRCodes(Modal):
+    """
+    Modal showing the QR codes of a page of derived addresses
+    """
+    COLUMNS: int = 2
+    SIZE: int = 160
+
+    @staticmethod
+    def show_qr_codes_modal(main_window: QWidget, parent_frame: QWidget, addresses: List[str]) -> None:
+        """
+        Display the QR codes of the given addresses within the main window.
+
+        :param main_window: The main application window.
+        :param parent_frame: Modal parent frame
+        :param addresses: The addresses to display.
+        """
+        frame: QRCodes = QRCodes(parent=main_window, parent_frame=parent_frame)
+
+        header = QFrame()
+        header_layout = QHBoxLayout(header)
+        header_layout.setContentsMargins(0, 0, 0, 0)
+        title = QLabel(f"Addresses ({len(addresses)})")
+        header_layout.addWidget(title)
+        header_layout.addStretch()
+
+        frame.close_button = QPushButton(None)
+        frame.close_button.setIcon(QIcon(resolve_path("src/ui/images/svg/close.svg")))
+        frame.close_button.setIconSize(QSize(12, 12))
+        frame.close_button.clicked.connect(frame.close)
+        frame.close_button.setCursor(QCursor(Qt.PointingHandCursor))
+        header_layout.addWidget(frame.close_button)
+
+        content = QWidget()
+        grid = QGridLayout(content)
+        for index, address in enumerate(addresses):
+            cell = QVBoxLayout()
+            qr_label = QLabel()
+            qr_label.setFixedSize(QSize(QRCodes.SIZE, QRCodes.SIZE))
+            # Rendered in the background, pixmaps already shown are served from the cache
+            put_qr_code(qr_label, address, box_size=4)
+            address_label = QLabel(f"{address[:8]}...{address[-8:]}" if len(address) > 19 else address)
+            address_label.setToolTip(address)
+            address_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            address_label.setAlignment(Qt.AlignCenter)
+            cell.addWidget(qr_label, 0, Qt.AlignCenter)
+            cell.addWidget(address_label)
+            grid.addLayout(cell, index // QRCodes.COLUMNS, index % QRCodes.COLUMNS)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.NoFrame)
+        scroll_area.setWidget(content)
+
+        frame.layout().addWidget(header)
+        frame.layout().addWidget(scroll_area)
+        frame.re_adjust()
+        frame.show()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+#             2024, Abenezer Lulseged Wube <itsm3abena@gmail.com>
+#             2024, Eyoel Tadesse <eyoel_tadesse@proton.me>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import itertools
+
+import pytest
+from hdwallet.exceptions import DerivationError
+
+from src.utils.derivation import (
+    MAX_INDEX, IndexExpression, path_count, traverse
+)
+from src.utils.shard import (
+    parse_shard, shard_bounds
+)
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("5", {5}),
+    ("0-99", set(range(100))),
+    ("0-100:7", set(range(0, 101, 7))),
+    ("0,5,9-20", {0, 5, *range(9, 21)}),
+    ("9-20, 5 ,0", {0, 5, *range(9, 21)}),
+    ("0-99,!50-59", set(range(100)) - set(range(50, 60))),
+    ("0-20,10-30,5", set(range(31))),
+    ("0-1000:3,!0-1000:5", set(range(0, 1001, 3)) - set(range(0, 1001, 5))),
+    ("0-50:4,1-50:6,!10-30:2", (set(range(0, 51, 4)) | set(range(1, 51, 6))) - set(range(10, 31, 2))),
+    ("2^4-2^5", set(range(16, 33))),
+    ("2^31-2^32", {MAX_INDEX}),
+    ("0-9,!0-9", set()),
+])
+def test_index_expression(expression, expected):
+    indexes = IndexExpression(expression)
+
+    assert list(indexes) == sorted(expected)
+    assert len(indexes) == len(expected)
+    assert indexes.first() == (min(expected) if expected else None)
+
+
+@pytest.mark.parametrize("expression", [
+    "sample(0-1000,50)",
+    "sample(0-2^31,1000,7)",
+    "0-99,!sample(0-99,10)",
+    "sample(0-99,30),0-49:2,!sample(0-99,20,3)",
+])
+def test_index_expression_sample(expression):
+    indexes = list(IndexExpression(expression))
+
+    assert indexes == sorted(set(indexes))
+    assert len(IndexExpression(expression)) == len(indexes)
+    assert list(IndexExpression(expression)) == indexes
+
+
+def test_index_expression_sample_seed():
+    sample = list(IndexExpression("sample(0-2^31,100)"))
+
+    assert len(sample) == 100
+    assert all(0 <= index <= MAX_INDEX for index in sample)
+    assert list(IndexExpression("sample(0-2^31,100,1)")) != sample
+
+
+def test_index_expression_count_without_walking():
+    # Multiples of 3 and not of 7, counted arithmetically over the whole index space
+    indexes = IndexExpression("0-2^31:3,!0-2^31:7")
+
+    assert len(indexes) == MAX_INDEX // 3 + 1 - (MAX_INDEX // 21 + 1)
+
+
+@pytest.mark.parametrize("expression", [
+    "", "abc", "5-1", "0-9:0", "sample(0-9,11)", "0-9,,5",
+])
+def test_index_expression_invalid(expression):
+    with pytest.raises(DerivationError):
+        IndexExpression(expression)
+
+
+def test_traverse_start():
+    levels = [
+        ((44,), True),
+        (IndexExpression("0-2,7"), True),
+        (range(3), False),
+        (IndexExpression("1-9:4,!5"), False),
+    ]
+    paths = list(itertools.product(*(
+        [(index, hardened) for index in indexes] for indexes, hardened in levels
+    )))
+
+    assert path_count(levels) == len(paths)
+    for start in range(len(paths) + 2):
+        assert list(traverse(levels, start)) == paths[start:]
+
+
+def test_traverse_empty_level():
+    assert list(traverse([(range(3), False), (IndexExpression("0-9,!0-9"), False)])) == []
+    assert list(traverse([])) == [()]
+    assert list(traverse([], 1)) == []
+
+
+@pytest.mark.parametrize("total", [0, 1, 7, 100, 101])
+@pytest.mark.parametrize("count", range(1, 9))
+def test_shard_bounds(total, count):
+    positions = [
+        position for number in range(1, count + 1)
+        for position in range(*shard_bounds(total, (number, count)))
+    ]
+
+    assert positions == list(range(total))
+    assert shard_bounds(total, None) == (0, total)
+
+
+@pytest.mark.parametrize("text, shard", [
+    ("", None), ("2 of 4", (2, 4)), ("3/3", (3, 3)), (" 1 of 1 ", (1, 1)),
+])
+def test_parse_shard(text, shard):
+    assert parse_shard(text) == shard
+
+
+@pytest.mark.parametrize("text", ["0 of 4", "5 of 4", "two of four", "2-4"])
+def test_parse_shard_invalid(text):
+    with pytest.raises(ValueError):
+        parse_shard(text)